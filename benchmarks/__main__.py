@@ -0,0 +1,72 @@
+"""
+Runs the benchmarks against a local OData server and reports the results:
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json --threshold 0.25
+
+Exits with a non-zero code if a benchmark is slower than in the baseline by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks import bench_batch, bench_import, bench_mapping, bench_metadata, bench_paging, \
+    bench_transfer  # noqa: F401
+from benchmarks.server import LocalODataServer
+from benchmarks.suite import get_benchmarks, get_environment, run_benchmark
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the benchmarks which median time exceeds the baseline by more than the threshold
+
+    :type results: list[dict]
+    :type baseline: dict
+    :param float threshold: Allowed relative slowdown, e.g. 0.25
+    """
+    baseline_results = dict((r["name"], r) for r in baseline["results"])
+    regressions = []
+    for result in results:
+        base = baseline_results.get(result["name"], None)
+        if base is None or not base["median"]:
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            regressions.append((result["name"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Office365 client benchmarks")
+    parser.add_argument("-k", "--filter", help="Only run the benchmarks which names contain the value")
+    parser.add_argument("-o", "--output", help="Path of the JSON file the results are written to")
+    parser.add_argument("--compare", help="Path of the JSON file with the baseline results")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, unit, repeat, func in get_benchmarks(args.filter):
+        with LocalODataServer() as server:
+            result = run_benchmark(server, name, unit, repeat, func)
+        results.append(result)
+        print("{0:<28} {1:>10.4f}s  {2:>14,.0f} {3}/s".format(name, result["median"], result["throughput"] or 0,
+                                                              unit))
+
+    report = {"environment": get_environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, ratio in regressions:
+            print("Regression: {0} is {1:.0%} slower than the baseline".format(name, ratio - 1))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
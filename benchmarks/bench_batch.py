@@ -0,0 +1,88 @@
+import uuid
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from benchmarks import fixtures
+from benchmarks.server import Response
+from benchmarks.suite import benchmark, sharepoint_context, LocalGraphClient
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.odata.v3.batch_request import ODataBatchV3Request
+from office365.runtime.odata.v4.batch_request import ODataV4BatchRequest
+
+batch_size = 100
+
+
+def _to_response(raw):
+    """
+    :type raw: bytes
+    """
+    recorded = Response.parse(raw)
+    response = requests.Response()
+    response.status_code = recorded.status
+    response.headers = CaseInsensitiveDict(recorded.headers)
+    response._content = recorded.body
+    return response
+
+
+def _create_v3_batch(context):
+    """
+    Creates a $batch request of read (GET) and update (change set) queries
+
+    :type context: office365.sharepoint.client_context.ClientContext
+    """
+    context.ensure_form_digest(RequestOptions(context.service_root_url()))
+    for i in range(batch_size):
+        target_list = context.web.lists.get_by_title("List {0}".format(i))
+        if i % 5 == 0:
+            target_list.set_property("Description", "Updated {0}".format(i)).update()
+        else:
+            target_list.get()
+    batch_request = ODataBatchV3Request(context, batch_size)
+    for qry in context.pending_request():
+        batch_request.add_query(qry)
+    return batch_request
+
+
+def _create_v4_batch(client):
+    """
+    :type client: office365.graph_client.GraphClient
+    """
+    for i in range(batch_size):
+        client.users[str(uuid.UUID(int=i))].get()
+    batch_request = ODataV4BatchRequest(client, batch_size)
+    for qry in client.pending_request():
+        batch_request.add_query(qry)
+    return batch_request
+
+
+@benchmark("batch.v3.serialize", "queries")
+def serialize_v3_batch(server):
+    """Serializes a SharePoint $batch request (multipart/mixed)"""
+    batch_request = _create_v3_batch(sharepoint_context(server))
+    return lambda: batch_request.build_request(batch_request.current_query), batch_size
+
+
+@benchmark("batch.v3.parse", "queries")
+def parse_v3_batch(server):
+    """Parses a SharePoint $batch response and maps its parts"""
+    context = sharepoint_context(server)
+    batch_request = _create_v3_batch(context)
+    payloads = [{"d": {"Title": "List {0}".format(i), "Id": str(uuid.UUID(int=i))}} for i in range(batch_size)]
+    response = _to_response(fixtures.batch_v3_response(payloads))
+    return lambda: batch_request.process_response(response), batch_size
+
+
+@benchmark("batch.v4.serialize", "queries")
+def serialize_v4_batch(server):
+    """Serializes a Graph JSON $batch request"""
+    batch_request = _create_v4_batch(LocalGraphClient(server))
+    return lambda: batch_request.build_request(batch_request.current_query), batch_size
+
+
+@benchmark("batch.v4.parse", "queries")
+def parse_v4_batch(server):
+    """Parses a Graph JSON $batch response and maps its parts"""
+    batch_request = _create_v4_batch(LocalGraphClient(server))
+    response = _to_response(fixtures.batch_v4_response([fixtures.user_json(i) for i in range(batch_size)]))
+    return lambda: batch_request.process_response(response), batch_size
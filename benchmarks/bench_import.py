@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import office365
+from benchmarks.suite import benchmark
+
+
+def _import(module_name):
+    """
+    Imports the module in a new interpreter
+
+    :type module_name: str or None
+    """
+    code = "import {0}".format(module_name) if module_name else "pass"
+    env = dict(os.environ)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(office365.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    return lambda: subprocess.check_call([sys.executable, "-c", code], env=env)
+
+
+@benchmark("import.interpreter", "imports")
+def import_nothing(server):
+    """Starts an interpreter without importing the package, the baseline of the import benchmarks"""
+    return _import(None), 1
+
+
+@benchmark("import.sharepoint", "imports")
+def import_sharepoint(server):
+    """Starts an interpreter and imports SharePoint client context"""
+    return _import("office365.sharepoint.client_context"), 1
+
+
+@benchmark("import.graph", "imports")
+def import_graph(server):
+    """Starts an interpreter and imports Graph client"""
+    return _import("office365.graph_client"), 1
+
+
+@benchmark("import.sharepoint.web", "imports")
+def import_sharepoint_web(server):
+    """Starts an interpreter and imports SharePoint web, the entity most requests start from"""
+    return _import("office365.sharepoint.webs.web"), 1
@@ -0,0 +1,35 @@
+from benchmarks import fixtures
+from benchmarks.suite import benchmark, sharepoint_context, LocalGraphClient
+from office365.directory.users.collection import UserCollection
+from office365.runtime.paths.resource_path import ResourcePath
+from office365.sharepoint.listitems.collection import ListItemCollection
+
+list_items_count = 5000
+users_count = 999
+
+
+@benchmark("mapping.list_items", "items")
+def map_list_items(server):
+    """Maps a page of list items (verbose JSON) into ListItemCollection"""
+    context = sharepoint_context(server)
+    target_list = context.web.lists.get_by_title("Bench")
+    payload = fixtures.list_items_page(1, list_items_count)
+
+    def _run():
+        items = ListItemCollection(context, ResourcePath("items", target_list.resource_path))
+        context.pending_request().map_json(payload, items)
+
+    return _run, list_items_count
+
+
+@benchmark("mapping.users", "users")
+def map_users(server):
+    """Maps a page of users (JSON) into UserCollection"""
+    client = LocalGraphClient(server)
+    payload = fixtures.users_page(0, users_count)
+
+    def _run():
+        users = UserCollection(client, ResourcePath("users"))
+        client.pending_request().map_json(payload, users)
+
+    return _run, users_count
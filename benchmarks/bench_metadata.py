@@ -0,0 +1,18 @@
+import os
+
+import office365
+from benchmarks.suite import benchmark
+from office365.runtime.odata.v4.metadata_reader import ODataV4Reader
+
+metadata_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(office365.__file__))),
+                             "generator", "metadata", "MicrosoftGraph.xml")
+
+
+@benchmark("metadata.graph", "documents")
+def read_graph_metadata(server):
+    """Reads complex and entity types of Microsoft Graph $metadata (about 2 MB) as the model generator does"""
+
+    def _run():
+        ODataV4Reader(metadata_path).generate_model(True)
+
+    return _run, 1
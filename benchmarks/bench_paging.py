@@ -0,0 +1,57 @@
+from benchmarks import fixtures
+from benchmarks.suite import benchmark, sharepoint_context, LocalGraphClient
+
+page_size = 1000
+pages_count = 10
+
+
+def _page_start(match):
+    """
+    :type match: re.Match
+    """
+    return int(match.group(1) or 0)
+
+
+@benchmark("paging.list_items", "items")
+def iterate_list_items(server):
+    """Retrieves all the list items page by page (following __next) from the local server"""
+    total = page_size * pages_count
+
+    def _get_page(match, headers, body):
+        start = _page_start(match)
+        next_url = None
+        if start + page_size < total:
+            next_url = "{0}/sites/bench/_api/Web/lists/GetByTitle('Bench')/items?$skiptoken={1}".format(
+                server.url, start + page_size)
+        return fixtures.json_response(fixtures.list_items_page(start + 1, page_size, next_url))
+
+    server.route("GET", r"/sites/bench/_api/Web/lists/GetByTitle\('Bench'\)/items(?:\?.*skiptoken=(\d+))?", _get_page)
+    context = sharepoint_context(server)
+
+    def _run():
+        items = context.web.lists.get_by_title("Bench").items.get_all(page_size).execute_query()
+        assert len(items) == total
+
+    return _run, total
+
+
+@benchmark("paging.users", "users")
+def iterate_users(server):
+    """Retrieves all the users page by page (following @odata.nextLink) from the local server"""
+    total = page_size * pages_count
+
+    def _get_page(match, headers, body):
+        start = _page_start(match)
+        next_url = None
+        if start + page_size < total:
+            next_url = "{0}/v1.0/users?$skiptoken={1}".format(server.url, start + page_size)
+        return fixtures.json_response(fixtures.users_page(start, page_size, next_url), False)
+
+    server.route("GET", r"^/v1\.0/users(?:\?.*skiptoken=(\d+))?", _get_page)
+    client = LocalGraphClient(server)
+
+    def _run():
+        users = client.users.get_all(page_size).execute_query()
+        assert len(users) == total
+
+    return _run, total
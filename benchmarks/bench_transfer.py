@@ -0,0 +1,78 @@
+import io
+import json
+import os
+import tempfile
+
+from benchmarks.server import Response
+from benchmarks.suite import benchmark, sharepoint_context
+
+file_size = 16 * 1024 * 1024
+chunk_size = 2 * 1024 * 1024
+file_url = "/sites/bench/Shared Documents/bench.bin"
+
+
+def _verbose(payload):
+    """
+    :type payload: dict
+    """
+    return Response(200, json.dumps({"d": payload}).encode("utf-8"),
+                    {"Content-Type": "application/json;odata=verbose"})
+
+
+def _file_json(length):
+    """
+    :type length: int
+    """
+    return {"__metadata": {"type": "SP.File"}, "Name": "bench.bin", "ServerRelativeUrl": file_url,
+            "ServerRelativePath": {"DecodedUrl": file_url}, "Length": str(length)}
+
+
+@benchmark("transfer.upload_chunked", "bytes", repeat=3)
+def upload_chunked(server):
+    """Uploads a file in chunks (StartUpload/ContinueUpload/FinishUpload) to the local server"""
+    sessions = {}
+
+    def _add_file(match, headers, body):
+        return _verbose(_file_json(0))
+
+    def _upload_chunk(match, headers, body):
+        operation, upload_id = match.group(1).lower(), match.group(2)
+        uploaded = sessions.get(upload_id, 0) + len(body)
+        sessions[upload_id] = uploaded
+        if operation == "finishupload":
+            return _verbose(_file_json(uploaded))
+        return _verbose({match.group(1): str(uploaded)})
+
+    server.route("POST", r"(?i)/Files/add\(", _add_file)
+    server.route("POST", r"(?i)/(startUpload|continueUpload|finishUpload)\(uploadID='([^']*)'", _upload_chunk)
+
+    source_path = os.path.join(tempfile.mkdtemp(), "bench.bin")
+    with open(source_path, "wb") as f:
+        f.write(os.urandom(file_size))
+    context = sharepoint_context(server)
+    folder = context.web.get_folder_by_server_relative_path("/sites/bench/Shared Documents")
+
+    def _run():
+        uploaded_file = folder.files.create_upload_session(source_path, chunk_size).execute_query()
+        assert uploaded_file.length == file_size
+
+    return _run, file_size
+
+
+@benchmark("transfer.download_chunked", "bytes", repeat=3)
+def download_chunked(server):
+    """Downloads a file as a stream (in chunks) from the local server"""
+    content = os.urandom(file_size)
+    server.route("GET", r"(?i)/getFileByServerRelativePath\([^)]*\)/\$value$",
+                 lambda match, headers, body: Response(200, content, {"Content-Type": "application/octet-stream"}))
+    server.route("GET", r"(?i)/getFileByServerRelativePath\([^)]*\)(?:\?.*)?$",
+                 lambda match, headers, body: _verbose(_file_json(file_size)))
+    context = sharepoint_context(server)
+
+    def _run():
+        target = io.BytesIO()
+        context.web.get_file_by_server_relative_path(file_url).download_session(target, chunk_size=chunk_size)
+        context.execute_query()
+        assert target.tell() == file_size
+
+    return _run, file_size
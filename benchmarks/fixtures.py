@@ -0,0 +1,110 @@
+import json
+import uuid
+
+from benchmarks.server import Response
+
+
+def list_item_json(item_id):
+    """
+    :type item_id: int
+    """
+    return {
+        "__metadata": {"id": "Web/Lists(guid'{0}')/Items({1})".format(uuid.UUID(int=1), item_id),
+                       "type": "SP.Data.BenchListItem"},
+        "Id": item_id,
+        "ID": item_id,
+        "Title": "Item {0}".format(item_id),
+        "FileSystemObjectType": 0,
+        "ContentTypeId": "0x0100A33D9AD9805788419BDAAC2CCB37509F",
+        "Created": "2023-01-01T00:00:00Z",
+        "Modified": "2023-01-02T00:00:00Z",
+        "AuthorId": 7,
+        "EditorId": 7,
+        "GUID": str(uuid.UUID(int=item_id)),
+        "Status": "Active",
+        "Amount": item_id * 1.5,
+    }
+
+
+def list_items_page(start_id, count, next_url=None):
+    """
+    Verbose JSON (OData v3) page of list items
+
+    :type start_id: int
+    :type count: int
+    :type next_url: str or None
+    """
+    result = {"results": [list_item_json(i) for i in range(start_id, start_id + count)]}
+    if next_url:
+        result["__next"] = next_url
+    return {"d": result}
+
+
+def user_json(index):
+    """
+    :type index: int
+    """
+    return {
+        "id": str(uuid.UUID(int=index)),
+        "displayName": "User {0}".format(index),
+        "givenName": "User",
+        "surname": str(index),
+        "mail": "user{0}@contoso.com".format(index),
+        "userPrincipalName": "user{0}@contoso.com".format(index),
+        "jobTitle": "Engineer",
+        "businessPhones": ["+1 555 0100"],
+        "accountEnabled": True,
+    }
+
+
+def users_page(start, count, next_url=None):
+    """
+    JSON (OData v4) page of users
+
+    :type start: int
+    :type count: int
+    :type next_url: str or None
+    """
+    result = {"@odata.context": "https://graph.microsoft.com/v1.0/$metadata#users",
+              "value": [user_json(i) for i in range(start, start + count)]}
+    if next_url:
+        result["@odata.nextLink"] = next_url
+    return result
+
+
+def json_response(payload, verbose=True):
+    """
+    :type payload: dict
+    :param bool verbose: OData v3 verbose (SharePoint) or v4 (Graph) content type
+    """
+    content_type = "application/json;odata=verbose" if verbose else "application/json;odata.metadata=minimal"
+    return Response(200, json.dumps(payload).encode("utf-8"), {"Content-Type": content_type})
+
+
+def batch_v3_response(payloads, boundary="batchresponse_bench"):
+    """
+    Raw multipart/mixed response of a SharePoint $batch request
+
+    :type payloads: list[dict]
+    :type boundary: str
+    """
+    parts = []
+    for payload in payloads:
+        parts.append("--{0}\r\nContent-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+                     "HTTP/1.1 200 OK\r\nCONTENT-TYPE: application/json;odata=verbose;charset=utf-8\r\n\r\n"
+                     "{1}\r\n".format(boundary, json.dumps(payload)))
+    body = "".join(parts) + "--{0}--\r\n".format(boundary)
+    return ("HTTP/1.1 200 OK\r\nContent-Type: multipart/mixed; boundary={0}\r\n\r\n{1}".format(
+        boundary, body)).encode("utf-8")
+
+
+def batch_v4_response(payloads):
+    """
+    Raw JSON response of a Graph $batch request
+
+    :type payloads: list[dict]
+    """
+    body = json.dumps({"responses": [{"id": str(i), "status": 200,
+                                      "headers": {"Content-Type": "application/json"}, "body": payload}
+                                     for i, payload in enumerate(payloads)]})
+    return ("HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n" + body).encode("utf-8")
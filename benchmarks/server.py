@@ -0,0 +1,137 @@
+import re
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+class Response(object):
+    """HTTP response served by the local server"""
+
+    def __init__(self, status=200, body=b"", headers=None):
+        """
+        :type status: int
+        :type body: bytes
+        :type headers: dict or None
+        """
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    @staticmethod
+    def parse(raw):
+        """
+        Parses a recorded raw HTTP response (status line, headers, empty line, body)
+
+        :type raw: bytes
+        """
+        head, _, body = raw.partition(b"\r\n\r\n")
+        lines = head.decode("utf-8").split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        headers = dict(line.split(":", 1) for line in lines[1:] if line)
+        return Response(status, body, dict((k.strip(), v.strip()) for k, v in headers.items()))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        body = self.rfile.read(length) if length else b""
+        response = self.server.owner.dispatch(self.command, self.path, self.headers, body)
+        self.send_response(response.status)
+        headers = dict(response.headers)
+        headers["Content-Length"] = str(len(response.body))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class LocalODataServer(object):
+    """
+    Local stand-in of SharePoint/Graph OData services, serves responses of registered routes over HTTP
+    so that the whole client pipeline (including the network stack) is exercised without a tenant.
+
+    Routes are matched in the order they were registered against the method and the path (including
+    the query string), responses are either produced by handlers or replayed from recorded fixtures.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self._routes = []
+        self._server = _ThreadingServer((host, port), _Handler)
+        self._server.owner = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{0}:{1}".format(host, port)
+
+    def route(self, method, pattern, handler):
+        """
+        :param str method: HTTP method
+        :param str pattern: Regular expression the path is searched with
+        :param (re.Match, dict, bytes) -> Response handler: Produces a response from the match, headers and body
+        """
+        self._routes.append((method, re.compile(pattern), handler))
+        return self
+
+    def replay(self, method, pattern, raw_response):
+        """
+        Serves a recorded raw HTTP response (e.g. JSON or multipart $batch response)
+
+        :param str method: HTTP method
+        :param str pattern: Regular expression the path is searched with
+        :param bytes raw_response: Recorded response, see Response.parse
+        """
+        response = Response.parse(raw_response)
+        return self.route(method, pattern, lambda match, headers, body: response)
+
+    def replay_file(self, method, pattern, path):
+        """
+        :param str method: HTTP method
+        :param str pattern: Regular expression the path is searched with
+        :param str path: Path of the recorded response
+        """
+        with open(path, "rb") as f:
+            return self.replay(method, pattern, f.read())
+
+    def dispatch(self, method, path, headers, body):
+        for route_method, pattern, handler in self._routes:
+            if route_method != method:
+                continue
+            match = pattern.search(path)
+            if match:
+                return handler(match, headers, body)
+        return Response(404, b'{"error": {"code": "NotFound", "message": {"value": "No route"}}}',
+                        {"Content-Type": "application/json"})
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
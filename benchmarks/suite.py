@@ -0,0 +1,103 @@
+import json
+import platform
+import sys
+import timeit
+
+from benchmarks.server import Response
+
+from office365.graph_client import GraphClient
+from office365.runtime.auth.token_response import TokenResponse
+from office365.sharepoint.client_context import ClientContext
+
+_benchmarks = []
+
+
+def benchmark(name, unit, repeat=5):
+    """
+    Registers a benchmark, the decorated function accepts a server, prepares the benchmark and
+    returns (run, units) where run is a function to time and units is the amount of work it performs
+
+    :param str name: Benchmark name, dot separated
+    :param str unit: Unit of the work, e.g. items or bytes
+    :param int repeat: Number of times the benchmark is run
+    """
+
+    def _register(func):
+        _benchmarks.append((name, unit, repeat, func))
+        return func
+
+    return _register
+
+
+def get_benchmarks(name_filter=None):
+    """
+    :param str or None name_filter: Only the benchmarks which names contain the value are returned
+    """
+    return [b for b in _benchmarks if name_filter is None or name_filter in b[0]]
+
+
+def run_benchmark(server, name, unit, repeat, func):
+    """
+    Runs a benchmark and returns its result (timings in seconds)
+
+    :type server: benchmarks.server.LocalODataServer
+    :rtype: dict
+    """
+    run, units = func(server)
+    run()  # warm up
+    timings = []
+    for _ in range(repeat):
+        started = timeit.default_timer()
+        run()
+        timings.append(timeit.default_timer() - started)
+    timings.sort()
+    median = timings[len(timings) // 2]
+    return {
+        "name": name,
+        "unit": unit,
+        "units": units,
+        "repeat": repeat,
+        "min": timings[0],
+        "median": median,
+        "mean": sum(timings) / len(timings),
+        "throughput": units / median if median > 0 else None,
+    }
+
+
+def get_environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "executable": sys.executable,
+    }
+
+
+def _get_context_info(match, headers, body):
+    payload = {"d": {"GetContextWebInformation": {"FormDigestValue": "digest", "FormDigestTimeoutSeconds": 1800}}}
+    return Response(200, json.dumps(payload).encode("utf-8"), {"Content-Type": "application/json;odata=verbose"})
+
+
+def sharepoint_context(server, site_path="/sites/bench"):
+    """
+    Creates a SharePoint client context bound to the local server, the form digest is served by the server
+
+    :type server: benchmarks.server.LocalODataServer
+    :type site_path: str
+    """
+    server.route("POST", r"(?i)/_api/contextinfo$", _get_context_info)
+    return ClientContext(server.url + site_path).with_access_token(lambda: TokenResponse("token", "Bearer"))
+
+
+class LocalGraphClient(GraphClient):
+    """Graph client bound to the local server"""
+
+    def __init__(self, server):
+        """
+        :type server: benchmarks.server.LocalODataServer
+        """
+        super(LocalGraphClient, self).__init__(lambda: {"access_token": "token", "token_type": "Bearer"})
+        self._service_root_url = server.url + "/v1.0"
+
+    def service_root_url(self):
+        return self._service_root_url
@@ -0,0 +1,37 @@
+import json
+import os
+
+from examples import acquire_token_by_username_password
+from office365.graph_client import GraphClient
+
+client = GraphClient(acquire_token_by_username_password)
+
+folder_item = client.me.drive.root.get_by_path("archive")
+local_path = "../../tests/data/big_buck_bunny.mp4"
+state_path = local_path + ".upload.json"
+
+
+def save_session(session):
+    """
+    :type session: office365.runtime.odata.v4.upload_session.UploadSession
+    """
+    with open(state_path, "w") as f:
+        json.dump(session.to_json(), f)
+
+
+def print_progress(range_pos):
+    print("{0} bytes uploaded".format(range_pos))
+
+
+if os.path.exists(state_path):
+    # resume the upload from the persisted session, only the missing ranges are sent
+    with open(state_path) as f:
+        upload_url = json.load(f)["uploadUrl"]
+    file_item = folder_item.resume_upload(local_path, upload_url, chunk_uploaded=print_progress,
+                                          session_updated=save_session)
+else:
+    file_item = folder_item.resumable_upload(local_path, chunk_uploaded=print_progress,
+                                             session_updated=save_session)
+file_item.get().execute_query()
+os.remove(state_path)
+print(f"File {file_item.web_url} has been uploaded")
@@ -0,0 +1,24 @@
+"""
+Downloads a drive folder into a local directory, files are compared by quickXorHash
+"""
+import tempfile
+
+from examples import acquire_token_by_username_password
+from office365.graph_client import GraphClient
+from office365.onedrive.driveitems.transfer_manager import DriveItemTransferManager
+
+client = GraphClient(acquire_token_by_username_password)
+source_folder = client.me.drive.root.get_by_path("archive")
+
+
+def print_progress(progress):
+    """
+    :type progress: office365.runtime.transfers.progress.TransferProgress
+    """
+    print(progress)
+
+
+manager = DriveItemTransferManager(client, max_workers=8, compare_hash=True, progress_changed=print_progress)
+with tempfile.TemporaryDirectory() as local_path:
+    result = manager.download(source_folder, local_path)
+    print("{0} files downloaded, {1} skipped".format(result.transferred_files, result.skipped_files))
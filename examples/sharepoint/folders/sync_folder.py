@@ -0,0 +1,22 @@
+"""
+Uploads a local directory tree into a library folder, unchanged files are skipped
+"""
+from office365.sharepoint.client_context import ClientContext
+from office365.sharepoint.folders.transfer_manager import FolderTransferManager
+from tests import test_team_site_url, test_client_credentials
+
+ctx = ClientContext(test_team_site_url).with_credentials(test_client_credentials)
+target_folder = ctx.web.get_folder_by_server_relative_url("Shared Documents/Archive")
+
+
+def print_progress(progress):
+    """
+    :type progress: office365.runtime.transfers.progress.TransferProgress
+    """
+    print(progress)
+
+
+manager = FolderTransferManager(ctx, max_workers=8, progress_changed=print_progress)
+result = manager.upload("../../data", target_folder)
+for path, error in result.errors.items():
+    print("Failed to upload {0}: {1}".format(path, error))
@@ -0,0 +1,81 @@
+import importlib
+import os
+import pkgutil
+
+import office365
+from office365.entity import Entity
+from office365.sharepoint.base_entity import BaseEntity
+
+output_path = os.path.join(os.path.dirname(os.path.abspath(office365.__file__)), "entity_type_map.py")
+
+
+def import_modules():
+    """Imports all the modules of the package, the ones with missing optional dependencies are skipped"""
+    for module_info in pkgutil.walk_packages(office365.__path__, office365.__name__ + "."):
+        try:
+            importlib.import_module(module_info[1])
+        except (ImportError, SyntaxError):
+            pass
+
+
+def get_subclasses(base_type):
+    result = set()
+    pending = [base_type]
+    while pending:
+        cls = pending.pop()
+        for subclass in cls.__subclasses__():
+            if subclass not in result:
+                result.add(subclass)
+                pending.append(subclass)
+    return result
+
+
+def get_entity_type_name(cls):
+    """
+    Returns the server type name of the entity class without creating the entity
+
+    :type cls: type
+    """
+    client_object = cls.__new__(cls)
+    client_object._entity_type_name = None
+    try:
+        return cls.entity_type_name.fget(client_object)
+    except (AttributeError, TypeError):
+        return None
+
+
+def build_type_map():
+    """
+    Maps server type names to the paths of the entity classes, a class which name matches the type name
+    is preferred if several classes share it
+    """
+    type_map = {}
+    classes = get_subclasses(Entity) | get_subclasses(BaseEntity)
+    for cls in sorted(classes, key=lambda c: (c.__module__, c.__name__)):
+        type_name = get_entity_type_name(cls)
+        if not type_name or not cls.__module__.startswith("office365."):
+            continue
+        path = ":".join([cls.__module__, cls.__name__])
+        if type_name.rpartition(".")[2].lower() == cls.__name__.lower():
+            type_map[type_name] = path
+        else:
+            type_map.setdefault(type_name, path)
+    return type_map
+
+
+def save_type_map(type_map):
+    with open(output_path, "w") as f:
+        f.write('"""Maps server type names to the entity classes, generated by generator/generate_type_map.py"""\n\n')
+        f.write("entity_type_map = {\n")
+        for type_name in sorted(type_map):
+            line = '    "{0}": "{1}",\n'.format(type_name, type_map[type_name])
+            if len(line) > 121:
+                noqa = "  # noqa: E501" if len(type_map[type_name]) > 110 else ""
+                line = '    "{0}":\n        "{1}",{2}\n'.format(type_name, type_map[type_name], noqa)
+            f.write(line)
+        f.write("}\n")
+
+
+if __name__ == '__main__':
+    import_modules()
+    save_type_map(build_type_map())
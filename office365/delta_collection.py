@@ -1,3 +1,4 @@
+from office365.delta_sync import DeltaSync
 from office365.entity_collection import EntityCollection
 from office365.runtime.paths.resource_path import ResourcePath
 
@@ -12,3 +13,24 @@ class DeltaCollection(EntityCollection):
         return self.properties.get('delta',
                                    DeltaCollection(self.context, self._item_type,
                                                    ResourcePath("delta", self.resource_path)))
+
+    @property
+    def delta_link(self):
+        """
+        The link to request changes since the last page of the delta query was returned
+
+        :rtype: str or None
+        """
+        return self._delta_request_url
+
+    def track_changes(self, state_store=None, scope=None, resync_required=None):
+        """
+        Tracks newly created, updated, or deleted entities (changes) via delta query, the delta link is kept
+        in the state store between the runs
+
+        :param office365.runtime.state_store.StateStore state_store: Keeps the delta link
+        :param str scope: Key of the delta link in the store
+        :param () -> None resync_required: Invoked when the delta link has expired
+        :rtype: DeltaSync
+        """
+        return DeltaSync(self.delta, state_store, scope, resync_required)
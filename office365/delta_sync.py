@@ -0,0 +1,112 @@
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.state_store import StateStore
+
+
+class DeltaSync(object):
+    """
+    Incremental synchronization of a collection via delta query.
+
+    Pages are requested following @odata.nextLink until @odata.deltaLink is returned, the delta link is stored once
+    all the pages have been consumed and used as a starting point for the next run. Removed entities are returned
+    as well (see is_removed). Once the delta link expires (410 Gone), a full synchronization is started over.
+    """
+
+    def __init__(self, collection, state_store=None, scope=None, resync_required=None):
+        """
+        :param office365.delta_collection.DeltaCollection collection: Delta collection, e.g. client.users.delta
+        :param StateStore or None state_store: Keeps the delta link per scope, in memory if omitted
+        :param str or None scope: Key of the delta link in the store, the url of the collection by default
+        :param () -> None resync_required: Invoked when the delta link has expired and the full set of entities
+            is about to be returned again
+        """
+        self._collection = collection
+        self.state_store = state_store or StateStore()
+        self._scope = scope
+        self._resync_required = resync_required
+
+    @property
+    def scope(self):
+        """
+        :rtype: str
+        """
+        return self._scope or self._collection.resource_url
+
+    @property
+    def delta_link(self):
+        """
+        The delta link of the last completed synchronization
+
+        :rtype: str or None
+        """
+        return self.state_store.get(self.scope)
+
+    def __iter__(self):
+        for page in self.pages():
+            for entity in page:
+                yield entity
+
+    def sync(self, callback):
+        """
+        Hands changed entities to the callback page by page
+
+        :param (list[office365.entity.Entity])->None callback: Invoked per page of changes
+        :return: Number of changed entities
+        :rtype: int
+        """
+        count = 0
+        for page in self.pages():
+            callback(page)
+            count += len(page)
+        return count
+
+    def pages(self):
+        """
+        Yields pages of changed entities, the delta link is stored after the last page
+
+        :rtype: collections.Iterable[list[office365.entity.Entity]]
+        """
+        url = self.delta_link
+        while True:
+            try:
+                collection = self._get_page(url)
+            except ClientRequestException as e:
+                if url is None or e.response.status_code != 410:
+                    raise
+                self._collection.context.clear()
+                if callable(self._resync_required):
+                    self._resync_required()
+                url = e.response.headers.get("Location", None)
+                continue
+            yield [entity for entity in collection]
+            if collection.has_next:
+                url = collection._next_request_url
+            else:
+                if collection.delta_link:
+                    self.state_store.set(self.scope, collection.delta_link)
+                return
+
+    @staticmethod
+    def is_removed(entity):
+        """
+        Determines whether the entity was removed, either marked with @removed annotation (directory objects)
+        or deleted facet (drive items)
+
+        :type entity: office365.entity.Entity
+        """
+        return "@removed" in entity.properties or "deleted" in entity.properties
+
+    def _get_page(self, url):
+        """
+        :param str or None url: Next or delta link, the initial request is submitted if omitted
+        """
+
+        def _construct_request(request):
+            """
+            :type request: office365.runtime.http.request_options.RequestOptions
+            """
+            request.url = url
+
+        context = self._collection.context
+        context.load(self._collection, before_loaded=_construct_request if url is not None else None)
+        context.execute_query()
+        return self._collection
@@ -0,0 +1,425 @@
+"""Maps server type names to the entity classes, generated by generator/generate_type_map.py"""
+
+entity_type_map = {
+    "Microsoft.Office.Server.ReputationModel.Reputation": "office365.sharepoint.reputationmodel.reputation:Reputation",
+    "Microsoft.Office.Server.Search.REST.SearchSetting": "office365.sharepoint.search.setting:SearchSetting",
+    "Microsoft.Online.SharePoint.TenantAdministration.SiteProperties":
+        "office365.sharepoint.tenant.administration.site_properties:SiteProperties",
+    "Microsoft.Online.SharePoint.TenantAdministration.Tenant":
+        "office365.sharepoint.tenant.administration.tenant:Tenant",
+    "Microsoft.Online.SharePoint.TenantAdministration.TenantAdminEndpoints":
+        "office365.sharepoint.tenant.administration.endpoints:TenantAdminEndpoints",
+    "Microsoft.Online.SharePoint.TenantAdministration.TenantAdminSettingsService":
+        "office365.sharepoint.tenant.administration.settings_service:TenantAdminSettingsService",
+    "Microsoft.SharePoint.Administration.SPWebApplication":
+        "office365.sharepoint.administration.web_application:WebApplication",
+    "Microsoft.SharePoint.Administration.SPWebService": "office365.sharepoint.administration.web_service:SPWebService",
+    "Microsoft.SharePoint.Client.Search.Administration.DocumentCrawlLog":
+        "office365.sharepoint.search.administration.document_crawl_log:DocumentCrawlLog",
+    "Microsoft.SharePoint.Navigation.REST.NavigationServiceRest":
+        "office365.sharepoint.navigation.navigation_service:NavigationService",
+    "Microsoft.SharePoint.Portal.GroupService": "office365.sharepoint.portal.group_service:GroupService",
+    "Microsoft.SharePoint.Portal.SiteIconManager": "office365.sharepoint.portal.site_icon_manager:SiteIconManager",
+    "Microsoft.SharePoint.Portal.SiteLinkingManager":
+        "office365.sharepoint.portal.site_linking_manager:SiteLinkingManager",
+    "Microsoft.SharePoint.Utilities.WebTemplateExtensions.SiteScriptUtility":
+        "office365.sharepoint.sitescripts.utility:SiteScriptUtility",
+    "Microsoft.SharePoint.Webhooks.Subscription": "office365.sharepoint.webhooks.subscription:Subscription",
+    "SP.AbstractFile": "office365.sharepoint.files.file:AbstractFile",
+    "SP.Alert": "office365.sharepoint.alerts.alert:Alert",
+    "SP.Analytics.AnalyticsUsageEntry": "office365.sharepoint.analytics.usage_entry:AnalyticsUsageEntry",
+    "SP.AppPrincipalCredential": "office365.sharepoint.principal.appprincipal_credential:AppPrincipalCredential",
+    "SP.AppPrincipalIdentityProvider":
+        "office365.sharepoint.principal.appprincipal_identity_provider:AppPrincipalIdentityProvider",
+    "SP.Attachment": "office365.sharepoint.attachments.attachment:Attachment",
+    "SP.Audit": "office365.sharepoint.audit.audit:Audit",
+    "SP.Change": "office365.sharepoint.changes.change:Change",
+    "SP.ChangeAlert": "office365.sharepoint.changes.alert:ChangeAlert",
+    "SP.ChangeContentType": "office365.sharepoint.changes.content_type:ChangeContentType",
+    "SP.ChangeField": "office365.sharepoint.changes.field:ChangeField",
+    "SP.ChangeFile": "office365.sharepoint.changes.file:ChangeFile",
+    "SP.ChangeFolder": "office365.sharepoint.changes.folder:ChangeFolder",
+    "SP.ChangeGroup": "office365.sharepoint.changes.group:ChangeGroup",
+    "SP.ChangeItem": "office365.sharepoint.changes.item:ChangeItem",
+    "SP.ChangeList": "office365.sharepoint.changes.list:ChangeList",
+    "SP.ChangeUser": "office365.sharepoint.changes.user:ChangeUser",
+    "SP.ChangeWeb": "office365.sharepoint.changes.web:ChangeWeb",
+    "SP.CheckedOutFile": "office365.sharepoint.files.checked_out_file:CheckedOutFile",
+    "SP.ClientWebPart": "office365.sharepoint.webparts.client.webpart:ClientWebPart",
+    "SP.Comment": "office365.sharepoint.comments.comment:Comment",
+    "SP.ContentType": "office365.sharepoint.contenttypes.content_type:ContentType",
+    "SP.CorporateCatalogAppMetadata": "office365.sharepoint.marketplace.app_metadata:CorporateCatalogAppMetadata",
+    "SP.CreatablesInfo": "office365.sharepoint.lists.creatables_info:CreatablesInfo",
+    "SP.CurrencyList": "office365.sharepoint.lists.currency:CurrencyList",
+    "SP.DesignPackageMenuContents":
+        "office365.sharepoint.sitedesigns.design_package_menu_contents:DesignPackageMenuContents",
+    "SP.Directory.DirectorySession": "office365.sharepoint.directory.directory_session:DirectorySession",
+    "SP.Directory.SPHelper": "office365.sharepoint.directory.SPHelper:SPHelper",
+    "SP.DlpPolicyTip": "office365.sharepoint.policy.dlp_policy_tip:DlpPolicyTip",
+    "SP.DocumentManagement.DocumentId": "office365.sharepoint.documentmanagement.document_id:DocumentId",
+    "SP.DocumentSet": "office365.sharepoint.documentmanagement.document_set:DocumentSet",
+    "SP.EffectiveInformationRightsManagementSettings":
+        "office365.sharepoint.permissions.irm.effective_settings:EffectiveInformationRightsManagementSettings",
+    "SP.EmbedDataV1": "office365.sharepoint.publishing.embed_data_v1:EmbedDataV1",
+    "SP.EventReceiverDefinition": "office365.sharepoint.eventreceivers.definition:EventReceiverDefinition",
+    "SP.Feature": "office365.sharepoint.features.feature:Feature",
+    "SP.FeatureDefinition": "office365.sharepoint.features.definition:FeatureDefinition",
+    "SP.Field": "office365.sharepoint.fields.field:Field",
+    "SP.FieldCalculated": "office365.sharepoint.fields.calculated:FieldCalculated",
+    "SP.FieldChoice": "office365.sharepoint.fields.choice:FieldChoice",
+    "SP.FieldComputed": "office365.sharepoint.fields.computed:FieldComputed",
+    "SP.FieldCurrency": "office365.sharepoint.fields.currency:FieldCurrency",
+    "SP.FieldDateTime": "office365.sharepoint.fields.date_time:FieldDateTime",
+    "SP.FieldGeolocation": "office365.sharepoint.fields.geolocation:FieldGeolocation",
+    "SP.FieldGuid": "office365.sharepoint.fields.guid:FieldGuid",
+    "SP.FieldLink": "office365.sharepoint.contenttypes.field_link:FieldLink",
+    "SP.FieldLookup": "office365.sharepoint.fields.lookup:FieldLookup",
+    "SP.FieldMultiChoice": "office365.sharepoint.fields.multi_choice:FieldMultiChoice",
+    "SP.FieldMultiLineText": "office365.sharepoint.fields.multi_line_text:FieldMultiLineText",
+    "SP.FieldNumber": "office365.sharepoint.fields.number:FieldNumber",
+    "SP.FieldRatingScale": "office365.sharepoint.fields.rating_scale:FieldRatingScale",
+    "SP.FieldText": "office365.sharepoint.fields.text:FieldText",
+    "SP.FieldThumbnail": "office365.sharepoint.fields.thumbnail:FieldThumbnail",
+    "SP.FieldUrl": "office365.sharepoint.fields.url:FieldUrl",
+    "SP.FieldUser": "office365.sharepoint.fields.user:FieldUser",
+    "SP.File": "office365.sharepoint.files.file:File",
+    "SP.FileVersion": "office365.sharepoint.files.version:FileVersion",
+    "SP.FileVersionEvent": "office365.sharepoint.files.version_event:FileVersionEvent",
+    "SP.FlowSynchronizationResult": "office365.sharepoint.flows.synchronization_result:FlowSynchronizationResult",
+    "SP.Folder": "office365.sharepoint.folders.folder:Folder",
+    "SP.Form": "office365.sharepoint.forms.form:Form",
+    "SP.GetExternalUsersResults": "office365.sharepoint.tenant.management.users_results:GetExternalUsersResults",
+    "SP.Group": "office365.sharepoint.principal.group:Group",
+    "SP.GroupAndUserStatus": "office365.sharepoint.directory.group_and_user_status:GroupAndUserStatus",
+    "SP.HubSite": "office365.sharepoint.tenant.administration.hub_site:HubSite",
+    "SP.HubSiteProperties": "office365.sharepoint.tenant.administration.hubsite_properties:HubSiteProperties",
+    "SP.InformationRightsManagementFileSettings":
+        "office365.sharepoint.permissions.irm.file_settings:InformationRightsManagementFileSettings",
+    "SP.InformationRightsManagementSettings":
+        "office365.sharepoint.permissions.irm.settings:InformationRightsManagementSettings",
+    "SP.LanguageCollection": "office365.sharepoint.sites.language_collection:LanguageCollection",
+    "SP.LikedByInformation": "office365.sharepoint.likes.liked_by_information:LikedByInformation",
+    "SP.List": "office365.sharepoint.lists.list:List",
+    "SP.ListBloomFilter": "office365.sharepoint.listitems.list_bloom_filter:ListBloomFilter",
+    "SP.ListItem": "office365.sharepoint.listitems.listitem:ListItem",
+    "SP.ListItemVersion": "office365.sharepoint.listitems.version:ListItemVersion",
+    "SP.ListTemplate": "office365.sharepoint.lists.template:ListTemplate",
+    "SP.LogExport": "office365.sharepoint.logger.log_export:LogExport",
+    "SP.LogFileInfo": "office365.sharepoint.logger.logFileInfo:LogFileInfo",
+    "SP.MembersInfo": "office365.sharepoint.directory.members_info:MembersInfo",
+    "SP.MicroService.MicroServiceManager": "office365.sharepoint.microservice.manager:MicroServiceManager",
+    "SP.Microfeed.MicrofeedData": "office365.sharepoint.microfeed.data:MicrofeedData",
+    "SP.MicrofeedAttachmentStore": "office365.sharepoint.microfeed.attachment_store:MicrofeedAttachmentStore",
+    "SP.MicrofeedManager": "office365.sharepoint.microfeed.manager:MicrofeedManager",
+    "SP.MoveCopyUtil": "office365.sharepoint.utilities.move_copy_util:MoveCopyUtil",
+    "SP.MultilingualSettings": "office365.sharepoint.webs.multilingual_settings:MultilingualSettings",
+    "SP.MySiteLinks": "office365.sharepoint.userprofiles.my_site_links:MySiteLinks",
+    "SP.Navigation": "office365.sharepoint.navigation.navigation:Navigation",
+    "SP.NavigationNode": "office365.sharepoint.navigation.node:NavigationNode",
+    "SP.OAuth.NativeClient": "office365.sharepoint.oauth.native_client:NativeClient",
+    "SP.ObjectSharingInformation": "office365.sharepoint.sharing.object_sharing_information:ObjectSharingInformation",
+    "SP.ObjectSharingInformationUser":
+        "office365.sharepoint.sharing.object_sharing_information_user:ObjectSharingInformationUser",
+    "SP.ObjectSharingSettings": "office365.sharepoint.sharing.object_sharing_settings:ObjectSharingSettings",
+    "SP.Office365Tenant": "office365.sharepoint.tenant.management.office365_tenant:Office365Tenant",
+    "SP.PageInstrumentation.ClickManager": "office365.sharepoint.pageinstrumentation.click_manager:ClickManager",
+    "SP.PersonProperties": "office365.sharepoint.userprofiles.person_properties:PersonProperties",
+    "SP.PickerSettings": "office365.sharepoint.sharing.picker_settings:PickerSettings",
+    "SP.PolicyEvaluationInfo": "office365.sharepoint.policy.evaluation_info:PolicyEvaluationInfo",
+    "SP.PrimaryCityTime": "office365.sharepoint.publishing.primary_city_time:PrimaryCityTime",
+    "SP.Principal": "office365.sharepoint.principal.principal:Principal",
+    "SP.Publishing.CommunicationSite": "office365.sharepoint.publishing.sites.communication.site:CommunicationSite",
+    "SP.Publishing.EmbedService": "office365.sharepoint.publishing.embed_service:EmbedService",
+    "SP.Publishing.RepostPage": "office365.sharepoint.publishing.pages.repost:RepostPage",
+    "SP.Publishing.SitePage": "office365.sharepoint.publishing.pages.page:SitePage",
+    "SP.Publishing.SitePageMetadata": "office365.sharepoint.publishing.pages.metadata:SitePageMetadata",
+    "SP.Publishing.SitePageService": "office365.sharepoint.publishing.pages.service:SitePageService",
+    "SP.PushNotificationSubscriber": "office365.sharepoint.pushnotifications.subscriber:PushNotificationSubscriber",
+    "SP.RecycleBinItem": "office365.sharepoint.recyclebin.item:RecycleBinItem",
+    "SP.RegionalSettings": "office365.sharepoint.webs.regional_settings:RegionalSettings",
+    "SP.RelatedField": "office365.sharepoint.fields.related_field:RelatedField",
+    "SP.RemoveExternalUsersResults": "office365.sharepoint.tenant.management.users_results:RemoveExternalUsersResults",
+    "SP.RequestUserContext": "office365.sharepoint.request_user_context:RequestUserContext",
+    "SP.RichSharing": "office365.sharepoint.publishing.rich_sharing:RichSharing",
+    "SP.RoleAssignment": "office365.sharepoint.permissions.roles.assignments.assignment:RoleAssignment",
+    "SP.RoleDefinition": "office365.sharepoint.permissions.roles.definitions.definition:RoleDefinition",
+    "SP.SPActivityEntity": "office365.sharepoint.activities.entity:SPActivityEntity",
+    "SP.SPHSite": "office365.sharepoint.sites.sph_site:SPHSite",
+    "SP.SPHubSitesUtility": "office365.sharepoint.portal.hub_sites_utility:SPHubSitesUtility",
+    "SP.SPSiteManager": "office365.sharepoint.portal.site_manager:SPSiteManager",
+    "SP.SearchService": "office365.sharepoint.search.service:SearchService",
+    "SP.SecurableObject": "office365.sharepoint.permissions.securable_object:SecurableObject",
+    "SP.ServerSettings": "office365.sharepoint.server_settings:ServerSettings",
+    "SP.SharePointSharingSettings":
+        "office365.sharepoint.sharing.sharepoint_sharing_settings:SharePointSharingSettings",
+    "SP.SharedWithMeDocument": "office365.sharepoint.userprofiles.sharedwithme.document:SharedWithMeDocument",
+    "SP.SharedWithMeItems": "office365.sharepoint.userprofiles.sharedwithme.items:SharedWithMeItems",
+    "SP.Sharing.DocumentSharingManager": "office365.sharepoint.sharing.document_sharing_manager:DocumentSharingManager",
+    "SP.Sharing.PersonalWeb": "office365.sharepoint.sharing.personal_web:PersonalWeb",
+    "SP.SharingInformation": "office365.sharepoint.sharing.sharing_information:SharingInformation",
+    "SP.SharingPermissionInformation":
+        "office365.sharepoint.sharing.sharingPermissionInformation:SharingPermissionInformation",
+    "SP.SharingResult": "office365.sharepoint.sharing.sharing_result:SharingResult",
+    "SP.SharingUtility": "office365.sharepoint.sharing.sharing_utility:SharingUtility",
+    "SP.SignalStore": "office365.sharepoint.search.analytics.signal_store:SignalStore",
+    "SP.Site": "office365.sharepoint.sites.site:Site",
+    "SP.SiteCollectionAppCatalogAllowedItem":
+        "office365.sharepoint.marketplace.sitecollection.appcatalog.allowed_item:SiteCollectionAppCatalogAllowedItem",
+    "SP.SiteCollectionCorporateCatalogAccessor":
+        "office365.sharepoint.marketplace.sitecollection.appcatalog.accessor:SiteCollectionCorporateCatalogAccessor",
+    "SP.SiteDesignPrincipal": "office365.sharepoint.sitedesigns.principal:SiteDesignPrincipal",
+    "SP.SiteDesignRun": "office365.sharepoint.sitedesigns.run:SiteDesignRun",
+    "SP.SiteHealth.SiteHealthSummary": "office365.sharepoint.sitehealth.summary:SiteHealthSummary",
+    "SP.SiteSharingReportHelper": "office365.sharepoint.sharing.site_sharing_report_helper:SiteSharingReportHelper",
+    "SP.Social.SocialRestActor": "office365.sharepoint.social.rest_actor:SocialRestActor",
+    "SP.Social.SocialRestFollowingManager":
+        "office365.sharepoint.social.following.rest_manager:SocialRestFollowingManager",
+    "SP.SocialAnnouncementManager": "office365.sharepoint.social.announcement_manager:SocialAnnouncementManager",
+    "SP.SocialFeedManager": "office365.sharepoint.social.feed.manager:SocialFeedManager",
+    "SP.SocialFollowingManager": "office365.sharepoint.social.following.manager:SocialFollowingManager",
+    "SP.SocialRestFeed": "office365.sharepoint.social.feed.rest:SocialRestFeed",
+    "SP.SocialRestFeedManager": "office365.sharepoint.social.feed.rest_manager:SocialRestFeedManager",
+    "SP.SocialRestThread": "office365.sharepoint.social.rest_thread:SocialRestThread",
+    "SP.StorageEntity": "office365.sharepoint.clientsidecomponent.storage_entity:StorageEntity",
+    "SP.StorageMetrics": "office365.sharepoint.storagemetrics.storage_metrics:StorageMetrics",
+    "SP.Taxonomy.TaxonomyField": "office365.sharepoint.taxonomy.field:TaxonomyField",
+    "SP.TeamChannel": "office365.sharepoint.teams.channel:TeamChannel",
+    "SP.TeamChannelManager": "office365.sharepoint.teams.channel_manager:TeamChannelManager",
+    "SP.TeamSiteData": "office365.sharepoint.sites.team_site_data:TeamSiteData",
+    "SP.TenantCorporateCatalogAccessor":
+        "office365.sharepoint.marketplace.tenant.appcatalog.accessor:TenantCorporateCatalogAccessor",
+    "SP.TenantSettings": "office365.sharepoint.tenant.tenant_settings:TenantSettings",
+    "SP.ThemeProperties": "office365.sharepoint.tenant.administration.theme_properties:ThemeProperties",
+    "SP.TimeZone": "office365.sharepoint.webs.time_zone:TimeZone",
+    "SP.Translation.TranslationJobStatus": "office365.sharepoint.translation.job_status:TranslationJobStatus",
+    "SP.TranslationNotificationRecipientUsers":
+        "office365.sharepoint.translation.notification_recipient_users:TranslationNotificationRecipientUsers",
+    "SP.TranslationStatusCollection": "office365.sharepoint.translation.status_collection:TranslationStatusCollection",
+    "SP.UI.ApplicationPages.ClientPeoplePickerWebServiceInterface":
+        "office365.sharepoint.ui.applicationpages.peoplepicker.web_service_interface:ClientPeoplePickerWebServiceInterface",  # noqa: E501
+    "SP.UploadStatus": "office365.sharepoint.utilities.upload_status:UploadStatus",
+    "SP.User": "office365.sharepoint.principal.user:User",
+    "SP.UserCustomAction": "office365.sharepoint.usercustomactions.action:UserCustomAction",
+    "SP.UserEntity": "office365.sharepoint.likes.user_entity:UserEntity",
+    "SP.UserInfoItem": "office365.sharepoint.listitems.user_info_item:UserInfoItem",
+    "SP.UserProfile": "office365.sharepoint.userprofiles.user_profile:UserProfile",
+    "SP.UserProfilePropertiesForUser":
+        "office365.sharepoint.userprofiles.properties_for_user:UserProfilePropertiesForUser",
+    "SP.UserProfiles.FollowedContent": "office365.sharepoint.userprofiles.followed_content:FollowedContent",
+    "SP.UserProfiles.PeopleManager": "office365.sharepoint.userprofiles.people_manager:PeopleManager",
+    "SP.UserResource": "office365.sharepoint.types.user_resource:UserResource",
+    "SP.Utilities.SPSocialSwitch": "office365.sharepoint.social.switch:SPSocialSwitch",
+    "SP.Utilities.ThemeManager": "office365.sharepoint.portal.theme_manager:ThemeManager",
+    "SP.Utilities.Utility": "office365.sharepoint.utilities.utility:Utility",
+    "SP.Utility": "office365.sharepoint.permissions.utility:Utility",
+    "SP.VideoChannel": "office365.sharepoint.publishing.video.channel:VideoChannel",
+    "SP.VideoItem": "office365.sharepoint.publishing.video.item:VideoItem",
+    "SP.VideoServiceDiscoverer": "office365.sharepoint.publishing.video.service_discoverer:VideoServiceDiscoverer",
+    "SP.VideoServiceManager": "office365.sharepoint.publishing.video.service_manager:VideoServiceManager",
+    "SP.View": "office365.sharepoint.views.view:View",
+    "SP.WacApi": "office365.sharepoint.yammer.wac_api:WacApi",
+    "SP.Web": "office365.sharepoint.webs.web:Web",
+    "SP.WebInformation": "office365.sharepoint.webs.information:WebInformation",
+    "SP.WebPart": "office365.sharepoint.webparts.webpart:WebPart",
+    "SP.WebPartDefinition": "office365.sharepoint.webparts.definition:WebPartDefinition",
+    "SP.WebParts.LimitedWebPartManager": "office365.sharepoint.webparts.limited_manager:LimitedWebPartManager",
+    "SP.WebTemplate": "office365.sharepoint.webs.template:WebTemplate",
+    "SP.WorkflowAssociation": "office365.sharepoint.workflow.association:WorkflowAssociation",
+    "SP.WorkflowTemplate": "office365.sharepoint.workflow.template:WorkflowTemplate",
+    "microsoft.graph.aadUserConversationMember":
+        "office365.teams.members.aad_user_conversation:AadUserConversationMember",
+    "microsoft.graph.appRoleAssignment": "office365.directory.applications.app_role_assignment:AppRoleAssignment",
+    "microsoft.graph.application": "office365.directory.applications.application:Application",
+    "microsoft.graph.applicationTemplate": "office365.directory.applications.application_template:ApplicationTemplate",
+    "microsoft.graph.attachment": "office365.outlook.mail.attachments.attachment:Attachment",
+    "microsoft.graph.auditLogRoot": "office365.directory.audit.log_root:AuditLogRoot",
+    "microsoft.graph.b2XIdentityUserFlow": "office365.directory.identities.userflows.b2x.user_flow:B2XIdentityUserFlow",
+    "microsoft.graph.baseItem": "office365.base_item:BaseItem",
+    "microsoft.graph.baseItemVersion": "office365.onedrive.versions.base_item:BaseItemVersion",
+    "microsoft.graph.builtInIdentityProvider":
+        "office365.directory.identities.providers.builtin_identity_provider:BuiltInIdentityProvider",
+    "microsoft.graph.calendar": "office365.outlook.calendar.calendar:Calendar",
+    "microsoft.graph.calendarGroup": "office365.outlook.calendar.group:CalendarGroup",
+    "microsoft.graph.calendarPermission": "office365.outlook.calendar.permission:CalendarPermission",
+    "microsoft.graph.call": "office365.communications.calls.call:Call",
+    "microsoft.graph.callRecord": "office365.communications.callrecords.call_record:CallRecord",
+    "microsoft.graph.certificateBasedAuthConfiguration":
+        "office365.directory.certificates.certificate_based_auth_configuration:CertificateBasedAuthConfiguration",
+    "microsoft.graph.changeTrackedEntity": "office365.teams.shifts.change_tracked_entity:ChangeTrackedEntity",
+    "microsoft.graph.channel": "office365.teams.channels.channel:Channel",
+    "microsoft.graph.chat": "office365.teams.chats.chat:Chat",
+    "microsoft.graph.chatMessage": "office365.teams.chats.message:ChatMessage",
+    "microsoft.graph.checklistItem": "office365.todo.checklist_item:ChecklistItem",
+    "microsoft.graph.cloudCommunications": "office365.communications.cloud_communications:CloudCommunications",
+    "microsoft.graph.columnDefinition": "office365.onedrive.columns.definition:ColumnDefinition",
+    "microsoft.graph.columnLink": "office365.onedrive.columns.column_link:ColumnLink",
+    "microsoft.graph.commsOperation": "office365.communications.operations.comms:CommsOperation",
+    "microsoft.graph.conditionalAccessPolicy":
+        "office365.directory.policies.conditional_access:ConditionalAccessPolicy",
+    "microsoft.graph.conditionalAccessRoot":
+        "office365.directory.identities.conditional_access_root:ConditionalAccessRoot",
+    "microsoft.graph.contact": "office365.outlook.contacts.contact:Contact",
+    "microsoft.graph.contactFolder": "office365.outlook.contacts.folder:ContactFolder",
+    "microsoft.graph.contentType": "office365.onedrive.contenttypes.content_type:ContentType",
+    "microsoft.graph.conversationMember": "office365.teams.members.conversation:ConversationMember",
+    "microsoft.graph.device": "office365.directory.devices.device:Device",
+    "microsoft.graph.directory": "office365.directory.directory:Directory",
+    "microsoft.graph.directoryAudit": "office365.directory.audit.directory_audit:DirectoryAudit",
+    "microsoft.graph.directoryObject": "office365.directory.directory_object:DirectoryObject",
+    "microsoft.graph.directoryRole": "office365.directory.role:DirectoryRole",
+    "microsoft.graph.directoryRoleTemplate": "office365.directory.role_template:DirectoryRoleTemplate",
+    "microsoft.graph.drive": "office365.onedrive.drives.drive:Drive",
+    "microsoft.graph.driveItem": "office365.onedrive.driveitems.driveItem:DriveItem",
+    "microsoft.graph.driveItemVersion": "office365.onedrive.versions.drive_item:DriveItemVersion",
+    "microsoft.graph.educationClass": "office365.education.class:EducationClass",
+    "microsoft.graph.educationRoot": "office365.education.root:EducationRoot",
+    "microsoft.graph.educationUser": "office365.education.user:EducationUser",
+    "microsoft.graph.event": "office365.outlook.calendar.event:Event",
+    "microsoft.graph.eventMessage": "office365.outlook.mail.messages.event_message:EventMessage",
+    "microsoft.graph.extension": "office365.directory.extensions.extension:Extension",
+    "microsoft.graph.extensionProperty": "office365.directory.extensions.extension_property:ExtensionProperty",
+    "microsoft.graph.external": "office365.external.external:External",
+    "microsoft.graph.externalConnection": "office365.external.connection:ExternalConnection",
+    "microsoft.graph.fieldValueSet": "office365.onedrive.listitems.field_value_set:FieldValueSet",
+    "microsoft.graph.fileAttachment": "office365.outlook.mail.attachments.file:FileAttachment",
+    "microsoft.graph.group": "office365.directory.groups.group:Group",
+    "microsoft.graph.groupLifecyclePolicy": "office365.directory.groups.lifecycle_policy:GroupLifecyclePolicy",
+    "microsoft.graph.groupSetting": "office365.directory.groups.setting:GroupSetting",
+    "microsoft.graph.groupSettingTemplate": "office365.directory.groups.setting_template:GroupSettingTemplate",
+    "microsoft.graph.identityApiConnector": "office365.directory.identities.api_connector:IdentityApiConnector",
+    "microsoft.graph.identityContainer": "office365.directory.identities.identity_container:IdentityContainer",
+    "microsoft.graph.identityProvider": "office365.directory.identities.identity_provider:IdentityProvider",
+    "microsoft.graph.identityProviderBase":
+        "office365.directory.identities.providers.identity_provider_base:IdentityProviderBase",
+    "microsoft.graph.identityUserFlow": "office365.directory.identities.userflows.user_flow:IdentityUserFlow",
+    "microsoft.graph.identityUserFlowAttribute":
+        "office365.directory.identities.userflows.attribute:IdentityUserFlowAttribute",
+    "microsoft.graph.identityUserFlowAttributeAssignment":
+        "office365.directory.identities.userflows.user_attribute_assignment:IdentityUserFlowAttributeAssignment",
+    "microsoft.graph.inviteParticipantsOperation":
+        "office365.communications.operations.invite_participants:InviteParticipantsOperation",
+    "microsoft.graph.itemActivity": "office365.onedrive.analytics.item_activity:ItemActivity",
+    "microsoft.graph.itemActivityStat": "office365.onedrive.analytics.item_activity_stat:ItemActivityStat",
+    "microsoft.graph.itemAnalytics": "office365.onedrive.analytics.item_analytics:ItemAnalytics",
+    "microsoft.graph.itemAttachment": "office365.outlook.mail.attachments.item:ItemAttachment",
+    "microsoft.graph.licenseDetails": "office365.directory.licenses.license_details:LicenseDetails",
+    "microsoft.graph.linkedResource": "office365.todo.linked_resource:LinkedResource",
+    "microsoft.graph.list": "office365.onedrive.lists.list:List",
+    "microsoft.graph.listItem": "office365.onedrive.listitems.list_item:ListItem",
+    "microsoft.graph.listItemVersion": "office365.onedrive.versions.list_item:ListItemVersion",
+    "microsoft.graph.mailFolder": "office365.outlook.mail.folder:MailFolder",
+    "microsoft.graph.message": "office365.outlook.mail.messages.message:Message",
+    "microsoft.graph.messageRule": "office365.outlook.mail.messages.message_rule:MessageRule",
+    "microsoft.graph.multiValueLegacyExtendedProperty":
+        "office365.directory.extensions.extended_property:MultiValueLegacyExtendedProperty",
+    "microsoft.graph.notebook": "office365.onenote.notebooks.notebook:Notebook",
+    "microsoft.graph.offerShiftRequest": "office365.teams.shifts.offer_shift_request:OfferShiftRequest",
+    "microsoft.graph.onenote": "office365.onenote.onenote:Onenote",
+    "microsoft.graph.onenoteEntityBaseModel": "office365.onenote.entity_base_model:OnenoteEntityBaseModel",
+    "microsoft.graph.onenoteEntityHierarchyModel":
+        "office365.onenote.entity_hierarchy_model:OnenoteEntityHierarchyModel",
+    "microsoft.graph.onenoteEntitySchemaObjectModel":
+        "office365.onenote.entity_schema_object_model:OnenoteEntitySchemaObjectModel",
+    "microsoft.graph.onenoteOperation": "office365.onenote.operations.onenote:OnenoteOperation",
+    "microsoft.graph.onenotePage": "office365.onenote.pages.page:OnenotePage",
+    "microsoft.graph.onenoteResource": "office365.onenote.resources.resource:OnenoteResource",
+    "microsoft.graph.onenoteSection": "office365.onenote.sections.section:OnenoteSection",
+    "microsoft.graph.onlineMeeting": "office365.communications.onlinemeetings.online_meeting:OnlineMeeting",
+    "microsoft.graph.openShiftChangeRequest": "office365.teams.shifts.open_shift_change_request:OpenShiftChangeRequest",
+    "microsoft.graph.operation": "office365.onenote.operations.operation:Operation",
+    "microsoft.graph.orgContact": "office365.directory.organizations.org_contact:OrgContact",
+    "microsoft.graph.organization": "office365.directory.organizations.organization:Organization",
+    "microsoft.graph.outlookCategory": "office365.outlook.category:OutlookCategory",
+    "microsoft.graph.outlookItem": "office365.outlook.item:OutlookItem",
+    "microsoft.graph.outlookUser": "office365.outlook.user:OutlookUser",
+    "microsoft.graph.participant": "office365.communications.calls.participant:Participant",
+    "microsoft.graph.permission": "office365.onedrive.permissions.permission:Permission",
+    "microsoft.graph.place": "office365.outlook.calendar.place:Place",
+    "microsoft.graph.planner": "office365.planner.planner:Planner",
+    "microsoft.graph.plannerBucket": "office365.planner.buckets.bucket:PlannerBucket",
+    "microsoft.graph.plannerGroup": "office365.planner.group:PlannerGroup",
+    "microsoft.graph.plannerPlan": "office365.planner.plans.plan:PlannerPlan",
+    "microsoft.graph.plannerPlanDetails": "office365.planner.plans.plan_details:PlannerPlanDetails",
+    "microsoft.graph.plannerTask": "office365.planner.tasks.task:PlannerTask",
+    "microsoft.graph.plannerTaskDetails": "office365.planner.tasks.task_details:PlannerTaskDetails",
+    "microsoft.graph.plannerUser": "office365.planner.user:PlannerUser",
+    "microsoft.graph.policyBase": "office365.directory.policies.base:PolicyBase",
+    "microsoft.graph.policyRoot": "office365.directory.policies.root:PolicyRoot",
+    "microsoft.graph.presence": "office365.communications.presences.presence:Presence",
+    "microsoft.graph.profilePhoto": "office365.directory.profile_photo:ProfilePhoto",
+    "microsoft.graph.provisioningObjectSummary":
+        "office365.directory.audit.provisioning_object_summary:ProvisioningObjectSummary",
+    "microsoft.graph.referenceAttachment": "office365.outlook.mail.attachments.reference:ReferenceAttachment",
+    "microsoft.graph.relation": "office365.onedrive.termstore.relation:Relation",
+    "microsoft.graph.reportRoot": "office365.reports.report_root:ReportRoot",
+    "microsoft.graph.resourceSpecificPermissionGrant":
+        "office365.directory.resource_specific_permission_grant:ResourceSpecificPermissionGrant",
+    "microsoft.graph.sPOUserSessionRevocationResult":
+        "office365.sharepoint.tenant.management.users_results:SPOUserSessionRevocationResult",
+    "microsoft.graph.schedule": "office365.teams.shifts.schedule:Schedule",
+    "microsoft.graph.scheduleChangeRequest": "office365.teams.shifts.schedule_change_request:ScheduleChangeRequest",
+    "microsoft.graph.schedulingGroup": "office365.teams.shifts.scheduling_group:SchedulingGroup",
+    "microsoft.graph.searchEntity": "office365.search.entity:SearchEntity",
+    "microsoft.graph.sectionGroup": "office365.onenote.sectiongroups.section_group:SectionGroup",
+    "microsoft.graph.security": "office365.security.security:Security",
+    "microsoft.graph.servicePrincipal": "office365.directory.applications.service_principal:ServicePrincipal",
+    "microsoft.graph.sharedDriveItem": "office365.onedrive.shares.shared_drive_item:SharedDriveItem",
+    "microsoft.graph.shift": "office365.teams.shifts.shift:Shift",
+    "microsoft.graph.shiftPreferences": "office365.teams.shifts.preferences:ShiftPreferences",
+    "microsoft.graph.signIn": "office365.directory.audit.signIn:SignIn",
+    "microsoft.graph.singleValueLegacyExtendedProperty":
+        "office365.directory.extensions.extended_property:SingleValueLegacyExtendedProperty",
+    "microsoft.graph.site": "office365.onedrive.sites.site:Site",
+    "microsoft.graph.socialIdentityProvider":
+        "office365.directory.identities.providers.social_identity_provider:SocialIdentityProvider",
+    "microsoft.graph.store": "office365.onedrive.termstore.store:Store",
+    "microsoft.graph.stsPolicy": "office365.directory.policies.sts_policy:StsPolicy",
+    "microsoft.graph.subscribedSku": "office365.directory.licenses.subscribed_sku:SubscribedSku",
+    "microsoft.graph.subscription": "office365.directory.subscriptions.subscription:Subscription",
+    "microsoft.graph.team": "office365.teams.team:Team",
+    "microsoft.graph.teamInfo": "office365.teams.team_info:TeamInfo",
+    "microsoft.graph.teamsApp": "office365.teams.apps.app:TeamsApp",
+    "microsoft.graph.teamsAppDefinition": "office365.teams.apps.definition:TeamsAppDefinition",
+    "microsoft.graph.teamsAppInstallation": "office365.teams.apps.installation:TeamsAppInstallation",
+    "microsoft.graph.teamsAsyncOperation": "office365.teams.operations.async_operation:TeamsAsyncOperation",
+    "microsoft.graph.teamsTab": "office365.teams.tabs.tab:TeamsTab",
+    "microsoft.graph.teamsTemplate": "office365.teams.template:TeamsTemplate",
+    "microsoft.graph.teamworkBot": "office365.teams.bots.teamwork_bot:TeamworkBot",
+    "microsoft.graph.thumbnailSet": "office365.onedrive.driveitems.thumbnail_set:ThumbnailSet",
+    "microsoft.graph.timeOffReason": "office365.teams.shifts.time_off_reason:TimeOffReason",
+    "microsoft.graph.todo": "office365.todo.todo:Todo",
+    "microsoft.graph.todoTask": "office365.todo.task:TodoTask",
+    "microsoft.graph.user": "office365.directory.users.user:User",
+    "microsoft.graph.userFlowLanguageConfiguration":
+        "office365.directory.identities.userflows.language_configuration:UserFlowLanguageConfiguration",
+    "microsoft.graph.userFlowLanguagePage":
+        "office365.directory.identities.userflows.language_page:UserFlowLanguagePage",
+    "microsoft.graph.userScopeTeamsAppInstallation":
+        "office365.teams.apps.user_scope_installation:UserScopeTeamsAppInstallation",
+    "microsoft.graph.userSettings": "office365.directory.users.settings:UserSettings",
+    "microsoft.graph.userTeamwork": "office365.teams.user_teamwork:UserTeamwork",
+    "microsoft.graph.workbook": "office365.onedrive.workbooks.workbook:Workbook",
+    "microsoft.graph.workbookChart": "office365.onedrive.workbooks.charts.chart:WorkbookChart",
+    "microsoft.graph.workbookChartAreaFormat":
+        "office365.onedrive.workbooks.charts.area_format:WorkbookChartAreaFormat",
+    "microsoft.graph.workbookChartAxes": "office365.onedrive.workbooks.charts.axes:WorkbookChartAxes",
+    "microsoft.graph.workbookChartDataLabels":
+        "office365.onedrive.workbooks.charts.data_labels:WorkbookChartDataLabels",
+    "microsoft.graph.workbookChartLegend": "office365.onedrive.workbooks.charts.legend:WorkbookChartLegend",
+    "microsoft.graph.workbookChartSeries": "office365.onedrive.workbooks.charts.series:WorkbookChartSeries",
+    "microsoft.graph.workbookFormatProtection":
+        "office365.onedrive.workbooks.ranges.format_protection:WorkbookFormatProtection",
+    "microsoft.graph.workbookFunctionResult": "office365.onedrive.workbooks.functions.result:WorkbookFunctionResult",
+    "microsoft.graph.workbookFunctions": "office365.onedrive.workbooks.functions.functions:WorkbookFunctions",
+    "microsoft.graph.workbookNamedItem": "office365.onedrive.workbooks.names.named_item:WorkbookNamedItem",
+    "microsoft.graph.workbookOperation": "office365.onedrive.workbooks.operations.workbook:WorkbookOperation",
+    "microsoft.graph.workbookPivotTable": "office365.onedrive.workbooks.tables.pivot_table:WorkbookPivotTable",
+    "microsoft.graph.workbookRange": "office365.onedrive.workbooks.ranges.range:WorkbookRange",
+    "microsoft.graph.workbookRangeFormat": "office365.onedrive.workbooks.ranges.format:WorkbookRangeFormat",
+    "microsoft.graph.workbookTable": "office365.onedrive.workbooks.tables.table:WorkbookTable",
+    "microsoft.graph.workbookTableColumn": "office365.onedrive.workbooks.tables.column:WorkbookTableColumn",
+    "microsoft.graph.workbookTableRow": "office365.onedrive.workbooks.tables.row:WorkbookTableRow",
+    "microsoft.graph.workbookWorksheet": "office365.onedrive.workbooks.worksheets.worksheet:WorkbookWorksheet",
+    "microsoft.graph.workbookWorksheetProtection":
+        "office365.onedrive.workbooks.worksheets.protection:WorkbookWorksheetProtection",
+}
@@ -1,33 +1,3 @@
-from office365.communications.cloud_communications import CloudCommunications
-from office365.delta_collection import DeltaCollection
-from office365.directory.applications.application import Application
-from office365.directory.applications.application_template import ApplicationTemplate
-from office365.directory.applications.service_principal import ServicePrincipal
-from office365.directory.audit.log_root import AuditLogRoot
-from office365.directory.directory import Directory
-from office365.directory.directory_object_collection import DirectoryObjectCollection
-from office365.directory.groups.collection import GroupCollection
-from office365.directory.groups.lifecycle_policy import GroupLifecyclePolicy
-from office365.directory.groups.setting_template import GroupSettingTemplate
-from office365.directory.identities.identity_container import IdentityContainer
-from office365.directory.identities.identity_provider import IdentityProvider
-from office365.directory.internal.paths.me import MePath
-from office365.directory.licenses.subscribed_sku import SubscribedSku
-from office365.directory.organizations.org_contact import OrgContact
-from office365.directory.organizations.organization import Organization
-from office365.directory.policies.root import PolicyRoot
-from office365.directory.subscriptions.subscription import Subscription
-from office365.directory.users.user import User
-from office365.directory.users.collection import UserCollection
-from office365.education.root import EducationRoot
-from office365.entity_collection import EntityCollection
-from office365.external.external import External
-from office365.onedrive.drives.drive import Drive
-from office365.onedrive.shares.shares_collection import SharesCollection
-from office365.onedrive.sites.sites_with_root import SitesWithRoot
-from office365.outlook.calendar.place import Place
-from office365.planner.planner import Planner
-from office365.reports.report_root import ReportRoot
 from office365.runtime.auth.token_response import TokenResponse
 from office365.runtime.client_runtime_context import ClientRuntimeContext
 from office365.runtime.http.http_method import HttpMethod
@@ -37,11 +7,6 @@ from office365.runtime.odata.v4.json_format import V4JsonFormat
 from office365.runtime.paths.resource_path import ResourcePath
 from office365.runtime.queries.delete_entity import DeleteEntityQuery
 from office365.runtime.queries.update_entity import UpdateEntityQuery
-from office365.search.entity import SearchEntity
-from office365.security.security import Security
-from office365.teams.chats.collection import ChatCollection
-from office365.teams.collection import TeamCollection
-from office365.teams.template import TeamsTemplate
 
 
 class GraphClient(ClientRuntimeContext):
@@ -67,16 +32,31 @@ class GraphClient(ClientRuntimeContext):
         self._build_specific_query(request)
         return request
 
-    def execute_batch(self, items_per_batch=100):
+    def execute_batch(self, items_per_batch=100, part_failed=None):
         """Constructs and submit a batch request
 
         :param int items_per_batch: Maximum to be selected for bulk operation
+        :param (ClientQuery, requests.Response)->None part_failed: Invoked for every failed query instead of
+            raising an error, so that the rest of queries are processed
         """
-        batch_request = ODataV4BatchRequest(self, items_per_batch)
+        batch_request = ODataV4BatchRequest(self, items_per_batch, part_failed)
         [batch_request.add_query(qry) for qry in self.pending_request()]
         batch_request.execute_query()
         return self
 
+    def clone(self):
+        """
+        Creates a new client which shares the token callback with the current one but has its own
+        pending queries, could be used to submit queries from another thread
+        """
+        client = GraphClient(self._acquire_token_callback)
+        client.queryExecuted = self.queryExecuted
+        client.profiler = self.profiler
+        client.session = self.session
+        client.response_cache = self.response_cache
+        client.model_registry = self.model_registry
+        return client
+
     def pending_request(self):
         return self._pending_request
 
@@ -108,101 +88,132 @@ class GraphClient(ClientRuntimeContext):
     @property
     def me(self):
         """The Me endpoint is provided as a shortcut for specifying the current user"""
+        from office365.directory.internal.paths.me import MePath
+        from office365.directory.users.user import User
         return User(self, MePath())
 
     @property
     def drives(self):
         """Get one drives"""
+        from office365.entity_collection import EntityCollection
+        from office365.onedrive.drives.drive import Drive
         return EntityCollection(self, Drive, ResourcePath("drives"))
 
     @property
     def users(self):
         """Get users"""
+        from office365.directory.users.collection import UserCollection
         return UserCollection(self, ResourcePath("users"))
 
     @property
     def groups(self):
         """Get groups"""
+        from office365.directory.groups.collection import GroupCollection
         return GroupCollection(self, ResourcePath("groups"))
 
     @property
     def sites(self):
         """Get sites"""
+        from office365.onedrive.sites.sites_with_root import SitesWithRoot
         return SitesWithRoot(self, ResourcePath("sites"))
 
     @property
     def shares(self):
         """Get shares"""
+        from office365.onedrive.shares.shares_collection import SharesCollection
         return SharesCollection(self, ResourcePath("shares"))
 
     @property
     def directory_objects(self):
         """Get Directory Objects"""
+        from office365.directory.directory_object_collection import DirectoryObjectCollection
         return DirectoryObjectCollection(self, ResourcePath("directoryObjects"))
 
     @property
     def teams(self):
         """Get teams"""
+        from office365.teams.collection import TeamCollection
         return TeamCollection(self, ResourcePath("teams"))
 
     @property
     def chats(self):
         """Get teams"""
+        from office365.teams.chats.collection import ChatCollection
         return ChatCollection(self, ResourcePath("chats"))
 
     @property
     def group_setting_templates(self):
         """Get teams"""
+        from office365.directory.groups.setting_template import GroupSettingTemplate
+        from office365.entity_collection import EntityCollection
         return EntityCollection(self, GroupSettingTemplate, ResourcePath("groupSettingTemplates"))
 
     @property
     def contacts(self):
         """Get the list of organizational contacts for this organization."""
+        from office365.delta_collection import DeltaCollection
+        from office365.directory.organizations.org_contact import OrgContact
         return DeltaCollection(self, OrgContact, ResourcePath("contacts"))
 
     @property
     def directory(self):
         """Represents a deleted item in the directory"""
+        from office365.directory.directory import Directory
         return Directory(self, ResourcePath("directory"))
 
     @property
     def identity_providers(self):
+        from office365.directory.identities.identity_provider import IdentityProvider
+        from office365.entity_collection import EntityCollection
         return EntityCollection(self, IdentityProvider, ResourcePath("identityProviders"))
 
     @property
     def identity(self):
+        from office365.directory.identities.identity_container import IdentityContainer
         return IdentityContainer(self, ResourcePath("identity"))
 
     @property
     def application_templates(self):
         """Get the list of application templates in this organization."""
+        from office365.directory.applications.application_template import ApplicationTemplate
+        from office365.entity_collection import EntityCollection
         return EntityCollection(self, ApplicationTemplate, ResourcePath("applicationTemplates"))
 
     @property
     def applications(self):
         """Get the list of applications in this organization."""
+        from office365.delta_collection import DeltaCollection
+        from office365.directory.applications.application import Application
         return DeltaCollection(self, Application, ResourcePath("applications"))
 
     @property
     def service_principals(self):
         """Retrieve a list of servicePrincipal objects."""
+        from office365.delta_collection import DeltaCollection
+        from office365.directory.applications.service_principal import ServicePrincipal
         return DeltaCollection(self, ServicePrincipal, ResourcePath("servicePrincipals"))
 
     @property
     def organization(self):
+        from office365.directory.organizations.organization import Organization
         return Organization(self, ResourcePath("organization"))
 
     @property
     def subscribed_skus(self):
         """Retrieve a list of servicePrincipal objects."""
+        from office365.directory.licenses.subscribed_sku import SubscribedSku
+        from office365.entity_collection import EntityCollection
         return EntityCollection(self, SubscribedSku, ResourcePath("subscribedSkus"))
 
     @property
     def group_lifecycle_policies(self):
+        from office365.directory.groups.lifecycle_policy import GroupLifecyclePolicy
+        from office365.entity_collection import EntityCollection
         return EntityCollection(self, GroupLifecyclePolicy, ResourcePath("groupLifecyclePolicies"))
 
     @property
     def communications(self):
+        from office365.communications.cloud_communications import CloudCommunications
         return CloudCommunications(self, ResourcePath("communications"))
 
     @property
@@ -211,6 +222,8 @@ class GraphClient(ClientRuntimeContext):
         Retrieve the properties and relationships of webhook subscriptions,
         based on the app ID, the user, and the user's role with a tenant.
         """
+        from office365.directory.subscriptions.subscription import Subscription
+        from office365.entity_collection import EntityCollection
         return EntityCollection(self, Subscription, ResourcePath("subscriptions"))
 
     @property
@@ -218,6 +231,7 @@ class GraphClient(ClientRuntimeContext):
         """
         Get the list of audit logs generated by Azure Active Directory.
         """
+        from office365.directory.audit.log_root import AuditLogRoot
         return AuditLogRoot(self, ResourcePath("auditLogs"))
 
     @property
@@ -225,6 +239,8 @@ class GraphClient(ClientRuntimeContext):
         """
         Get all places in a tenant
         """
+        from office365.entity_collection import EntityCollection
+        from office365.outlook.calendar.place import Place
         return EntityCollection(self, Place, ResourcePath("places"))
 
     @property
@@ -232,6 +248,7 @@ class GraphClient(ClientRuntimeContext):
         """
         The resource that represents an instance of History Reports.
         """
+        from office365.reports.report_root import ReportRoot
         return ReportRoot(self, ResourcePath("reports"))
 
     @property
@@ -239,6 +256,8 @@ class GraphClient(ClientRuntimeContext):
         """
         Get the list of teams templates.
         """
+        from office365.entity_collection import EntityCollection
+        from office365.teams.template import TeamsTemplate
         return EntityCollection(self, TeamsTemplate, ResourcePath("teamsTemplates"))
 
     @property
@@ -247,6 +266,7 @@ class GraphClient(ClientRuntimeContext):
         The planner resource is the entry point for the Planner object model.
         It returns a singleton planner resource. It doesn't contain any usable properties.
         """
+        from office365.planner.planner import Planner
         return Planner(self, ResourcePath("planner"))
 
     @property
@@ -254,6 +274,7 @@ class GraphClient(ClientRuntimeContext):
         """
         The search endpoint is the entry point for Microsoft Search API to query data.
         """
+        from office365.search.entity import SearchEntity
         return SearchEntity(self, ResourcePath("search"))
 
     @property
@@ -261,20 +282,24 @@ class GraphClient(ClientRuntimeContext):
         """
         The /education namespace exposes functionality that is specific to the education sector.
         """
+        from office365.education.root import EducationRoot
         return EducationRoot(self, ResourcePath("education"))
 
     @property
     def policies(self):
         """Resource type exposing navigation properties for the policies singleton."""
+        from office365.directory.policies.root import PolicyRoot
         return PolicyRoot(self, ResourcePath("policies"))
 
     @property
     def external(self):
         """A logical container  for external sources."""
+        from office365.external.external import External
         return External(self, ResourcePath("external"))
 
     @property
     def security(self):
         """The security resource is the entry point for the Security object model.
         It returns a singleton security resource. It doesn't contain any usable properties."""
+        from office365.security.security import Security
         return Security(self, ResourcePath("security"))
@@ -7,9 +7,12 @@ from office365.onedrive.driveitems.image import Image
 from office365.onedrive.driveitems.item_preview_info import ItemPreviewInfo
 from office365.onedrive.driveitems.photo import Photo
 from office365.onedrive.driveitems.special_folder import SpecialFolder
-from office365.onedrive.internal.queries.resumable_file_upload import create_resumable_file_upload_query
+from office365.onedrive.internal.queries.resumable_file_upload import create_resumable_file_upload_query, \
+    create_resumed_file_upload_query
 from office365.onedrive.internal.queries.upload_content import create_upload_content_query
 from office365.base_item import BaseItem
+from office365.delta_collection import DeltaCollection
+from office365.delta_sync import DeltaSync
 from office365.onedrive.analytics.item_activity_stat import ItemActivityStat
 from office365.onedrive.analytics.item_analytics import ItemAnalytics
 from office365.onedrive.permissions.permission import Permission
@@ -117,7 +120,8 @@ class DriveItem(BaseItem):
         self.context.add_query(qry)
         return self
 
-    def resumable_upload(self, source_path, chunk_size=2000000, chunk_uploaded=None):
+    def resumable_upload(self, source_path, chunk_size=2000000, chunk_uploaded=None, session_updated=None,
+                         hash_object=None):
         """
         Create an upload session to allow your app to upload files up to the maximum file size.
         An upload session allows your app to upload ranges of the file in sequential API requests,
@@ -130,10 +134,36 @@ class DriveItem(BaseItem):
         :param chunk_uploaded:
         :param str source_path: File path
         :param int chunk_size: chunk size
+        :param (office365.runtime.odata.v4.upload_session.UploadSession)->None session_updated: Invoked once the
+            session is created and after every uploaded chunk, could be used to persist uploadUrl and
+            nextExpectedRanges in order to resume the upload later via resume_upload method
+        :param hash_object: Hash object (e.g. QuickXorHash or hashlib.sha256()) the content is hashed with in the
+            same pass it is read, once uploaded the digest is verified against the hash returned by the server
         """
         file_name = os.path.basename(source_path)
         return_type = DriveItem(self.context, UrlPath(file_name, self.resource_path))
-        qry = create_resumable_file_upload_query(return_type, source_path, chunk_size, chunk_uploaded)
+        qry = create_resumable_file_upload_query(return_type, source_path, chunk_size, chunk_uploaded,
+                                                 session_updated, hash_object)
+        self.context.add_query(qry)
+        return return_type
+
+    def resume_upload(self, source_path, upload_url, chunk_size=2000000, chunk_uploaded=None, session_updated=None,
+                      hash_object=None):
+        """
+        Resumes an interrupted upload session. The status of the session is queried first
+        and only the ranges the server is still expecting are uploaded.
+
+        :param str source_path: File path
+        :param str upload_url: The URL of the upload session returned when the session was created
+        :param int chunk_size: chunk size
+        :param (int)->None chunk_uploaded:
+        :param (office365.runtime.odata.v4.upload_session.UploadSession)->None session_updated:
+        :param hash_object: Hash object the content is hashed with, verified against the server once uploaded
+        """
+        file_name = os.path.basename(source_path)
+        return_type = DriveItem(self.context, UrlPath(file_name, self.resource_path))
+        qry = create_resumed_file_upload_query(return_type, source_path, upload_url, chunk_size, chunk_uploaded,
+                                               session_updated, hash_object)
         self.context.add_query(qry)
         return return_type
 
@@ -170,6 +200,36 @@ class DriveItem(BaseItem):
         self.context.add_query(qry)
         return qry.return_type
 
+    def track_changes(self, state_store=None, scope=None, resync_required=None):
+        """Tracks changes of the item and its children via delta query, the delta link is kept in the state store
+        between the runs. Deleted items are returned with the deleted facet.
+
+        :param office365.runtime.state_store.StateStore state_store: Keeps the delta link
+        :param str scope: Key of the delta link in the store
+        :param () -> None resync_required: Invoked when the delta link has expired
+        :rtype: office365.delta_sync.DeltaSync
+        """
+        return DeltaSync(self.delta, state_store, scope, resync_required)
+
+    def walk(self, max_workers=4, batch_size=1, max_depth=None, item_filter=None, folder_filter=None,
+             properties_to_select=None, page_size=None):
+        """Walks the folder tree breadth-first, sibling folders are listed concurrently.
+        Yields (path, item) pairs where path is relative to the item.
+
+        :param int max_workers: Maximum number of requests submitted in parallel
+        :param int batch_size: Number of folders listed per request (up to 20), $batch request is submitted
+            if greater than 1
+        :param int or None max_depth: Maximum depth to descend to
+        :param (str, DriveItem) -> bool item_filter: Determines whether the item is yielded
+        :param (str, DriveItem) -> bool folder_filter: Determines whether the folder is walked
+        :param list[str] or None properties_to_select: Properties of drive items to retrieve
+        :param int or None page_size: Number of children returned per request
+        :rtype: office365.onedrive.driveitems.tree_walker.DriveItemTreeWalker
+        """
+        from office365.onedrive.driveitems.tree_walker import DriveItemTreeWalker
+        return DriveItemTreeWalker(self, max_workers, batch_size, max_depth, item_filter, folder_filter,
+                                   properties_to_select, page_size)
+
     def download(self, file_object):
         """
         :type file_object: typing.IO
@@ -441,6 +501,15 @@ class DriveItem(BaseItem):
         """
         return self.properties.get("location", GeoCoordinates())
 
+    @property
+    def size(self):
+        """
+        Size of the item in bytes. Read-only.
+
+        :rtype: int or None
+        """
+        return self.properties.get("size", None)
+
     @property
     def file_system_info(self):
         """File system information on client."""
@@ -545,7 +614,7 @@ class DriveItem(BaseItem):
     def delta(self):
         """This method allows your app to track changes to a drive item and its children over time."""
         return self.properties.get('delta',
-                                   EntityCollection(self.context, DriveItem, ResourcePath("delta", self.resource_path)))
+                                   DeltaCollection(self.context, DriveItem, ResourcePath("delta", self.resource_path)))
 
     @property
     def subscriptions(self):
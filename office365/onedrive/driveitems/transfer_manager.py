@@ -0,0 +1,96 @@
+import os
+
+from office365.onedrive.driveitems.tree_walker import DriveItemTreeWalker
+from office365.onedrive.internal.quick_xor_hash import QuickXorHash
+from office365.runtime.transfers.manager import TransferManager, TransferItem
+
+
+class DriveItemTransferManager(TransferManager):
+    """Transfers a directory tree between a local file system and a OneDrive folder"""
+
+    _properties_to_select = ["id", "name", "size", "file", "folder", "fileSystemInfo", "lastModifiedDateTime"]
+
+    def _create_context(self):
+        return self._context.clone()
+
+    def _resolve_reference(self, folder):
+        """
+        :type folder: office365.onedrive.driveitems.driveItem.DriveItem
+        """
+        if not folder.is_property_available("id") or folder.parent_reference.driveId is None:
+            folder.get().select(["id", "parentReference"]).execute_query()
+        return folder.parent_reference.driveId, folder.id
+
+    def _list_remote(self, folder_ref):
+        files = {}
+        folders = {}
+        drive_id = folder_ref[0]
+        walker = DriveItemTreeWalker(self._get_item(self._context, folder_ref), self.max_workers,
+                                     properties_to_select=self._properties_to_select)
+        for path, child in walker:  # type: str, office365.onedrive.driveitems.driveItem.DriveItem
+            if child.is_folder:
+                folders[path] = (drive_id, child.id)
+            elif child.is_file:
+                hashes = child.file.hashes or {}
+                modified = child.file_system_info.lastModifiedDateTime or child.last_modified_datetime
+                files[path] = TransferItem(path, child.size, self._parse_timestamp(modified),
+                                           hashes.get("quickXorHash", None), (drive_id, child.id))
+        return files, folders
+
+    def _create_folder(self, parent_ref, name):
+        folder = self._get_item(self._context, parent_ref).create_folder(name).execute_query()
+        return parent_ref[0], folder.id
+
+    def _upload_file(self, context, folder_ref, local_item, bytes_transferred):
+        """
+        :type context: office365.graph_client.GraphClient
+        :type local_item: TransferItem
+        """
+        target_folder = self._get_item(context, folder_ref)
+        if local_item.size > self.large_file_threshold:
+            state = {"uploaded": 0}
+
+            def _chunk_uploaded(uploaded_bytes):
+                bytes_transferred(uploaded_bytes - state["uploaded"])
+                state["uploaded"] = uploaded_bytes
+
+            target_folder.resumable_upload(local_item.reference, self.chunk_size, _chunk_uploaded)
+            context.execute_query()
+        else:
+            with open(local_item.reference, 'rb') as f:
+                content = f.read()
+            target_folder.upload(local_item.name, content).execute_query()
+            bytes_transferred(local_item.size)
+
+    def _download_file(self, context, remote_item, file_path, bytes_transferred):
+        """
+        :type context: office365.graph_client.GraphClient
+        :type remote_item: TransferItem
+        """
+        state = {"downloaded": 0}
+
+        def _chunk_downloaded(downloaded_bytes):
+            bytes_transferred(downloaded_bytes - state["downloaded"])
+            state["downloaded"] = downloaded_bytes
+
+        source_item = self._get_item(context, remote_item.reference)
+        with open(file_path, 'wb') as f:
+            source_item.download_session(f, _chunk_downloaded, self.chunk_size).execute_query()
+        if remote_item.modified is not None:
+            os.utime(file_path, (remote_item.modified, remote_item.modified))
+
+    def _compute_hash(self, file_path):
+        hash_object = QuickXorHash()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                hash_object.update(chunk)
+        return hash_object.base64digest()
+
+    @staticmethod
+    def _get_item(context, item_ref):
+        """
+        :type context: office365.graph_client.GraphClient
+        :type item_ref: (str, str)
+        """
+        drive_id, item_id = item_ref
+        return context.drives[drive_id].items[item_id]
@@ -0,0 +1,77 @@
+from office365.runtime.tree_walker import TreeWalker
+
+
+class DriveItemTreeWalker(TreeWalker):
+    """Walks a OneDrive folder tree, children of a folder are retrieved page by page"""
+
+    max_batch_size = 20
+
+    def __init__(self, root, max_workers=4, batch_size=1, max_depth=None, item_filter=None, folder_filter=None,
+                 properties_to_select=None, page_size=None):
+        """
+        :type root: office365.onedrive.driveitems.driveItem.DriveItem
+        :param int max_workers: Maximum number of requests submitted in parallel
+        :param int batch_size: Number of folders listed per request (up to 20), $batch request is submitted
+            if greater than 1
+        :param int or None max_depth: Maximum depth to descend to, the children of the root folder are at depth 1
+        :param (str, DriveItem) -> bool item_filter: Determines whether the item is yielded
+        :param (str, DriveItem) -> bool folder_filter: Determines whether the folder is walked
+        :param list[str] or None properties_to_select: Properties of drive items to retrieve
+        :param int or None page_size: Number of children returned per request
+        """
+        super(DriveItemTreeWalker, self).__init__(root, max_workers, min(batch_size, self.max_batch_size),
+                                                  max_depth, item_filter, folder_filter)
+        if properties_to_select:
+            properties_to_select = list(properties_to_select)
+            properties_to_select += [name for name in ["id", "name", "folder", "parentReference"]
+                                     if name not in properties_to_select]
+        self.properties_to_select = properties_to_select
+        self.page_size = page_size
+
+    def _create_context(self):
+        return self._root.context.clone()
+
+    def _resolve_reference(self, folder):
+        """
+        :type folder: office365.onedrive.driveitems.driveItem.DriveItem
+        """
+        if not folder.is_property_available("id") or folder.parent_reference.driveId is None:
+            folder.get().select(["id", "parentReference"]).execute_query()
+        return folder.parent_reference.driveId, folder.id
+
+    def _get_reference(self, item):
+        """
+        :type item: office365.onedrive.driveitems.driveItem.DriveItem
+        """
+        return item.parent_reference.driveId, item.id
+
+    def _list_children(self, context, folder_refs):
+        """
+        :type context: office365.graph_client.GraphClient
+        :type folder_refs: list[(str, str)]
+        """
+        result = []
+        for drive_id, item_id in folder_refs:
+            children = context.drives[drive_id].items[item_id].children.paged(self.page_size)
+            if self.properties_to_select:
+                children.select(self.properties_to_select)
+            context.load(children)
+            result.append(children)
+        if len(result) > 1:
+            context.execute_batch(self.batch_size)
+        else:
+            context.execute_query()
+        # the remaining pages (if any) are requested while iterating
+        return [[item for item in children] for children in result]
+
+    def _get_name(self, item):
+        """
+        :type item: office365.onedrive.driveitems.driveItem.DriveItem
+        """
+        return item.name
+
+    def _is_folder(self, item):
+        """
+        :type item: office365.onedrive.driveitems.driveItem.DriveItem
+        """
+        return item.is_folder
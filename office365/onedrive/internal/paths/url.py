@@ -14,8 +14,11 @@ class UrlPath(EntityPath):
 
     @property
     def collection(self):
-        while self.parent and self._collection is None:
-            self._collection = self.parent.collection
+        if self._collection is None:
+            if isinstance(self.parent, EntityPath):
+                self._collection = self.parent.collection
+            else:
+                self._collection = self.parent.parent
         return self._collection
 
     @property
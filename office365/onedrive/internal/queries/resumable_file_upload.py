@@ -2,28 +2,67 @@ import os
 
 from office365.onedrive.driveitems.drive_item_uploadable_properties import DriveItemUploadableProperties
 from office365.runtime.odata.v4.upload_session_request import UploadSessionRequest
-from office365.runtime.queries.upload_session import UploadSessionQuery
+from office365.runtime.queries.upload_session import UploadSessionQuery, UploadSessionStatusQuery
+from office365.runtime.transfers.mapped_file import open_upload_source
 
+_drive_item_hashes = {
+    "quickxor": ("quickXorHash", lambda h: h.base64digest()),
+    "sha1": ("sha1Hash", lambda h: h.hexdigest().upper()),
+    "sha256": ("sha256Hash", lambda h: h.hexdigest().upper()),
+}
 
-def create_resumable_file_upload_query(return_type, source_path, chunk_size, chunk_uploaded):
+
+def create_resumable_file_upload_query(return_type, source_path, chunk_size, chunk_uploaded, session_updated=None,
+                                       hash_object=None):
     """
     :type return_type: office365.onedrive.driveitems.driveItem.DriveItem
     :type source_path: str
     :type chunk_size: int
     :type chunk_uploaded: (int)->None
+    :type session_updated: (office365.runtime.odata.v4.upload_session.UploadSession)->None or None
+    :param hash_object: Hash object (hashlib compatible) the file content is hashed with while being uploaded
     """
     item = DriveItemUploadableProperties()
     item.name = os.path.basename(source_path)
     qry = UploadSessionQuery(return_type, {"item": item})
-    context = return_type.context
+    _upload_file_ranges(qry, source_path, chunk_size, chunk_uploaded, session_updated, hash_object)
+    return qry
+
+
+def create_resumed_file_upload_query(return_type, source_path, upload_url, chunk_size, chunk_uploaded,
+                                     session_updated=None, hash_object=None):
+    """
+    :type return_type: office365.onedrive.driveitems.driveItem.DriveItem
+    :type source_path: str
+    :type upload_url: str
+    :type chunk_size: int
+    :type chunk_uploaded: (int)->None
+    :type session_updated: (office365.runtime.odata.v4.upload_session.UploadSession)->None or None
+    :param hash_object: Hash object (hashlib compatible) the file content is hashed with while being uploaded
+    """
+    qry = UploadSessionStatusQuery(return_type, upload_url)
+    _upload_file_ranges(qry, source_path, chunk_size, chunk_uploaded, session_updated, hash_object)
+    return qry
+
+
+def _upload_file_ranges(qry, source_path, chunk_size, chunk_uploaded, session_updated, hash_object):
+    """
+    Uploads the ranges of a file the upload session is still expecting. Once the upload is completed,
+    the content hash gets verified against the one computed by the server (if exposed)
+
+    :type qry: UploadSessionQuery or UploadSessionStatusQuery
+    """
+    context = qry.context
 
     def _upload_session(resp):
         """
         :type resp: requests.Response
         """
         resp.raise_for_status()
-        with open(source_path, 'rb') as source_file:
-            session_request = UploadSessionRequest(context, source_file, chunk_size)
+        if callable(session_updated):
+            session_updated(qry.return_type.value)
+        with open_upload_source(source_path) as source_file:
+            session_request = UploadSessionRequest(context, source_file, chunk_size, hash_object)
             session_request.add_query(qry)
 
             def _process_response(response):
@@ -33,8 +72,27 @@ def create_resumable_file_upload_query(return_type, source_path, chunk_size, chu
                 response.raise_for_status()
                 if callable(chunk_uploaded):
                     chunk_uploaded(session_request.range_end)
+                if callable(session_updated):
+                    session_updated(qry.return_type.value)
+                if hash_object is not None and response.status_code in (200, 201):
+                    _verify_hash(hash_object, (response.json().get("file") or {}).get("hashes") or {})
             session_request.afterExecute += _process_response
             session_request.execute_query()
     context.after_execute(_upload_session)
-    return qry
 
+
+def _verify_hash(hash_object, hashes):
+    """
+    Compares the digest of uploaded content with the corresponding hash computed by the server
+
+    :param hash_object: Hash object (hashlib compatible)
+    :param dict hashes: Hashes of the uploaded file (microsoft.graph.hashes)
+    """
+    hash_name, get_digest = _drive_item_hashes.get(hash_object.name, (None, None))
+    expected_value = hashes.get(hash_name, None)
+    if expected_value is None:
+        return
+    actual_value = get_digest(hash_object)
+    if actual_value != (expected_value if hash_name == "quickXorHash" else expected_value.upper()):
+        raise ValueError("Content hash mismatch: {0} computed locally, {1} returned by the server".format(
+            actual_value, expected_value))
@@ -0,0 +1,84 @@
+import base64
+
+
+class QuickXorHash(object):
+    """
+    QuickXorHash is the hash algorithm used by OneDrive for Business and SharePoint to expose
+    a hash of the file content via file.hashes.quickXorHash property.
+
+    The hash is a 160-bit circular register: every input byte is XOR-ed into the register shifted
+    by 11 bits more than the preceding byte, the total length is XOR-ed into the last 8 bytes at the end.
+    Since the shift wraps around after 160 bytes, all bytes at the same position modulo 160 are folded
+    together first which keeps the hashing of large chunks in C big integer operations.
+
+    The interface follows the one from hashlib.
+    """
+
+    name = "quickxor"
+    digest_size = 20
+    block_size = 160
+    _shift = 11
+    _mask = (1 << 160) - 1
+
+    def __init__(self, data=None):
+        self._register = 0
+        self._length = 0
+        if data is not None:
+            self.update(data)
+
+    def update(self, data):
+        """
+        :type data: bytes or bytearray or memoryview
+        """
+        size = len(data)
+        if size == 0:
+            return
+        remainder = size % self.block_size
+        if remainder:
+            data = bytes(data) + bytes(self.block_size - remainder)
+        folded = self._fold(data)
+        for index, value in enumerate(folded):
+            if value:
+                offset = ((self._length + index) * self._shift) % 160
+                shifted = value << offset
+                self._register ^= (shifted & self._mask) ^ (shifted >> 160)
+        self._length += size
+
+    def digest(self):
+        result = bytearray(self._register.to_bytes(self.digest_size, "little"))
+        for i, value in enumerate(self._length.to_bytes(8, "little")):
+            result[self.digest_size - 8 + i] ^= value
+        return bytes(result)
+
+    def base64digest(self):
+        """Returns the digest in the form exposed by OneDrive"""
+        return base64.b64encode(self.digest()).decode("ascii")
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+    def copy(self):
+        other = QuickXorHash()
+        other._register = self._register
+        other._length = self._length
+        return other
+
+    def _fold(self, data):
+        """
+        XOR-s all 160 bytes long blocks of data together
+
+        :type data: bytes or bytearray or memoryview
+        """
+        block_bits = self.block_size * 8
+        blocks = len(data) // self.block_size
+        value = int.from_bytes(data, "big")
+        result = 0
+        while blocks > 1:
+            if blocks % 2:
+                result ^= value & ((1 << block_bits) - 1)
+                value >>= block_bits
+                blocks -= 1
+            half_bits = blocks // 2 * block_bits
+            value = (value >> half_bits) ^ (value & ((1 << half_bits) - 1))
+            blocks //= 2
+        return (result ^ value).to_bytes(self.block_size, "big")
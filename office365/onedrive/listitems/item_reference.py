@@ -4,7 +4,7 @@ from office365.runtime.client_value import ClientValue
 class ItemReference(ClientValue):
     """The ItemReference resource provides information necessary to address a DriveItem via the API."""
 
-    def __init__(self, name=None, path=None, drive_type=None, site_id=None):
+    def __init__(self, name=None, path=None, drive_type=None, site_id=None, drive_id=None, _id=None):
         """
         :param str name: The name of the item being referenced. Read-only.
         :param str path: Path that can be used to navigate to the item. Read-only.
@@ -13,9 +13,13 @@ class ItemReference(ClientValue):
             that contains the parent document library of the driveItem resource. The value is the same as the id
             property of that site resource. It is an opaque string that consists of three identifiers of the site.
             For OneDrive, this property is not populated.
+        :param str drive_id: Unique identifier of the drive instance that contains the driveItem. Read-only.
+        :param str _id: Unique identifier of the driveItem in the drive. Read-only.
         """
         super(ItemReference, self).__init__()
         self.name = name
         self.path = path
         self.driveType = drive_type
         self.siteId = site_id
+        self.driveId = drive_id
+        self.id = _id
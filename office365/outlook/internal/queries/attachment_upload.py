@@ -1,18 +1,21 @@
-from office365.runtime.compat import parse_query_string
+from office365.runtime.compat import parse_query_string, is_string_type
 from office365.runtime.odata.v4.upload_session_request import UploadSessionRequest
 from office365.outlook.mail.attachments.attachment_item import AttachmentItem
 from office365.runtime.queries.upload_session import UploadSessionQuery
+from office365.runtime.transfers.mapped_file import open_upload_source
 
 
-def create_attachment_upload_query(binding_type, return_type, source_path, chunk_size=1000000, chunk_uploaded=None):
+def create_attachment_upload_query(binding_type, return_type, source, chunk_size=1000000, chunk_uploaded=None,
+                                   name=None):
     """
     :type binding_type: office365.outlook.mail.attachments.collection.AttachmentCollection
     :type return_type: FileAttachment
-    :type source_path: str
+    :param str or typing.IO source: Local file path or a file object opened in binary mode
     :type chunk_size: int
     :type chunk_uploaded: (int)->None
+    :type name: str or None
     """
-    qry = UploadSessionQuery(binding_type, {"AttachmentItem": AttachmentItem.create_file(source_path)})
+    qry = UploadSessionQuery(binding_type, {"AttachmentItem": AttachmentItem.create_file(source, name)})
     context = binding_type.context
 
     def _upload_session(resp):
@@ -20,30 +23,36 @@ def create_attachment_upload_query(binding_type, return_type, source_path, chunk
         :type resp: requests.Response
         """
         resp.raise_for_status()
-        with open(source_path, 'rb') as source_file:
-            session_request = UploadSessionRequest(context, source_file, chunk_size)
-            session_request.add_query(qry)
-
-            def _construct_request(request):
-                auth_token = parse_query_string(request.url, "authtoken")
-                request.set_header('Authorization', 'Bearer {0}'.format(auth_token))
-
-            session_request.beforeExecute += _construct_request
-
-            def _process_response(response):
-                """
-                :type response: requests.Response
-                """
-                if callable(chunk_uploaded):
-                    chunk_uploaded(session_request.range_end)
-                location = response.headers.get("Location", None)
-                if location is None:
-                    return
-                attachment_id = location[location.find("Attachments(") + 13:-2]
-                return_type.set_property("id", attachment_id)
-
-            session_request.afterExecute += _process_response
-            session_request.execute_query()
+        if is_string_type(source):
+            with open_upload_source(source) as source_file:
+                _upload_file(source_file)
+        else:
+            _upload_file(source)
+
+    def _upload_file(source_file):
+        session_request = UploadSessionRequest(context, source_file, chunk_size)
+        session_request.add_query(qry)
+
+        def _construct_request(request):
+            auth_token = parse_query_string(request.url, "authtoken")
+            request.set_header('Authorization', 'Bearer {0}'.format(auth_token))
+
+        session_request.beforeExecute += _construct_request
+
+        def _process_response(response):
+            """
+            :type response: requests.Response
+            """
+            if callable(chunk_uploaded):
+                chunk_uploaded(session_request.range_end)
+            location = response.headers.get("Location", None)
+            if location is None:
+                return
+            attachment_id = location[location.find("Attachments(") + 13:-2]
+            return_type.set_property("id", attachment_id)
+
+        session_request.afterExecute += _process_response
+        session_request.execute_query()
 
     context.after_execute(_upload_session)
     return qry
@@ -1,6 +1,7 @@
 import os
 
 from office365.runtime.client_value import ClientValue
+from office365.runtime.compat import is_string_type
 
 
 class AttachmentItem(ClientValue):
@@ -18,8 +19,19 @@ class AttachmentItem(ClientValue):
         self.size = size
 
     @staticmethod
-    def create_file(path):
-        file_name = os.path.basename(path)
-        file_size = os.stat(path).st_size
+    def create_file(source, name=None):
+        """
+        :param str or typing.IO source: Local file path or a file object opened in binary mode
+        :param str or None name: Attachment name, by default the file name is used
+        """
         from office365.outlook.mail.attachments.attachment_type import AttachmentType
-        return AttachmentItem(attachment_type=AttachmentType.file, name=file_name, size=file_size)
+        if is_string_type(source):
+            file_name = os.path.basename(source)
+            file_size = os.stat(source).st_size
+        else:
+            file_name = os.path.basename(getattr(source, "name", ""))
+            position = source.tell()
+            source.seek(0, os.SEEK_END)
+            file_size = source.tell()
+            source.seek(position)
+        return AttachmentItem(attachment_type=AttachmentType.file, name=name or file_name, size=file_size)
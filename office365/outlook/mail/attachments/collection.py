@@ -3,12 +3,16 @@ import base64
 from office365.entity_collection import EntityCollection
 from office365.outlook.internal.queries.attachment_upload import create_attachment_upload_query
 from office365.outlook.mail.attachments.attachment import Attachment
+from office365.runtime.compat import is_string_type
 from office365.runtime.queries.upload_session import UploadSessionQuery
 
 
 class AttachmentCollection(EntityCollection):
     """Attachment collection"""
 
+    inline_size_limit = 1000000 * 3
+    """Maximum size (in bytes) of a file which could be attached inline, larger ones require an upload session"""
+
     def __init__(self, context, resource_path=None):
         super(AttachmentCollection, self).__init__(context, Attachment, resource_path)
 
@@ -18,31 +22,33 @@ class AttachmentCollection(EntityCollection):
 
         :param str name: The name representing the text that is displayed below the icon representing the
              embedded attachment
-        :param str content: The contents of the file
+        :param str or bytes or typing.IO content: The contents of the file. A file object is read and encoded
+             in chunks, so no raw copy of the whole content is kept in memory
         :param str or None content_type: The content type of the attachment.
         """
         from office365.outlook.mail.attachments.file import FileAttachment
         return_type = FileAttachment(self.context)
         return_type.name = name
-        return_type.content_bytes = base64.b64encode(content.encode("utf-8")).decode("utf-8")
+        return_type.content_bytes = self._encode_content(content)
         return_type.content_type = content_type
         self.add_child(return_type)
         return self
 
-    def resumable_upload(self, source_path, chunk_size=1000000, chunk_uploaded=None):
+    def resumable_upload(self, source, chunk_size=1000000, chunk_uploaded=None, name=None):
         """
         Create an upload session to allow your app to upload files up to the maximum file size.
         An upload session allows your app to upload ranges of the file in sequential API requests,
         which allows the transfer to be resumed if a connection is dropped while the upload is in progress.
 
-        :param str source_path: Local file path
+        :param str or typing.IO source: Local file path or a file object opened in binary mode
         :param int chunk_size: File chunk size
         :param (int)->None chunk_uploaded: Upload action
+        :param str or None name: Attachment name, by default the file name is used
         """
         from office365.outlook.mail.attachments.file import FileAttachment
         return_type = FileAttachment(self.context)
         self.add_child(return_type)
-        qry = create_attachment_upload_query(self, return_type, source_path, chunk_size, chunk_uploaded)
+        qry = create_attachment_upload_query(self, return_type, source, chunk_size, chunk_uploaded, name)
         self.context.add_query(qry)
         return self
 
@@ -56,3 +62,31 @@ class AttachmentCollection(EntityCollection):
         qry = UploadSessionQuery(self, {"AttachmentItem": attachment_item})
         self.context.add_query(qry)
         return qry.return_type
+
+    @staticmethod
+    def _encode_content(content, chunk_size=3 * 256 * 1024):
+        """
+        Base64-encodes the content, a file object is consumed in chunks aligned to 3 bytes,
+        so that encoded chunks could be concatenated without padding in between
+
+        :type content: str or bytes or typing.IO
+        :type chunk_size: int
+        :rtype: str
+        """
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return base64.b64encode(content).decode("ascii")
+        if is_string_type(content):
+            return base64.b64encode(content.encode("utf-8")).decode("ascii")
+
+        encoded = []
+        remainder = b""
+        while True:
+            chunk = content.read(chunk_size)
+            if not chunk:
+                break
+            chunk = remainder + chunk
+            aligned_size = len(chunk) - len(chunk) % 3
+            encoded.append(base64.b64encode(chunk[:aligned_size]).decode("ascii"))
+            remainder = chunk[aligned_size:]
+        encoded.append(base64.b64encode(remainder).decode("ascii"))
+        return "".join(encoded)
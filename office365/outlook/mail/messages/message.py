@@ -8,6 +8,7 @@ from office365.outlook.mail.itemBody import ItemBody
 from office365.outlook.mail.recipient import Recipient
 from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value_collection import ClientValueCollection
+from office365.runtime.compat import is_string_type
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.runtime.paths.resource_path import ResourcePath
@@ -56,30 +57,39 @@ class Message(OutlookItem):
 
         :param str name: The name representing the text that is displayed below the icon representing the
              embedded attachment
-        :param str content: The contents of the file
+        :param str or bytes or typing.IO content: The contents of the file
         :param str or None content_type: The content type of the attachment.
         """
         self.attachments.add_file(name, content, content_type)
         return self
 
-    def upload_attachment(self, file_path, chunk_uploaded=None):
+    def upload_attachment(self, file_path, chunk_uploaded=None, content_type=None):
         """
         This approach is used to attach a file if the file size is between 3 MB and 150 MB, otherwise
         if a file that's smaller than 3 MB, then add_file_attachment method is utilized
 
-        :param str file_path:
+        :param str or typing.IO file_path: Local file path or a file object opened in binary mode
         :param ()->None chunk_uploaded: Upload action
+        :param str or None content_type: The content type of the attachment (applies to a small file only)
         """
-        max_upload_chunk = 1000000 * 3
-        file_size = os.stat(file_path).st_size
+        max_upload_chunk = AttachmentCollection.inline_size_limit
+        if is_string_type(file_path):
+            file_size = os.stat(file_path).st_size
+        else:
+            position = file_path.tell()
+            file_path.seek(0, os.SEEK_END)
+            file_size = file_path.tell()
+            file_path.seek(position)
         if file_size > max_upload_chunk:
             def _message_loaded():
                 self.attachments.resumable_upload(file_path, max_upload_chunk, chunk_uploaded)
             self.ensure_property("id", _message_loaded)
-        else:
+        elif is_string_type(file_path):
             with open(file_path, 'rb') as file_object:
-                content = file_object.read()
-            self.attachments.add_file(os.path.basename(file_object.name), content.decode("utf-8"))
+                self.attachments.add_file(os.path.basename(file_path), file_object, content_type)
+        else:
+            name = os.path.basename(getattr(file_path, "name", ""))
+            self.attachments.add_file(name, file_path, content_type)
         return self
 
     def send(self):
@@ -18,6 +18,16 @@ class AuthenticationContext(object):
         self.url = url.rstrip("/")
         self._provider = None
 
+    def clone(self, url):
+        """Creates an authentication context for another web of the same host which shares the token provider
+        (and the acquired token) with the current one
+
+        :param str url: Absolute Web or Site Url
+        """
+        auth_context = AuthenticationContext(url)
+        auth_context._provider = self._provider
+        return auth_context
+
     def with_client_certificate(self, tenant, client_id, thumbprint, cert_path, **kwargs):
         """Creates authenticated SharePoint context via certificate credentials
 
@@ -22,24 +22,28 @@ class ClientObjectCollection(ClientObject):
         self._paged_mode = False
         self._current_pos = None
         self._next_request_url = None
+        self._delta_request_url = None
 
     def clear(self):
         if not self._paged_mode:
             self._data = []
         self._next_request_url = None
+        self._delta_request_url = None
         self._current_pos = len(self._data)
         return self
 
-    def create_typed_object(self, initial_properties=None, resource_path=None):
+    def create_typed_object(self, initial_properties=None, resource_path=None, item_type=None):
         """
         :type initial_properties: dict[str, P_T] or None
         :type resource_path: office365.runtime.paths.resource_path.ResourcePath or None
+        :param type[ClientObject] or None item_type: Type of the object, the item type of the collection by default
         """
         if initial_properties is None:
             initial_properties = {}
         if self._item_type is None:
             raise AttributeError("No class model for entity type '{0}' was found".format(self._item_type))
-        client_object = self._item_type(context=self.context, resource_path=resource_path)  # type: ClientObject
+        item_type = item_type or self._item_type
+        client_object = item_type(context=self.context, resource_path=resource_path)  # type: ClientObject
         [client_object.set_property(k, v) for k, v in initial_properties.items() if v is not None]
         return client_object
 
@@ -51,12 +55,26 @@ class ClientObjectCollection(ClientObject):
         """
         if key == "__nextLinkUrl":
             self._next_request_url = value
+        elif key == "__deltaLinkUrl":
+            self._delta_request_url = value
         else:
-            client_object = self.create_typed_object()
+            client_object = self.create_typed_object(item_type=self._resolve_item_type(value))
             self.add_child(client_object)
             [client_object.set_property(k, v, persist_changes) for k, v in value.items()]
         return self
 
+    def _resolve_item_type(self, value):
+        """
+        Resolves the type of the item from its type annotation if type resolution is enabled
+
+        :type value: dict
+        """
+        type_name = getattr(value, "type_name", None)
+        registry = self.context.model_registry
+        if type_name is None or registry is None or self._item_type is None:
+            return None
+        return registry.resolve_type(self.context, self._item_type, type_name)
+
     def add_child(self, client_object):
         """
         Adds client object into collection
@@ -1,3 +1,4 @@
+import time
 from abc import abstractmethod
 
 import requests
@@ -5,6 +6,9 @@ from requests import HTTPError
 
 from office365.runtime.client_request_exception import ClientRequestException
 from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.instrumentation.profiler import profile_query, profile_stage
+from office365.runtime.instrumentation.query_metrics import QueryMetrics
+from office365.runtime.queries.read_entity import ReadEntityQuery
 from office365.runtime.types.event_handler import EventHandler
 
 
@@ -19,6 +23,8 @@ class ClientRequest(object):
         self._context = context
         self._queries = []
         self._current_query = None
+        self._queued_at = {}
+        self.throttle_delay = 0
         self.beforeExecute = EventHandler()
         self.afterExecute = EventHandler()
 
@@ -39,13 +45,21 @@ class ClientRequest(object):
         """
         self._current_query = query
         self._queries.append(query)
+        if self.is_instrumented:
+            self._queued_at[query.id] = time.time()
         return self
 
     def clear(self):
         self._current_query = None
         self._queries = []
+        self._queued_at = {}
         return self
 
+    @property
+    def is_instrumented(self):
+        """Determines whether metrics of executed queries are collected"""
+        return len(self.context.queryExecuted) > 0
+
     @abstractmethod
     def build_request(self, query):
         """
@@ -68,15 +82,69 @@ class ClientRequest(object):
         Submits a pending request to the server
         """
         for qry in self:
+            started = time.time()
+            request = None
+            response = None
+            request_time = None
+            succeeded = False
+            profiler = self.context.profiler
             try:
-                request = self.build_request(qry)
-                self.beforeExecute.notify(request)
-                response = self.execute_request_direct(request)
-                response.raise_for_status()
-                self.process_response(response)
-                self.afterExecute.notify(response)
+                with profile_query(profiler, qry):
+                    with profile_stage(profiler, "build_request"):
+                        request = self.build_request(qry)
+                        self.beforeExecute.notify(request)
+                        cache_key = self._get_cache_key(qry, request)
+                        cached = self.context.response_cache.get(cache_key) if cache_key else None
+                        if self.context.response_cache is not None and request.method != HttpMethod.Get:
+                            # the resource is about to be modified (updated, deleted or acted upon)
+                            self.context.response_cache.invalidate_url(request.url)
+                        if cached is not None:
+                            request.set_header("If-None-Match", cached.etag)
+                    request_started = time.time()
+                    with profile_stage(profiler, "network"):
+                        response = self.execute_request_direct(request)
+                    request_time = time.time() - request_started
+                    if cached is not None and response.status_code == 304:
+                        response = cached.to_response(response)
+                    elif cache_key and response.status_code == 200:
+                        self.context.response_cache.add(cache_key, response)
+                    response.raise_for_status()
+                    with profile_stage(profiler, "map"):
+                        self.process_response(response)
+                        self.afterExecute.notify(response)
+                succeeded = True
             except HTTPError as e:
                 raise ClientRequestException(*e.args, response=e.response)
+            finally:
+                if self.is_instrumented:
+                    metrics = QueryMetrics.create(self.context, qry, request, response)
+                    metrics.started = started
+                    metrics.succeeded = succeeded
+                    metrics.request_time = request_time
+                    metrics.total_time = time.time() - started
+                    metrics.throttle_delay = self.throttle_delay
+                    queued_at = self._queued_at.pop(qry.id, None)
+                    if queued_at is not None:
+                        metrics.queue_wait = started - queued_at
+                    self.context.queryExecuted.notify(metrics)
+                self.throttle_delay = 0
+
+    def _get_cache_key(self, query, request):
+        """
+        Returns the key the response is cached with, only reads of single entities are cached
+
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        :type request: office365.runtime.http.request_options.RequestOptions
+        :rtype: str or None
+        """
+        if self.context.response_cache is None or not isinstance(query, ReadEntityQuery):
+            return None
+        if request.method != HttpMethod.Get or request.stream:
+            return None
+        from office365.runtime.client_object_collection import ClientObjectCollection
+        if isinstance(query.return_type, ClientObjectCollection):
+            return None
+        return "{0} {1}".format(request.url, request.headers.get("Accept", ""))
 
     def execute_request_direct(self, request):
         """Execute the client request
@@ -84,48 +152,50 @@ class ClientRequest(object):
         :type request: office365.runtime.http.request_options.RequestOptions
         """
         self.context.authenticate_request(request)
+        # requests are sent through the session (and its connection pool) shared by the contexts, if any
+        http = self.context.session if self.context.session is not None else requests
         if request.method == HttpMethod.Post:
             if request.is_bytes or request.is_file:
-                response = requests.post(url=request.url,
-                                         headers=request.headers,
-                                         data=request.data,
-                                         auth=request.auth,
-                                         verify=request.verify,
-                                         proxies=request.proxies)
+                response = http.post(url=request.url,
+                                     headers=request.headers,
+                                     data=request.data,
+                                     auth=request.auth,
+                                     verify=request.verify,
+                                     proxies=request.proxies)
             else:
-                response = requests.post(url=request.url,
-                                         headers=request.headers,
-                                         json=request.data,
-                                         auth=request.auth,
-                                         verify=request.verify,
-                                         proxies=request.proxies)
+                response = http.post(url=request.url,
+                                     headers=request.headers,
+                                     json=request.data,
+                                     auth=request.auth,
+                                     verify=request.verify,
+                                     proxies=request.proxies)
         elif request.method == HttpMethod.Patch:
-            response = requests.patch(url=request.url,
-                                      headers=request.headers,
-                                      json=request.data,
-                                      auth=request.auth,
-                                      verify=request.verify,
-                                      proxies=request.proxies)
+            response = http.patch(url=request.url,
+                                  headers=request.headers,
+                                  json=request.data,
+                                  auth=request.auth,
+                                  verify=request.verify,
+                                  proxies=request.proxies)
         elif request.method == HttpMethod.Delete:
-            response = requests.delete(url=request.url,
-                                       headers=request.headers,
-                                       auth=request.auth,
-                                       verify=request.verify,
-                                       proxies=request.proxies)
+            response = http.delete(url=request.url,
+                                   headers=request.headers,
+                                   auth=request.auth,
+                                   verify=request.verify,
+                                   proxies=request.proxies)
         elif request.method == HttpMethod.Put:
-            response = requests.put(url=request.url,
-                                    data=request.data,
-                                    headers=request.headers,
-                                    auth=request.auth,
-                                    verify=request.verify,
-                                    proxies=request.proxies)
+            response = http.put(url=request.url,
+                                data=request.data,
+                                headers=request.headers,
+                                auth=request.auth,
+                                verify=request.verify,
+                                proxies=request.proxies)
         else:
-            response = requests.get(url=request.url,
-                                    headers=request.headers,
-                                    auth=request.auth,
-                                    verify=request.verify,
-                                    stream=request.stream,
-                                    proxies=request.proxies)
+            response = http.get(url=request.url,
+                                headers=request.headers,
+                                auth=request.auth,
+                                verify=request.verify,
+                                stream=request.stream,
+                                proxies=request.proxies)
         return response
 
     def __iter__(self):
@@ -6,7 +6,7 @@ class ClientResult(object):
         Client result
 
         :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
-        :type default_value: int or str or bool or office365.runtime.client_value.ClientValue
+        :type default_value: int or str or bool or dict or office365.runtime.client_value.ClientValue
         """
         self._context = context
         self._value = default_value
@@ -15,6 +15,8 @@ class ClientResult(object):
         from office365.runtime.client_value import ClientValue
         if isinstance(self.value, ClientValue):
             self.value.set_property(key, value, persist_changes)
+        elif isinstance(self.value, dict):
+            self.value[key] = value
         else:
             self._value = value
 
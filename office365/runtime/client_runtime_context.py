@@ -5,13 +5,25 @@ from office365.runtime.client_request_exception import ClientRequestException
 from office365.runtime.client_result import ClientResult
 from office365.runtime.compat import is_absolute_url
 from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.response_cache import ResponseCache
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.instrumentation.profiler import QueryProfiler
 from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.read_entity import ReadEntityQuery
+from office365.runtime.types.event_handler import SharedEventHandler
 
 
 class ClientRuntimeContext(object):
 
+    def __init__(self):
+        # notified with QueryMetrics once a query is executed, listeners are shared with the clones
+        self.queryExecuted = SharedEventHandler()
+        self.profiler = None
+        # requests.Session used to send the requests (instead of a new connection per request), shared with the clones
+        self.session = None
+        self.response_cache = None
+        self.model_registry = None
+
     def build_request(self, query):
         """
         Builds a request
@@ -43,6 +55,55 @@ class ClientRuntimeContext(object):
                 if callable(failure_callback):
                     failure_callback(retry, e)
                 sleep(timeout_secs)
+                response = getattr(e, "response", None)
+                if response is not None and response.status_code in (429, 503):
+                    self.pending_request().throttle_delay += timeout_secs
+
+    def enable_profiling(self):
+        """
+        Starts profiling of the query execution pipeline, the profiler is shared with the clones of the context
+
+        :rtype: office365.runtime.instrumentation.profiler.QueryProfiler
+        """
+        if self.profiler is None:
+            self.profiler = QueryProfiler()
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+        return self
+
+    def enable_response_cache(self, cache=None):
+        """
+        Starts caching responses of entity reads, cached entities are requested conditionally (If-None-Match)
+        and re-hydrated from the cache if not modified. The cache is shared with the clones of the context
+
+        :param ResponseCache or None cache: In-memory (default) or file cache
+        :rtype: ResponseCache
+        """
+        self.response_cache = cache or ResponseCache()
+        return self.response_cache
+
+    def disable_response_cache(self):
+        self.response_cache = None
+        return self
+
+    def enable_type_resolution(self, registry=None):
+        """
+        Starts resolving types of entities from the type annotations of the payload (e.g. items of a collection
+        are materialized as derived types) using the $metadata model of the service. The registry is shared
+        with the clones of the context
+
+        :param office365.runtime.odata.model_registry.ODataModelRegistry or None registry: Keeps parsed models
+        :rtype: office365.runtime.odata.model_registry.ODataModelRegistry
+        """
+        from office365.runtime.odata.model_registry import ODataModelRegistry
+        self.model_registry = registry or ODataModelRegistry()
+        return self.model_registry
+
+    def disable_type_resolution(self):
+        self.model_registry = None
+        return self
 
     @abc.abstractmethod
     def pending_request(self):
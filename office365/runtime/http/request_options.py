@@ -24,7 +24,7 @@ class RequestOptions(object):
 
     @property
     def is_bytes(self):
-        return hasattr(self.data, 'decode') and callable(self.data.decode)
+        return (hasattr(self.data, 'decode') and callable(self.data.decode)) or isinstance(self.data, memoryview)
 
     def set_header(self, name, value):
         self.headers[name] = value
@@ -0,0 +1,215 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CachedResponse(object):
+    """Response of an entity read kept along with its ETag"""
+
+    def __init__(self, etag, headers, content, created=None):
+        """
+        :param str etag: Entity tag the response is validated with
+        :param dict headers: Response headers
+        :param bytes content: Response body
+        :param float or None created: Time the response was cached at
+        """
+        self.etag = etag
+        self.headers = headers
+        self.content = content
+        self.created = created or time.time()
+
+    @staticmethod
+    def from_response(response):
+        """
+        Creates a cached response unless the entity tag is not available, the tag is taken from the ETag header
+        or from the odata.etag annotation (or __metadata.etag in verbose JSON) of the entity
+
+        :type response: requests.Response
+        :rtype: CachedResponse or None
+        """
+        etag = response.headers.get("ETag", None)
+        if etag is None and response.headers.get("Content-Type", "").lower().startswith("application/json"):
+            payload = response.json()
+            if isinstance(payload, dict) and isinstance(payload.get("d", None), dict):
+                payload = payload["d"]
+                etag = None if "results" in payload else payload.get("__metadata", {}).get("etag", None)
+            elif isinstance(payload, dict) and "value" not in payload:
+                etag = payload.get("@odata.etag", None)
+        if etag is None:
+            return None
+        return CachedResponse(etag, dict(response.headers), response.content)
+
+    def to_response(self, not_modified_response):
+        """
+        Creates a response (as if it has been returned by the server) from the cached one
+
+        :param requests.Response not_modified_response: 304 Not Modified response
+        :rtype: requests.Response
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = self.content
+        response.url = not_modified_response.url
+        response.request = not_modified_response.request
+        response.elapsed = not_modified_response.elapsed
+        return response
+
+
+class ResponseCache(object):
+    """
+    Keeps responses of entity reads in memory, the least recently used ones are evicted once the maximum number
+    of entries is reached. Cached entities are requested with If-None-Match header and are re-hydrated from the
+    cache once the server responds with 304 Not Modified.
+    """
+
+    def __init__(self, max_entries=1000, ttl_secs=None):
+        """
+        :param int max_entries: Maximum number of cached responses
+        :param int or None ttl_secs: Number of seconds a response is kept for
+        """
+        self.max_entries = max_entries
+        self.ttl_secs = ttl_secs
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        :param str key: Request url along with the accepted format
+        :rtype: CachedResponse or None
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            if item is None:
+                return None
+            if self.ttl_secs is not None and time.time() - item.created > self.ttl_secs:
+                self._delete(key)
+                return None
+            self._items[key] = item
+        return self._read(key, item)
+
+    def add(self, key, response):
+        """
+        Caches the response unless its entity tag is not available
+
+        :param str key: Request url along with the accepted format
+        :type response: requests.Response
+        """
+        item = CachedResponse.from_response(response)
+        if item is None:
+            return
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = self._write(key, item)
+            while len(self._items) > self.max_entries:
+                evicted_key, _ = self._items.popitem(last=False)
+                self._delete(evicted_key)
+
+    def invalidate(self, key=None):
+        """
+        Removes the cached response or all the responses if the key is not specified
+
+        :param str or None key: Request url along with the accepted format
+        """
+        with self._lock:
+            keys = list(self._items.keys()) if key is None else [key]
+            for k in keys:
+                if self._items.pop(k, None) is not None:
+                    self._delete(k)
+
+    def invalidate_url(self, url):
+        """
+        Removes the cached responses of the resource regardless of the query options and the accepted format
+
+        :param str url: Resource url
+        """
+        url = url.split("?", 1)[0]
+        with self._lock:
+            for key in list(self._items.keys()):
+                if key.split(" ", 1)[0].split("?", 1)[0] == url:
+                    del self._items[key]
+                    self._delete(key)
+
+    def _read(self, key, item):
+        """
+        :type key: str
+        :type item: CachedResponse
+        """
+        return item
+
+    def _write(self, key, item):
+        """
+        Stores the response and returns the item kept in memory
+
+        :type key: str
+        :type item: CachedResponse
+        """
+        return item
+
+    def _delete(self, key):
+        pass
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class FileResponseCache(ResponseCache):
+    """Keeps responses of entity reads in a directory, a file per response"""
+
+    def __init__(self, path, max_entries=1000, ttl_secs=None):
+        """
+        :param str path: Path to the directory
+        :param int max_entries: Maximum number of cached responses
+        :param int or None ttl_secs: Number of seconds a response is kept for
+        """
+        super(FileResponseCache, self).__init__(max_entries, ttl_secs)
+        self._path = path
+        if not os.path.exists(path):
+            os.makedirs(path)
+        names = [name for name in os.listdir(path) if name.endswith(".json")]
+        for name in sorted(names, key=lambda n: os.path.getmtime(os.path.join(path, n))):
+            with open(os.path.join(path, name), "r") as f:
+                data = json.load(f)
+            self._items[data["key"]] = CachedResponse(data["etag"], None, None, data["created"])
+
+    def _read(self, key, item):
+        try:
+            with open(self._get_file_path(key), "r") as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        return CachedResponse(data["etag"], data["headers"], base64.b64decode(data["content"]), data["created"])
+
+    def _write(self, key, item):
+        data = {
+            "key": key,
+            "etag": item.etag,
+            "headers": item.headers,
+            "content": base64.b64encode(item.content).decode("ascii"),
+            "created": item.created,
+        }
+        file_path = self._get_file_path(key)
+        with open(file_path + ".tmp", "w") as f:
+            json.dump(data, f)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(file_path + ".tmp", file_path)
+        return CachedResponse(item.etag, None, None, item.created)
+
+    def _delete(self, key):
+        file_path = self._get_file_path(key)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _get_file_path(self, key):
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._path, name + ".json")
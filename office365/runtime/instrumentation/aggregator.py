@@ -0,0 +1,112 @@
+import threading
+
+
+class QueryStats(object):
+    """Aggregated metrics of a group of queries"""
+
+    def __init__(self, key):
+        """
+        :param tuple key: Group key, (entity type name, query type, method, url template) by default
+        """
+        self.key = key
+        self.count = 0
+        self.failed = 0
+        self.throttled = 0
+        self.batched = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.queue_wait = 0.0
+        self.throttle_delay = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    @property
+    def average_time(self):
+        """
+        :rtype: float
+        """
+        timed = self.count - self.batched
+        return self.total_time / timed if timed > 0 else 0.0
+
+    def add(self, metrics):
+        """
+        :type metrics: office365.runtime.instrumentation.query_metrics.QueryMetrics
+        """
+        self.count += 1
+        if not metrics.succeeded:
+            self.failed += 1
+        if metrics.status_code in (429, 503):
+            self.throttled += 1
+        if metrics.total_time is None:
+            self.batched += 1
+        else:
+            self.total_time += metrics.total_time
+            self.max_time = max(self.max_time, metrics.total_time)
+        self.queue_wait += metrics.queue_wait or 0
+        self.throttle_delay += metrics.throttle_delay or 0
+        self.request_bytes += metrics.request_bytes or 0
+        self.response_bytes += metrics.response_bytes or 0
+
+    def __repr__(self):
+        return "{0}: {1} queries ({2} failed, {3} throttled), avg {4:.3f}s, max {5:.3f}s, {6}/{7} bytes".format(
+            " ".join(str(k) for k in self.key), self.count, self.failed, self.throttled, self.average_time,
+            self.max_time, self.request_bytes, self.response_bytes)
+
+
+class MetricsAggregator(object):
+    """
+    Aggregates metrics of executed queries in memory, could be attached to a context (and shared by its clones):
+
+        aggregator = MetricsAggregator()
+        ctx.queryExecuted += aggregator.add
+
+    Queries submitted within a $batch request are counted per query but timed as a part of the batch request.
+    """
+
+    def __init__(self, group_by=None):
+        """
+        :param (office365.runtime.instrumentation.query_metrics.QueryMetrics) -> tuple group_by: Returns the key
+            of the group the query belongs to
+        """
+        self._group_by = group_by or self._default_key
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def add(self, metrics):
+        """
+        :type metrics: office365.runtime.instrumentation.query_metrics.QueryMetrics
+        """
+        key = self._group_by(metrics)
+        with self._lock:
+            stats = self._stats.get(key, None)
+            if stats is None:
+                stats = self._stats[key] = QueryStats(key)
+            stats.add(metrics)
+
+    @property
+    def stats(self):
+        """
+        :rtype: list[QueryStats]
+        """
+        with self._lock:
+            return list(self._stats.values())
+
+    def slowest(self, count=10):
+        """
+        Returns the groups with the highest total time spent
+
+        :param int count: Number of groups to return
+        :rtype: list[QueryStats]
+        """
+        return sorted(self.stats, key=lambda s: s.total_time, reverse=True)[:count]
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    @staticmethod
+    def _default_key(metrics):
+        """
+        :type metrics: office365.runtime.instrumentation.query_metrics.QueryMetrics
+        """
+        return metrics.entity_type_name, metrics.query_type, metrics.method, metrics.url_template
@@ -0,0 +1,81 @@
+try:
+    from opentelemetry import metrics as otel_metrics, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:
+    raise ImportError("To export metrics to OpenTelemetry the package 'opentelemetry-api' needs to be installed.")
+
+
+class OpenTelemetryExporter(object):
+    """
+    Exports metrics of executed queries as OpenTelemetry spans and instruments (histograms), could be attached
+    to a context (and shared by its clones):
+
+        ctx.queryExecuted += OpenTelemetryExporter().export
+
+    Spans are recorded once the query is executed with the actual start and end time, queries submitted within
+    a $batch request are recorded with zero duration and the batch request is recorded separately.
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None, name="office365"):
+        """
+        :param opentelemetry.trace.TracerProvider tracer_provider: The global tracer provider is used if omitted
+        :param opentelemetry.metrics.MeterProvider meter_provider: The global meter provider is used if omitted
+        :param str name: Instrumentation scope name
+        """
+        self._tracer = trace.get_tracer(name, tracer_provider=tracer_provider)
+        meter = otel_metrics.get_meter(name, meter_provider=meter_provider)
+        self._duration = meter.create_histogram("office365.client.query.duration", unit="s",
+                                                description="Time spent on a query")
+        self._time_to_first_byte = meter.create_histogram("office365.client.query.time_to_first_byte", unit="s",
+                                                          description="Time elapsed until response headers received")
+        self._request_size = meter.create_histogram("office365.client.query.request.size", unit="By",
+                                                    description="Size of a request body")
+        self._response_size = meter.create_histogram("office365.client.query.response.size", unit="By",
+                                                     description="Size of a response body")
+        self._throttle_delay = meter.create_counter("office365.client.query.throttle_delay", unit="s",
+                                                    description="Time waited due to throttling")
+
+    def export(self, metrics):
+        """
+        :type metrics: office365.runtime.instrumentation.query_metrics.QueryMetrics
+        """
+        attributes = self._get_attributes(metrics)
+        span_attributes = dict(attributes)
+        if metrics.batch_id is not None:
+            span_attributes["office365.batch.id"] = metrics.batch_id
+        start_time = int(metrics.started * 1e9) if metrics.started is not None else None
+        span = self._tracer.start_span("{0} {1}".format(metrics.method or metrics.query_type, metrics.url_template),
+                                       kind=SpanKind.CLIENT, attributes=span_attributes, start_time=start_time)
+        if not metrics.succeeded:
+            span.set_status(Status(StatusCode.ERROR))
+        end_time = start_time
+        if start_time is not None and metrics.total_time is not None:
+            end_time = start_time + int(metrics.total_time * 1e9)
+        span.end(end_time=end_time)
+
+        if metrics.total_time is not None:
+            self._duration.record(metrics.total_time, attributes)
+        if metrics.time_to_first_byte is not None:
+            self._time_to_first_byte.record(metrics.time_to_first_byte, attributes)
+        if metrics.request_bytes is not None:
+            self._request_size.record(metrics.request_bytes, attributes)
+        if metrics.response_bytes is not None:
+            self._response_size.record(metrics.response_bytes, attributes)
+        if metrics.throttle_delay:
+            self._throttle_delay.add(metrics.throttle_delay, attributes)
+
+    @staticmethod
+    def _get_attributes(metrics):
+        """
+        Attributes of instruments, of low cardinality (batch identifier is attached to spans only)
+
+        :type metrics: office365.runtime.instrumentation.query_metrics.QueryMetrics
+        """
+        attributes = {
+            "http.request.method": metrics.method,
+            "http.response.status_code": metrics.status_code,
+            "url.template": metrics.url_template,
+            "office365.query.type": metrics.query_type,
+            "office365.entity_type": metrics.entity_type_name,
+        }
+        return dict((k, v) for k, v in attributes.items() if v is not None)
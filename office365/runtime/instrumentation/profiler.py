@@ -0,0 +1,195 @@
+import threading
+import time
+
+
+class _NullScope(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_null_scope = _NullScope()
+
+
+def profile_stage(profiler, name):
+    """
+    Returns a scope which accounts the time spent within it to the stage, no-op if profiling is disabled
+
+    :type profiler: QueryProfiler or None
+    :type name: str
+    """
+    return profiler.stage(name) if profiler is not None else _null_scope
+
+
+def profile_query(profiler, query):
+    """
+    Returns a scope which accounts the stages entered within it to the query
+
+    :type profiler: QueryProfiler or None
+    :type query: office365.runtime.queries.client_query.ClientQuery
+    """
+    return profiler.query(query) if profiler is not None else _null_scope
+
+
+class _StageScope(object):
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._profiler._enter_stage(self._name)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler._exit_stage()
+        return False
+
+
+class _QueryScope(object):
+
+    def __init__(self, profiler, query):
+        self._profiler = profiler
+        self._query = query
+
+    def __enter__(self):
+        self._profiler._enter_query(self._query)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._profiler._exit_query()
+        return False
+
+
+class QueryProfiler(object):
+    """
+    Profiles the query execution pipeline: the time spent in each stage is aggregated per entity type (the one
+    the query is bound to), so that the client side overhead could be told apart from the network time.
+
+    Stages:
+        build_request - building a request from a query (including event handlers invoked before it is submitted)
+        serialize - converting a payload (or a $batch request) into a JSON (or multipart) body
+        network - authenticating and submitting a request, receiving a response
+        parse - decoding a JSON (or multipart) response body
+        map - mapping a response into client objects (including event handlers invoked afterwards)
+
+    Times are exclusive, e.g. the serialization is not accounted to the request building, hence sum up to
+    the total time. Note the encoding of JSON payloads performed by requests is accounted to network stage.
+    The profiler is shared by a client context and its clones, contexts could be used from different threads.
+    """
+
+    stages = ["build_request", "serialize", "network", "parse", "map"]
+
+    def __init__(self):
+        self._stats = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def stage(self, name):
+        """
+        :param str name: Stage name
+        """
+        return _StageScope(self, name)
+
+    def query(self, query):
+        """
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        """
+        return _QueryScope(self, query)
+
+    @property
+    def stats(self):
+        """
+        Time (in seconds) spent per stage keyed by entity type name
+
+        :rtype: dict[str, dict[str, float]]
+        """
+        with self._lock:
+            return dict((key, dict(stages)) for key, stages in self._stats.items())
+
+    @property
+    def query_counts(self):
+        """
+        Number of executed queries keyed by entity type name
+
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def report(self):
+        """
+        Returns the stats formatted as a table ordered by the total time
+
+        :rtype: str
+        """
+        stats = self.stats
+        counts = self.query_counts
+        header = ["entity type", "queries"] + self.stages + ["total"]
+        rows = []
+        for key, stages in sorted(stats.items(), key=lambda kv: sum(kv[1].values()), reverse=True):
+            rows.append([key, str(counts.get(key, 0))] +
+                        ["{0:.3f}".format(stages.get(name, 0)) for name in self.stages] +
+                        ["{0:.3f}".format(sum(stages.values()))])
+        widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+        lines = ["  ".join(value.ljust(widths[i]) if i == 0 else value.rjust(widths[i])
+                           for i, value in enumerate(row)) for row in [header] + rows]
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._counts = {}
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def _frames(self):
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = self._local.frames = []
+        return frames
+
+    @property
+    def _keys(self):
+        keys = getattr(self._local, "keys", None)
+        if keys is None:
+            keys = self._local.keys = []
+        return keys
+
+    def _enter_query(self, query):
+        """
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        """
+        key = query.__class__.__name__
+        if query.binding_type is not None:
+            key = query.binding_type.entity_type_name or key
+        self._keys.append(key)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def _exit_query(self):
+        self._keys.pop()
+
+    def _enter_stage(self, name):
+        """
+        :type name: str
+        """
+        keys = self._keys
+        # [stage name, entity type name, time entered, time spent in nested stages]
+        self._frames.append([name, keys[-1] if keys else None, time.time(), 0.0])
+
+    def _exit_stage(self):
+        frames = self._frames
+        name, key, started, nested = frames.pop()
+        elapsed = time.time() - started
+        if frames:
+            frames[-1][3] += elapsed
+        with self._lock:
+            stages = self._stats.setdefault(key, {})
+            stages[name] = stages.get(name, 0) + elapsed - nested
@@ -0,0 +1,119 @@
+import re
+
+from office365.runtime.queries.batch import BatchQuery
+
+_guid_pattern = re.compile(r"^[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
+_parentheses_pattern = re.compile(r"\([^)]*\)")
+
+
+def get_url_template(url, service_root_url=None):
+    """
+    Normalizes the url of a query so that queries addressing different entities of the same type are grouped:
+    query string is removed, arguments of functions and keys as well as identifiers within the path
+    (numbers, GUIDs, Graph identifiers) are replaced with placeholders
+
+    :type url: str
+    :type service_root_url: str or None
+    :rtype: str
+    """
+    url = url.split("?", 1)[0]
+    if service_root_url and url.startswith(service_root_url):
+        url = url[len(service_root_url):]
+    segments = []
+    for segment in _parentheses_pattern.sub("(?)", url).split("/"):
+        if segment.isdigit() or _guid_pattern.match(segment) or segment.startswith("b!") or \
+                (len(segment) >= 16 and any(c.isdigit() for c in segment) and "(" not in segment):
+            segment = "{id}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class QueryMetrics(object):
+    """
+    Describes an executed query: timings (in seconds), sizes (in bytes) and outcome.
+
+    time_to_first_byte is the time between the request was sent and the response headers were received,
+    request_time includes the download of the response body while total_time includes the construction of
+    the request and the processing of the response as well. queue_wait is the time between the query was added
+    and its execution started, throttle_delay is the time waited before the query was resubmitted once throttled.
+    Queries submitted within a $batch request share the batch_id (the boundary of the batch request).
+    """
+
+    def __init__(self, query_type, entity_type_name=None, method=None, url_template=None):
+        """
+        :param str query_type: Query class name, e.g. ReadEntityQuery
+        :param str or None entity_type_name: Entity type name of the object the query is bound to
+        :param str or None method: HTTP method (X-HTTP-Method if specified)
+        :param str or None url_template: Request url with identifiers replaced, see get_url_template
+        """
+        self.query_type = query_type
+        self.entity_type_name = entity_type_name
+        self.method = method
+        self.url_template = url_template
+        self.status_code = None
+        self.succeeded = False
+        self.started = None
+        self.queue_wait = None
+        self.time_to_first_byte = None
+        self.request_time = None
+        self.total_time = None
+        self.request_bytes = None
+        self.response_bytes = None
+        self.throttle_delay = 0
+        self.batch_id = None
+
+    @staticmethod
+    def create(context, query, request=None, response=None):
+        """
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        :type request: office365.runtime.http.request_options.RequestOptions or None
+        :type response: requests.Response or None
+        """
+        entity_type_name = None
+        if query.binding_type is not None:
+            entity_type_name = query.binding_type.entity_type_name
+        method = None
+        url = query.url
+        if request is not None:
+            method = request.headers.get("X-HTTP-Method", request.method)
+            url = request.url
+        metrics = QueryMetrics(query.__class__.__name__, entity_type_name, method,
+                               get_url_template(url, context.service_root_url()))
+        if isinstance(query, BatchQuery):
+            metrics.batch_id = query.current_boundary
+        if response is not None:
+            metrics.status_code = response.status_code
+            metrics.response_bytes = QueryMetrics._get_response_size(response)
+            # responses of $batch parts are not bound to a request
+            if response.request is not None:
+                metrics.time_to_first_byte = response.elapsed.total_seconds()
+                metrics.request_bytes = QueryMetrics._get_content_size(response.request.body)
+        if metrics.request_bytes is None and request is not None:
+            metrics.request_bytes = QueryMetrics._get_content_size(request.data)
+        return metrics
+
+    @staticmethod
+    def _get_response_size(response):
+        """
+        :type response: requests.Response
+        """
+        # the body of a streamed response is not consumed here
+        if response._content is not False and response._content is not None:
+            return len(response._content)
+        content_length = response.headers.get("Content-Length", None)
+        return int(content_length) if content_length is not None else None
+
+    @staticmethod
+    def _get_content_size(content):
+        if content is None:
+            return 0
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return len(content)
+        if hasattr(content, "encode"):
+            return len(content.encode("utf-8"))
+        return None
+
+    def __repr__(self):
+        return "{0} {1} {2} {3}: {4:.3f}s".format(self.query_type, self.method, self.url_template,
+                                                  self.status_code, self.total_time or 0)
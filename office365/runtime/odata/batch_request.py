@@ -1,19 +1,32 @@
+import time
 from abc import abstractmethod
 
 from office365.runtime.client_request import ClientRequest
+from office365.runtime.instrumentation.query_metrics import QueryMetrics
 from office365.runtime.queries.batch import BatchQuery
 
 
 class ODataBatchRequest(ClientRequest):
 
-    def __init__(self, context, items_per_batch):
+    def __init__(self, context, items_per_batch, part_failed=None):
+        """
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :param int items_per_batch: Maximum number of queries per batch request
+        :param (ClientQuery, requests.Response)->None part_failed: Invoked for every part which failed instead of
+            raising an error, the remaining parts are processed
+        """
         super(ODataBatchRequest, self).__init__(context)
         self.items_per_batch = items_per_batch
+        self.part_failed = part_failed
+        self._part_requests = {}
 
     def add_query(self, query):
         if isinstance(query, BatchQuery):
             super(ODataBatchRequest, self).add_query(query)
         else:
+            queued_at = self.context.pending_request()._queued_at.pop(query.id, None)
+            if queued_at is not None:
+                self._queued_at[query.id] = queued_at
             if self._current_query is None or len(self.current_query.queries) == self.items_per_batch:
                 super(ODataBatchRequest, self).add_query(BatchQuery(self.context, [query]))
             else:
@@ -37,6 +50,50 @@ class ODataBatchRequest(ClientRequest):
         """
         pass
 
+    def _build_part_request(self, query):
+        """
+        Builds a request of a query submitted within the batch
+
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        """
+        request = query.build_request()
+        if self.is_instrumented:
+            self._part_requests[query.id] = (request, time.time(), self._queued_at.pop(query.id, None))
+        return request
+
+    def _handle_part_failed(self, query, response):
+        """
+        Returns True if the part failed and the failure has been reported to part_failed callback, raises
+        an error if the part failed and no callback is specified
+
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        :type response: requests.Response
+        """
+        if response.ok:
+            return False
+        if callable(self.part_failed):
+            self.part_failed(query, response)
+            return True
+        response.raise_for_status()
+
+    def _notify_part_executed(self, query, response):
+        """
+        Reports metrics of a query submitted within the batch, timings are reported for the batch request only
+
+        :type query: office365.runtime.queries.client_query.ClientQuery
+        :type response: requests.Response
+        """
+        if not self.is_instrumented:
+            return
+        request, started, queued_at = self._part_requests.pop(query.id, (None, None, None))
+        metrics = QueryMetrics.create(self.context, query, request, response)
+        metrics.batch_id = self.current_query.current_boundary
+        metrics.succeeded = response.ok
+        metrics.started = started
+        if started is not None and queued_at is not None:
+            metrics.queue_wait = started - queued_at
+        self.context.queryExecuted.notify(metrics)
+
     @property
     def current_query(self):
         """
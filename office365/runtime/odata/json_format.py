@@ -24,6 +24,14 @@ class ODataJsonFormat(object):
     def collection_next(self):
         raise NotImplementedError
 
+    @property
+    def collection_delta(self):
+        """Name of the annotation which contains the link to request changes of a collection (if supported)
+
+        :rtype: str or None
+        """
+        return None
+
     @property
     def media_type(self):
         """
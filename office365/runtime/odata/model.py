@@ -1,6 +1,9 @@
 class ODataModel(object):
     """OData model"""
-    _types = {}
+
+    def __init__(self):
+        self._types = {}
+        self._types_by_full_name = {}
 
     @property
     def types(self):
@@ -13,3 +16,54 @@ class ODataModel(object):
         """
         type_alias = type_schema.name
         self._types[type_alias] = type_schema
+        self._types_by_full_name[type_schema.full_name] = type_schema
+
+    def get_type(self, full_name):
+        """
+        :param str full_name: Namespace qualified type name, e.g. microsoft.graph.user
+        :rtype: office365.runtime.odata.type.ODataType or None
+        """
+        return self._types_by_full_name.get(full_name, None)
+
+    def get_base_types(self, full_name):
+        """
+        Returns the type name followed by the names of its base types
+
+        :param str full_name: Namespace qualified type name
+        :rtype: list[str]
+        """
+        result = []
+        while full_name is not None and full_name not in result:
+            result.append(full_name)
+            type_schema = self._types_by_full_name.get(full_name, None)
+            full_name = type_schema.baseTypeName if type_schema is not None else None
+        return result
+
+    def to_json(self):
+        """
+        Compact representation of the model: kind, base type and property types per type
+        """
+        return {name: [t.baseType, t.baseTypeName, {p.name: p.typeName for p in t.properties.values()}]
+                for name, t in self._types_by_full_name.items()}
+
+    @staticmethod
+    def from_json(json):
+        """
+        :type json: dict
+        :rtype: ODataModel
+        """
+        from office365.runtime.odata.property import ODataProperty
+        from office365.runtime.odata.type import ODataType
+        model = ODataModel()
+        for full_name, (kind, base_type_name, properties) in json.items():
+            type_schema = ODataType()
+            type_schema.namespace, _, type_schema.name = full_name.rpartition(".")
+            type_schema.baseType = kind
+            type_schema.baseTypeName = base_type_name
+            for name, type_name in properties.items():
+                prop_schema = ODataProperty()
+                prop_schema.name = name
+                prop_schema.typeName = type_name
+                type_schema.add_property(prop_schema)
+            model.add_type(type_schema)
+        return model
@@ -0,0 +1,148 @@
+import hashlib
+import importlib
+import io
+import json
+import os
+import threading
+
+from office365.runtime.compat import is_string_type
+from office365.runtime.http.http_method import HttpMethod
+from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.odata.model import ODataModel
+
+
+class ODataEntry(dict):
+    """Properties of an entity along with its type name as annotated in the payload"""
+
+    def __init__(self, properties, type_name):
+        """
+        :type properties: dict
+        :param str type_name: Namespace qualified type name, e.g. SP.FieldText or microsoft.graph.user
+        """
+        super(ODataEntry, self).__init__(properties)
+        self.type_name = type_name
+
+
+class ODataModelRegistry(object):
+    """
+    Resolves client types of entities from the type annotations of the payload (@odata.type or __metadata),
+    e.g. items of a directoryObjects collection are materialized as users or groups.
+
+    The $metadata of a service is downloaded once and kept as a parsed model (type inheritance and property types)
+    in memory and, if cache_path is specified, as a compact JSON file. A type is resolved via the entity type map
+    (server type name to class path, see office365.entity_type_map) to the class of the type or of its nearest
+    base type which is a subclass of the expected one, the class module is imported on demand.
+    """
+
+    def __init__(self, cache_path=None, type_map=None):
+        """
+        :param str or None cache_path: Directory the parsed models are kept in
+        :param dict[str, str or type] or None type_map: Additional (or overridden) entity classes by server type
+            names, a class or its path (module:class) is expected
+        """
+        self._cache_path = cache_path
+        from office365.entity_type_map import entity_type_map
+        self._type_map = dict(entity_type_map)
+        self._type_map.update(type_map or {})
+        self._models = {}
+        self._resolved_types = {}
+        self._lock = threading.Lock()
+
+    def get_model(self, context):
+        """
+        Returns the model of the service, the model is loaded unless it is cached
+
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :rtype: ODataModel
+        """
+        service_root_url = context.service_root_url()
+        with self._lock:
+            model = self._models.get(service_root_url, None)
+            if model is None:
+                model = self._load_model(context)
+                self._models[service_root_url] = model
+            return model
+
+    def resolve_type(self, context, client_type, type_name):
+        """
+        Returns the client type of the entity
+
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :param type[office365.runtime.client_object.ClientObject] client_type: Expected client type
+        :param str type_name: Type name annotated in the payload
+        """
+        key = (context.service_root_url(), client_type, type_name)
+        result = self._resolved_types.get(key, None)
+        if result is None:
+            result = client_type
+            for name in self.get_model(context).get_base_types(type_name.lstrip("#")):
+                subtype = self.get_client_type(name)
+                if subtype is not None and issubclass(subtype, client_type):
+                    result = subtype
+                    break
+            self._resolved_types[key] = result
+        return result
+
+    def get_client_type(self, type_name):
+        """
+        Returns the class of the entity type, the module of the class is imported if needed
+
+        :param str type_name: Namespace qualified type name, e.g. SP.Web or microsoft.graph.user
+        :rtype: type or None
+        """
+        client_type = self._type_map.get(type_name, None)
+        if is_string_type(client_type):
+            module_name, _, class_name = client_type.partition(":")
+            client_type = getattr(importlib.import_module(module_name), class_name)
+            self._type_map[type_name] = client_type
+        return client_type
+
+    def invalidate(self):
+        with self._lock:
+            self._models = {}
+            self._resolved_types = {}
+
+    def _load_model(self, context):
+        """
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        """
+        file_path = None
+        if self._cache_path is not None:
+            name = hashlib.sha1(context.service_root_url().encode("utf-8")).hexdigest()
+            file_path = os.path.join(self._cache_path, name + ".json")
+            if os.path.exists(file_path):
+                with open(file_path, "r") as f:
+                    return ODataModel.from_json(json.load(f))
+
+        request = RequestOptions(context.service_root_url() + "/$metadata")
+        request.method = HttpMethod.Get
+        request.set_header("Accept", "application/xml")
+        response = context.pending_request().execute_request_direct(request)
+        response.raise_for_status()
+        model = self._create_reader(io.BytesIO(response.content)).generate_model(True)
+
+        if file_path is not None:
+            if not os.path.exists(self._cache_path):
+                os.makedirs(self._cache_path)
+            with open(file_path + ".tmp", "w") as f:
+                json.dump(model.to_json(), f, separators=(",", ":"))
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            os.rename(file_path + ".tmp", file_path)
+        return model
+
+    @staticmethod
+    def _create_reader(metadata):
+        """
+        Creates OData v3 or v4 reader depending on the namespace of the metadata document
+
+        :type metadata: io.BytesIO
+        """
+        if b"http://schemas.microsoft.com/ado/" in metadata.getvalue()[:1024]:
+            from office365.runtime.odata.v3.metadata_reader import ODataV3Reader
+            return ODataV3Reader(metadata)
+        from office365.runtime.odata.v4.metadata_reader import ODataV4Reader
+        return ODataV4Reader(metadata)
+
+    def __deepcopy__(self, memo):
+        return self
@@ -2,3 +2,4 @@ class ODataProperty(object):
 
     def __init__(self):
         self.name = None
+        self.typeName = None
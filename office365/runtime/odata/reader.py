@@ -1,5 +1,7 @@
+import re
 from xml.etree import ElementTree as ET
 
+from office365.runtime.compat import is_string_type
 from office365.runtime.odata.model import ODataModel
 from office365.runtime.odata.property import ODataProperty
 from office365.runtime.odata.type import ODataType
@@ -10,7 +12,7 @@ class ODataReader(object):
 
     def __init__(self, metadata_path, xml_namespaces):
         """
-        :type metadata_path: string
+        :param str or typing.IO metadata_path: Path to the metadata file or file object
         :type xml_namespaces: dict
         """
         self._metadata_path = metadata_path
@@ -26,28 +28,63 @@ class ODataReader(object):
         with open(self._metadata_path, "w", encoding="utf8") as out_file:
             out_file.write(formatted_metadata_content)
 
-    def process_schema_node(self, model):
+    def process_schema_node(self, model, include_entity_types=False):
         """
+        Reads types of the schema, the metadata document is parsed incrementally and the processed elements are
+        discarded, so that the whole document (several megabytes in case of Microsoft Graph) is never kept in memory
+
+        :type model: ODataModel
+        :param bool include_entity_types: Read entity types of all the schemas along with complex types
+        """
+        type_tags = {self._qualify_tag('xmlns', 'ComplexType'): 'ComplexType'}
+        if include_entity_types:
+            type_tags[self._qualify_tag('xmlns', 'EntityType')] = 'EntityType'
+
+        if is_string_type(self._metadata_path):
+            with open(self._metadata_path, 'rb') as f:
+                self._read_types(f, model, type_tags, include_entity_types)
+        else:
+            self._read_types(self._metadata_path, model, type_tags, include_entity_types)
+
+    def _read_types(self, source, model, type_tags, all_schemas):
+        """
+        :type source: typing.IO
         :type model: ODataModel
+        :param dict[str, str] type_tags: Kinds of the types to read by element tags
+        :param bool all_schemas: Read all the schemas or only the first one
         """
-        root = ET.parse(self._metadata_path).getroot()
-        schema_node = root.find('edmx:DataServices/xmlns:Schema', self._xml_namespaces)
-        for type_node in schema_node.findall('xmlns:ComplexType', self._xml_namespaces):
-            type_schema = self.process_type_node(type_node, schema_node)
-            model.add_type(type_schema)
+        schema_tag = self._qualify_tag('xmlns', 'Schema')
+        path = []
+        for event, node in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                path.append(node)
+                continue
+            path.pop()
+            if node.tag == schema_tag:
+                node.clear()
+                if not all_schemas:
+                    break
+            elif path and path[-1].tag == schema_tag:
+                kind = type_tags.get(node.tag, None)
+                if kind is not None:
+                    model.add_type(self.process_type_node(node, path[-1], kind))
+                path[-1].remove(node)
 
-    def process_type_node(self, type_node, schema_node):
+    def process_type_node(self, type_node, schema_node, kind='ComplexType'):
         """
         :type type_node: xml.etree.ElementTree.Element
         :type schema_node: xml.etree.ElementTree.Element
+        :param str kind: ComplexType or EntityType
         """
         type_schema = ODataType()
         type_schema.namespace = schema_node.attrib['Namespace']
         type_schema.name = type_node.get('Name')
-        type_schema.baseType = 'ComplexType'
+        type_schema.baseType = kind
+        type_schema.baseTypeName = self._qualify_type_name(type_node.get('BaseType'), schema_node)
 
         for prop_node in type_node.findall('xmlns:Property', self._xml_namespaces):
             prop_schema = self.process_property_node(prop_node)
+            prop_schema.typeName = self._qualify_type_name(prop_schema.typeName, schema_node)
             type_schema.add_property(prop_schema)
 
         return type_schema
@@ -61,9 +98,34 @@ class ODataReader(object):
         """
         prop_schema = ODataProperty()
         prop_schema.name = node.get('Name')
+        prop_schema.typeName = node.get('Type')
         return prop_schema
 
-    def generate_model(self):
+    def _qualify_tag(self, prefix, name):
+        """
+        :param str prefix: Namespace prefix
+        :param str name: Local name of the element
+        """
+        return "{" + self._xml_namespaces[prefix] + "}" + name
+
+    @staticmethod
+    def _qualify_type_name(type_name, schema_node):
+        """
+        Replaces the alias of the schema namespace (e.g. graph.user) with the namespace (microsoft.graph.user)
+
+        :type type_name: str or None
+        :type schema_node: xml.etree.ElementTree.Element
+        """
+        alias = schema_node.attrib.get('Alias', None)
+        if type_name is None or alias is None:
+            return type_name
+        return re.sub(r"(^|\()" + re.escape(alias) + r"\.", r"\g<1>" + schema_node.attrib['Namespace'] + ".",
+                      type_name)
+
+    def generate_model(self, include_entity_types=False):
+        """
+        :param bool include_entity_types: Read entity types of all the schemas along with complex types
+        """
         model = ODataModel()
-        self.process_schema_node(model)
+        self.process_schema_node(model, include_entity_types)
         return model
@@ -6,6 +6,8 @@ from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value import ClientValue
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.instrumentation.profiler import profile_stage
+from office365.runtime.odata.model_registry import ODataEntry
 from office365.runtime.odata.v3.json_light_format import JsonLightFormat
 from office365.runtime.queries.create_entity import CreateEntityQuery
 from office365.runtime.queries.delete_entity import DeleteEntityQuery
@@ -51,7 +53,8 @@ class ODataRequest(ClientRequest):
         elif isinstance(query, (CreateEntityQuery, UpdateEntityQuery, ServiceOperationQuery)):
             request.method = HttpMethod.Post
             if query.parameter_type is not None:
-                request.data = self._normalize_payload(query.parameter_type)
+                with profile_stage(self.context.profiler, "serialize"):
+                    request.data = self._normalize_payload(query.parameter_type)
         return request
 
     def process_response(self, response):
@@ -74,7 +77,11 @@ class ODataRequest(ClientRequest):
             if isinstance(query, ServiceOperationQuery) and isinstance(json_format, JsonLightFormat):
                 json_format.function = query.method_name
 
-            self.map_json(response.json(), return_type, json_format)
+            profiler = self.context.profiler
+            with profile_stage(profiler, "parse"):
+                payload = response.json()
+            with profile_stage(profiler, "map"):
+                self.map_json(payload, return_type, json_format)
 
     def map_json(self, json, return_type, json_format=None):
         """
@@ -102,14 +109,21 @@ class ODataRequest(ClientRequest):
             yield "__value", json
         else:
             next_link_url = json.get(json_format.collection_next, None)
+            delta_link_url = json.get(json_format.collection_delta, None) if json_format.collection_delta else None
             json = json.get(json_format.collection, json)
             if next_link_url:
                 yield "__nextLinkUrl", next_link_url
+            if delta_link_url:
+                yield "__deltaLinkUrl", delta_link_url
 
             if isinstance(json, list):
+                resolve_types = self.context.model_registry is not None
                 for index, item in enumerate(json):
                     if isinstance(item, dict):
+                        type_name = self._get_type_name(item, json_format) if resolve_types else None
                         item = {k: v for k, v in self._next_property(item, json_format)}
+                        if type_name is not None:
+                            item = ODataEntry(item, type_name)
                     yield index, item
             elif isinstance(json, dict):
                 for name, value in json.items():
@@ -125,6 +139,20 @@ class ODataRequest(ClientRequest):
             else:
                 yield "__value", json
 
+    @staticmethod
+    def _get_type_name(json, json_format):
+        """
+        Returns the type name annotated in the entity payload
+
+        :type json: dict
+        :type json_format: office365.runtime.odata.json_format.ODataJsonFormat
+        :rtype: str or None
+        """
+        annotation = json.get(json_format.metadata_type, None)
+        if isinstance(annotation, dict):
+            return annotation.get("type", None)
+        return annotation
+
     def _normalize_payload(self, value):
         """
         Normalizes OData request payload
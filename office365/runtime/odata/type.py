@@ -17,9 +17,15 @@ class ODataType(object):
         self.name = None
         self.namespace = None
         self.baseType = None
+        self.baseTypeName = None
         self.properties = {}
         self.methods = {}
 
+    @property
+    def full_name(self):
+        """Namespace qualified type name"""
+        return "{0}.{1}".format(self.namespace, self.name) if self.namespace else self.name
+
     @staticmethod
     def parse_datetime(value):
         """
@@ -9,6 +9,7 @@ from email.message import Message
 
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.instrumentation.profiler import profile_query, profile_stage
 from office365.runtime.odata.batch_request import ODataBatchRequest
 from office365.runtime.queries.batch import create_boundary
 
@@ -27,7 +28,8 @@ class ODataBatchV3Request(ODataBatchRequest):
         media_type = "multipart/mixed"
         content_type = "; ".join([media_type, "boundary={0}".format(query.current_boundary)])
         request.ensure_header('Content-Type', content_type)
-        request.data = self._prepare_payload(query)
+        with profile_stage(self.context.profiler, "serialize"):
+            request.data = self._prepare_payload(query)
         return request
 
     def process_response(self, response):
@@ -37,9 +39,12 @@ class ODataBatchV3Request(ODataBatchRequest):
         :type response: requests.Response
         """
         for qry, sub_response in self._extract_response(response):
-            sub_response.raise_for_status()
+            self._notify_part_executed(qry, sub_response)
+            if self._handle_part_failed(qry, sub_response):
+                continue
             self.context.pending_request().add_query(qry)
-            self.context.pending_request().process_response(sub_response)
+            with profile_query(self.context.profiler, qry):
+                self.context.pending_request().process_response(sub_response)
             self.context.clear()
 
     def _extract_response(self, response):
@@ -55,14 +60,14 @@ class ODataBatchV3Request(ODataBatchRequest):
             + response.content
         )
 
-        message = message_from_bytes_or_string(http_body)  # type: Message
+        with profile_stage(self.context.profiler, "parse"):
+            message = message_from_bytes_or_string(http_body)  # type: Message
+            raw_responses = [raw_response for raw_response in message.get_payload()
+                             if raw_response.get_content_type() == "application/http"]
+            sub_responses = [self._deserialize_response(raw_response) for raw_response in raw_responses]
 
-        query_id = 0
-        for raw_response in message.get_payload():
-            if raw_response.get_content_type() == "application/http":
-                qry = self.current_query.ordered_queries[query_id]
-                query_id += 1
-                yield qry, self._deserialize_response(raw_response)
+        for qry, sub_response in zip(self.current_query.ordered_queries, sub_responses):
+            yield qry, sub_response
 
     def _prepare_payload(self, query):
         """
@@ -81,13 +86,13 @@ class ODataBatchV3Request(ODataBatchRequest):
             change_set_message.set_boundary(change_set_boundary)
 
             for qry in query.change_sets:
-                request = qry.build_request()
+                request = self._build_part_request(qry)
                 message = self._serialize_request(request)
                 change_set_message.attach(message)
             main_message.attach(change_set_message)
 
         for qry in query.get_queries:
-            request = qry.build_request()
+            request = self._build_part_request(qry)
             message = self._serialize_request(request)
             main_message.attach(message)
 
@@ -135,7 +140,9 @@ class ODataBatchV3Request(ODataBatchRequest):
         method = request.method
         if "X-HTTP-Method" in request.headers:
             method = request.headers["X-HTTP-Method"]
-        lines = ["{method} {url} HTTP/1.1".format(method=method, url=request.url)] + \
+        # the url is sent as is (unlike the direct requests), hence it has to be quoted the same way
+        url = requests.utils.requote_uri(request.url)
+        lines = ["{method} {url} HTTP/1.1".format(method=method, url=url)] + \
                 [':'.join(h) for h in request.headers.items()]
         if request.data:
             lines.append(eol)
@@ -5,6 +5,7 @@ from requests.structures import CaseInsensitiveDict
 
 from office365.runtime.http.http_method import HttpMethod
 from office365.runtime.http.request_options import RequestOptions
+from office365.runtime.instrumentation.profiler import profile_query, profile_stage
 from office365.runtime.odata.batch_request import ODataBatchRequest
 
 
@@ -22,7 +23,8 @@ class ODataV4BatchRequest(ODataBatchRequest):
         request.method = HttpMethod.Post
         request.ensure_header('Content-Type', "application/json")
         request.ensure_header('Accept', "application/json")
-        request.data = self._prepare_payload(query)
+        with profile_stage(self.context.profiler, "serialize"):
+            request.data = self._prepare_payload(query)
         return request
 
     def process_response(self, response):
@@ -31,16 +33,20 @@ class ODataV4BatchRequest(ODataBatchRequest):
         :type response: requests.Response
         """
         for qry, sub_response in self._extract_response(response):
-            sub_response.raise_for_status()
+            self._notify_part_executed(qry, sub_response)
+            if self._handle_part_failed(qry, sub_response):
+                continue
             self.context.pending_request().add_query(qry)
-            self.context.pending_request().process_response(sub_response)
+            with profile_query(self.context.profiler, qry):
+                self.context.pending_request().process_response(sub_response)
             self.context.pending_request().clear()
 
     def _extract_response(self, response):
         """
         type batch_response: requests.Response
         """
-        json_responses = response.json()
+        with profile_stage(self.context.profiler, "parse"):
+            json_responses = response.json()
         for json_resp in json_responses["responses"]:
             resp = requests.Response()
             resp.status_code = int(json_resp['status'])
@@ -59,7 +65,7 @@ class ODataV4BatchRequest(ODataBatchRequest):
         requests_json = []
         for qry in query.queries:
             request_id = str(len(requests_json))
-            request = qry.build_request()
+            request = self._build_part_request(qry)
             requests_json.append(self._normalize_request(request, request_id))
 
         return {"requests": requests_json}
@@ -74,6 +80,8 @@ class ODataV4BatchRequest(ODataBatchRequest):
         allowed_props = ["id", "method", "headers", "url", "body"]
         request_json = dict((k, v) for k, v in vars(request).items() if v is not None and k in allowed_props)
         request_json["id"] = _id
+        if request.data is not None:
+            request_json["body"] = request.data
         if depends_on is not None:
             request_json["dependsOn"] = depends_on
         request_json["url"] = request_json["url"].replace(self.context.service_root_url(), "")
@@ -1,3 +1,4 @@
+import io
 import os
 
 from office365.runtime.client_request import ClientRequest
@@ -8,9 +9,11 @@ from office365.runtime.types.event_handler import EventHandler
 
 class UploadSessionRequest(ClientRequest):
 
-    def __init__(self, context, file_object, chunk_size):
+    def __init__(self, context, file_object, chunk_size, hash_object=None):
         """
         :param typing.IO file_object:
+        :param int chunk_size:
+        :param hash_object: Hash object (hashlib compatible) updated with the file content as it is being read
         """
         super(UploadSessionRequest, self).__init__(context)
         self._file_object = file_object
@@ -18,6 +21,24 @@ class UploadSessionRequest(ClientRequest):
         self._chunk_size = chunk_size
         self._range_start = 0
         self._range_end = 0
+        self._next_expected_ranges = None
+        self._file_size = None
+        self._hash_object = hash_object
+        self._hashed_size = 0
+
+    def add_query(self, query):
+        """
+        Queues the upload of the next expected range, nothing is queued once the server has received all the bytes
+        (an empty list of expected ranges, unlike the missing one which denotes the whole file)
+
+        :type query: office365.runtime.queries.upload_session.UploadSessionQuery
+        """
+        if self._next_expected_ranges is None:
+            next_expected_ranges = query.return_type.value.nextExpectedRanges
+            self._next_expected_ranges = ["0-"] if next_expected_ranges is None else list(next_expected_ranges)
+        if not self.has_pending_read:
+            return self
+        return super(UploadSessionRequest, self).add_query(query)
 
     def build_request(self, query):
         """
@@ -34,23 +55,84 @@ class UploadSessionRequest(ClientRequest):
         return request
 
     def process_response(self, response):
+        """
+        Advances the expected ranges either from the upload session status returned by the server
+        or from the range which has just been uploaded
+
+        :type response: requests.Response
+        """
         response.raise_for_status()
+        next_expected_ranges = None
+        if response.headers.get('Content-Type', '').lower().split(';')[0] == 'application/json':
+            next_expected_ranges = response.json().get("nextExpectedRanges", None)
+        if next_expected_ranges is None:
+            next_expected_ranges = self._next_expected_ranges[1:]
+            range_end = self._parse_range(self._next_expected_ranges[0])[1]
+            if self._range_end < range_end:
+                next_expected_ranges.insert(0, "{0}-{1}".format(self._range_end, range_end - 1))
+        self._next_expected_ranges = next_expected_ranges
+        self.current_query.return_type.value.nextExpectedRanges = next_expected_ranges
         if self.has_pending_read:
             self.add_query(self.current_query)
 
     def _read_next(self):
-        self._range_start = self._file_object.tell()
-        content = self._file_object.read(self._chunk_size)
+        self._range_start, range_end = self._parse_range(self._next_expected_ranges[0])
+        self._file_object.seek(self._range_start)
+        content = self._file_object.read(min(self._chunk_size, range_end - self._range_start))
         self._range_end = self._file_object.tell()
+        self._update_hash(content)
         return content
 
+    def _update_hash(self, content):
+        """
+        Updates the hash with the part of the range which has not been hashed yet. Ranges preceding
+        the current one (e.g. uploaded before the session got resumed) are read once to keep the hash contiguous
+
+        :type content: bytes
+        """
+        if self._hash_object is None or self._range_end <= self._hashed_size:
+            return
+        if self._range_start > self._hashed_size:
+            self._file_object.seek(self._hashed_size)
+            while self._hashed_size < self._range_start:
+                gap = self._file_object.read(min(self._chunk_size, self._range_start - self._hashed_size))
+                if not gap:
+                    break
+                self._hash_object.update(gap)
+                self._hashed_size += len(gap)
+            self._file_object.seek(self._range_end)
+        self._hash_object.update(content[self._hashed_size - self._range_start:])
+        self._hashed_size = self._range_end
+
+    def _parse_range(self, value):
+        """
+        Parses a byte range in the format returned by the server ("start-end" or "start-")
+        into a half-open [start, end) interval
+
+        :type value: str
+        """
+        start, end = value.split("-")
+        return int(start), int(end) + 1 if end else self.file_size
+
     @property
     def has_pending_read(self):
-        return self._range_end < self.file_size
+        return len(self._next_expected_ranges) > 0
 
     @property
     def file_size(self):
-        return os.fstat(self._file_object.fileno()).st_size
+        if self._file_size is None:
+            try:
+                self._file_size = os.fstat(self._file_object.fileno()).st_size
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                position = self._file_object.tell()
+                self._file_object.seek(0, os.SEEK_END)
+                self._file_size = self._file_object.tell()
+                self._file_object.seek(position)
+        return self._file_size
+
+    @property
+    def hash_object(self):
+        return self._hash_object
 
     @property
     def range_start(self):
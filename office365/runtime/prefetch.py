@@ -0,0 +1,55 @@
+import threading
+
+from office365.runtime.compat import is_py2
+
+if is_py2:
+    from Queue import Queue, Empty, Full
+else:
+    from queue import Queue, Empty, Full
+
+
+def prefetch(read_pages):
+    """
+    Iterates pages produced by a background worker, the next page is requested while the current one
+    is being processed. The worker is expected to use a dedicated client context.
+
+    :param (threading.Event) -> collections.Iterable read_pages: Produces pages, should stop once the event is set
+        (consumer has stopped iterating)
+    """
+    pages = Queue(maxsize=1)
+    stopped = threading.Event()
+    completed = object()
+
+    def _put(value):
+        while not stopped.is_set():
+            try:
+                pages.put(value, timeout=0.1)
+                return
+            except Full:
+                pass
+
+    def _read():
+        try:
+            for page in read_pages(stopped):
+                _put(page)
+            _put(completed)
+        except Exception as e:
+            _put(e)
+
+    worker = threading.Thread(target=_read)
+    worker.daemon = True
+    worker.start()
+    try:
+        while True:
+            value = pages.get()
+            if value is completed:
+                return
+            if isinstance(value, Exception):
+                raise value
+            yield value
+    finally:
+        stopped.set()
+        try:
+            pages.get_nowait()
+        except Empty:
+            pass
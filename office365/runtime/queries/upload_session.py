@@ -1,5 +1,6 @@
 from office365.runtime.client_result import ClientResult
 from office365.runtime.odata.v4.upload_session import UploadSession
+from office365.runtime.queries.client_query import ClientQuery
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 
 
@@ -20,3 +21,24 @@ class UploadSessionQuery(ServiceOperationQuery):
         if self._return_type is None:
             self._return_type = ClientResult(self.context, UploadSession())
         return self._return_type
+
+
+class UploadSessionStatusQuery(ClientQuery):
+
+    def __init__(self, binding_type, upload_url):
+        """
+        Retrieves the status of an existing upload session, which includes the ranges the server is still expecting
+
+        :type binding_type: office365.runtime.client_object.ClientObject
+        :param str upload_url: The URL of the upload session
+        """
+        return_type = ClientResult(binding_type.context, UploadSession(upload_url))
+        super(UploadSessionStatusQuery, self).__init__(binding_type.context, binding_type, None, None, return_type)
+
+    @property
+    def url(self):
+        return self.upload_session_url
+
+    @property
+    def upload_session_url(self):
+        return self.return_type.value.uploadUrl
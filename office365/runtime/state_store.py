@@ -0,0 +1,51 @@
+import json
+import os
+import threading
+
+
+class StateStore(object):
+    """Keeps synchronization state (e.g. the last processed change token or delta link) per scope in memory"""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, scope):
+        """
+        :param str scope: Scope key
+        :rtype: str or None
+        """
+        with self._lock:
+            return self._values.get(scope, None)
+
+    def set(self, scope, value):
+        """
+        :param str scope: Scope key
+        :param str value: Change token or delta link
+        """
+        with self._lock:
+            self._values[scope] = value
+
+
+class FileStateStore(StateStore):
+    """Keeps synchronization state per scope in a JSON file"""
+
+    def __init__(self, path):
+        """
+        :param str path: Path to the JSON file
+        """
+        super(FileStateStore, self).__init__()
+        self._path = path
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self._values = json.load(f)
+
+    def set(self, scope, value):
+        with self._lock:
+            self._values[scope] = value
+            tmp_path = self._path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._values, f)
+            if os.path.exists(self._path):
+                os.remove(self._path)
+            os.rename(tmp_path, self._path)
@@ -0,0 +1,283 @@
+import abc
+import calendar
+import datetime
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from office365.runtime.compat import is_py2
+from office365.runtime.transfers.progress import TransferProgress
+
+if is_py2:
+    from Queue import Queue
+else:
+    from queue import Queue
+
+
+class TransferItem(object):
+    """Describes a file or a folder participating in a transfer"""
+
+    def __init__(self, path, size=0, modified=None, hash_value=None, reference=None):
+        """
+        :param str path: Path relative to the transfer root, segments are separated by "/"
+        :param int size: File size in bytes
+        :param float or None modified: Last modified time as POSIX timestamp
+        :param str or None hash_value: Content hash
+        :param any reference: Service specific address of a remote item or an absolute path of a local one
+        """
+        self.path = path
+        self.size = size
+        self.modified = modified
+        self.hash_value = hash_value
+        self.reference = reference
+
+    @property
+    def parent_path(self):
+        return self.path.rpartition("/")[0]
+
+    @property
+    def name(self):
+        return self.path.rpartition("/")[2]
+
+
+class TransferManager(object):
+    """
+    Transfers a directory tree between a local file system and a remote folder.
+
+    Small files are transferred with a single request while large ones are transferred as chunked sessions.
+    Files are processed concurrently by a bounded number of workers, each of them uses a dedicated
+    client context since a context is not safe to be shared across threads. The memory usage is bounded by
+    max_workers * max(large_file_threshold, chunk_size).
+    """
+
+    def __init__(self, context, max_workers=4, large_file_threshold=4 * 1024 * 1024, chunk_size=10 * 1024 * 1024,
+                 skip_unchanged=True, compare_hash=False, progress_changed=None):
+        """
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :param int max_workers: Maximum number of files transferred in parallel
+        :param int large_file_threshold: Files larger than this size (in bytes) are transferred in chunks
+        :param int chunk_size: Chunk size (in bytes)
+        :param bool skip_unchanged: Skip files which are unchanged compared to the target
+        :param bool compare_hash: Compare files by a content hash (if exposed by the server)
+            instead of the last modified time
+        :param (TransferProgress)->None progress_changed: Invoked every time a file is completed
+        """
+        self._context = context
+        self.max_workers = max_workers
+        self.large_file_threshold = large_file_threshold
+        self.chunk_size = chunk_size
+        self.skip_unchanged = skip_unchanged
+        self.compare_hash = compare_hash
+        self._progress_changed = progress_changed
+        self._notify_lock = threading.Lock()
+
+    def upload(self, local_path, target):
+        """
+        Uploads a local directory tree into a remote folder
+
+        :param str local_path: Local directory
+        :param target: Remote folder
+        :rtype: TransferProgress
+        """
+        progress = TransferProgress()
+        root_ref = self._resolve_reference(target)
+        remote_files, remote_folders = self._list_remote(root_ref)
+        folder_refs = {"": root_ref}
+        folder_refs.update(remote_folders)
+
+        tasks = []
+        for local_item in self._list_local(local_path):
+            progress.add_pending(local_item.size)
+            remote_item = remote_files.get(local_item.path, None)
+            if self.skip_unchanged and self._is_unchanged(local_item, remote_item, True):
+                progress.mark_skipped()
+                continue
+            tasks.append((self._ensure_folder(folder_refs, local_item.parent_path), local_item))
+
+        self._run(tasks, self._upload_file, progress)
+        return progress
+
+    def download(self, source, local_path):
+        """
+        Downloads a remote folder into a local directory
+
+        :param source: Remote folder
+        :param str local_path: Local directory
+        :rtype: TransferProgress
+        """
+        progress = TransferProgress()
+        root_ref = self._resolve_reference(source)
+        remote_files, remote_folders = self._list_remote(root_ref)
+        for folder_path in remote_folders.keys():
+            self._ensure_local_folder(os.path.join(local_path, *folder_path.split("/")))
+
+        tasks = []
+        for remote_item in remote_files.values():
+            progress.add_pending(remote_item.size)
+            file_path = os.path.join(local_path, *remote_item.path.split("/"))
+            local_item = self._get_local_item(file_path, remote_item.path) if os.path.isfile(file_path) else None
+            if self.skip_unchanged and self._is_unchanged(local_item, remote_item, False):
+                progress.mark_skipped()
+                continue
+            self._ensure_local_folder(os.path.dirname(file_path))
+            tasks.append((remote_item, file_path))
+
+        self._run(tasks, self._download_file, progress)
+        return progress
+
+    @abc.abstractmethod
+    def _create_context(self):
+        """
+        Creates a client context for a worker
+
+        :rtype: office365.runtime.client_runtime_context.ClientRuntimeContext
+        """
+        pass
+
+    @abc.abstractmethod
+    def _resolve_reference(self, folder):
+        """
+        Resolves a context independent reference of a remote folder
+        """
+        pass
+
+    @abc.abstractmethod
+    def _list_remote(self, folder_ref):
+        """
+        Lists the remote folder tree
+
+        :return: files and folders keyed by the path relative to the folder
+        :rtype: (dict[str, TransferItem], dict[str, any])
+        """
+        pass
+
+    @abc.abstractmethod
+    def _create_folder(self, parent_ref, name):
+        """
+        Creates a remote folder and returns a reference to it
+        """
+        pass
+
+    @abc.abstractmethod
+    def _upload_file(self, context, folder_ref, local_item, bytes_transferred):
+        """
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :type local_item: TransferItem
+        :type bytes_transferred: (int)->None
+        """
+        pass
+
+    @abc.abstractmethod
+    def _download_file(self, context, remote_item, file_path, bytes_transferred):
+        """
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :type remote_item: TransferItem
+        :type file_path: str
+        :type bytes_transferred: (int)->None
+        """
+        pass
+
+    def _compute_hash(self, file_path):
+        """
+        Computes a hash of a local file in the form the server exposes it, None if the server does not expose any
+        """
+        return None
+
+    def _run(self, tasks, action, progress):
+        """
+        :type tasks: list[tuple]
+        :type action: (ClientRuntimeContext, any, any, (int)->None)->None
+        :type progress: TransferProgress
+        """
+        if not tasks:
+            self._notify(progress)
+            return
+        contexts = Queue()
+        for _ in range(min(self.max_workers, len(tasks))):
+            contexts.put(self._create_context())
+
+        def _execute(task):
+            context = contexts.get()
+            item = task[0] if isinstance(task[0], TransferItem) else task[1]
+            try:
+                action(context, task[0], task[1], progress.add_transferred_bytes)
+                progress.mark_transferred()
+            except Exception as e:
+                # the failed query might leave event handlers attached to the context, hence it gets replaced
+                context = self._create_context()
+                progress.mark_failed(item.path, e)
+            finally:
+                contexts.put(context)
+            self._notify(progress)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(_execute, tasks))
+
+    def _notify(self, progress):
+        if callable(self._progress_changed):
+            with self._notify_lock:
+                self._progress_changed(progress)
+
+    def _ensure_folder(self, folder_refs, path):
+        """
+        Ensures a remote folder (along with its parents) exists
+
+        :type folder_refs: dict[str, any]
+        :type path: str
+        """
+        if path not in folder_refs:
+            parent_path, _, name = path.rpartition("/")
+            parent_ref = self._ensure_folder(folder_refs, parent_path)
+            folder_refs[path] = self._create_folder(parent_ref, name)
+        return folder_refs[path]
+
+    def _is_unchanged(self, local_item, remote_item, uploading):
+        """
+        :type local_item: TransferItem or None
+        :type remote_item: TransferItem or None
+        :param bool uploading: Whether the local item is the source of the transfer
+        """
+        if local_item is None or remote_item is None or local_item.size != remote_item.size:
+            return False
+        if self.compare_hash and remote_item.hash_value is not None:
+            return remote_item.hash_value == self._compute_hash(local_item.reference)
+        if local_item.modified is None or remote_item.modified is None:
+            return False
+        if uploading:
+            return local_item.modified <= remote_item.modified
+        return local_item.modified >= remote_item.modified
+
+    def _list_local(self, local_path):
+        for dir_path, dir_names, file_names in os.walk(local_path):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(dir_path, file_name)
+                rel_path = os.path.relpath(file_path, local_path).replace(os.path.sep, "/")
+                yield self._get_local_item(file_path, rel_path)
+
+    @staticmethod
+    def _get_local_item(file_path, rel_path):
+        stat = os.stat(file_path)
+        return TransferItem(rel_path, stat.st_size, stat.st_mtime, reference=file_path)
+
+    @staticmethod
+    def _ensure_local_folder(path):
+        if path and not os.path.isdir(path):
+            os.makedirs(path)
+
+    @staticmethod
+    def _parse_timestamp(value):
+        """
+        Converts ISO 8601 date time string in UTC into POSIX timestamp
+
+        :type value: str or None
+        :rtype: float or None
+        """
+        if not value:
+            return None
+        value = value.rstrip("Z").split(".")[0]
+        try:
+            dt = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+        except ValueError:
+            return None
+        return float(calendar.timegm(dt.timetuple()))
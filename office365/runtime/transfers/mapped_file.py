@@ -0,0 +1,93 @@
+import mmap
+import os
+
+
+class MappedFile(object):
+    """
+    Read-only memory-mapped file.
+
+    Unlike a regular file object, read returns memoryview slices of the mapped file, which are passed
+    to the HTTP layer without copying the content into intermediate bytes objects.
+    """
+
+    def __init__(self, path):
+        """
+        :param str path: Local file path
+        """
+        self.name = path
+        self._file = open(path, 'rb')
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._position = 0
+        self._mmap = None
+        try:
+            if self._size > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        except Exception:
+            self._file.close()
+            raise
+
+    def read(self, size=-1):
+        """
+        :param int size: Number of bytes to read, the remaining content is read if negative
+        :rtype: memoryview
+        """
+        start = min(self._position, self._size)
+        end = self._size if size is None or size < 0 else min(start + size, self._size)
+        self._position = end
+        return self._view[start:end]
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError("Negative seek position {0}".format(offset))
+        self._position = offset
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def close(self):
+        if self.closed:
+            return
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # slices returned by read are still referenced, the mapping is released along with them
+                pass
+            self._mmap = None
+        self._file.close()
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def __len__(self):
+        return self._size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def open_upload_source(path):
+    """
+    Opens a local file for a chunked upload, falls back to a regular file object
+    if the file could not be memory-mapped
+
+    :param str path: Local file path
+    """
+    try:
+        return MappedFile(path)
+    except (EnvironmentError, ValueError):
+        return open(path, 'rb')
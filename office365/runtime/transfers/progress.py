@@ -0,0 +1,57 @@
+import threading
+
+
+class TransferProgress(object):
+    """Aggregated progress of a multi-file transfer"""
+
+    def __init__(self):
+        self.total_files = 0
+        self.total_bytes = 0
+        self.transferred_files = 0
+        self.transferred_bytes = 0
+        self.skipped_files = 0
+        self.failed_files = 0
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def add_pending(self, size):
+        """
+        :param int size: File size in bytes
+        """
+        with self._lock:
+            self.total_files += 1
+            self.total_bytes += size
+
+    def add_transferred_bytes(self, size):
+        with self._lock:
+            self.transferred_bytes += size
+
+    def mark_transferred(self):
+        with self._lock:
+            self.transferred_files += 1
+
+    def mark_skipped(self):
+        with self._lock:
+            self.skipped_files += 1
+
+    def mark_failed(self, path, error):
+        """
+        :param str path: Relative file path
+        :param Exception error: Error
+        """
+        with self._lock:
+            self.failed_files += 1
+            self.errors[path] = error
+
+    @property
+    def completed_files(self):
+        return self.transferred_files + self.skipped_files + self.failed_files
+
+    @property
+    def is_completed(self):
+        return self.completed_files >= self.total_files
+
+    def __repr__(self):
+        return "{0}/{1} files, {2}/{3} bytes, {4} skipped, {5} failed".format(
+            self.transferred_files, self.total_files, self.transferred_bytes, self.total_bytes,
+            self.skipped_files, self.failed_files)
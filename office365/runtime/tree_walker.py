@@ -0,0 +1,126 @@
+import abc
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from office365.runtime.compat import is_py2
+
+if is_py2:
+    from Queue import Queue
+else:
+    from queue import Queue
+
+
+class TreeWalker(object):
+    """
+    Walks a folder tree breadth-first and yields (path, item) pairs, path is relative to the root folder and
+    segments are separated by "/".
+
+    Instead of listing the tree level by level with a blocking request per folder, the children of sibling folders
+    are requested concurrently by a bounded number of workers (each of them uses a dedicated client context since
+    a context is not safe to be shared across threads), optionally several folders are listed within a single
+    $batch request. Items are yielded as soon as the folder they belong to has been listed.
+    """
+
+    def __init__(self, root, max_workers=4, batch_size=1, max_depth=None, item_filter=None, folder_filter=None):
+        """
+        :param root: Root folder
+        :param int max_workers: Maximum number of requests submitted in parallel
+        :param int batch_size: Number of folders listed per request, $batch request is submitted if greater than 1
+        :param int or None max_depth: Maximum depth to descend to, the children of the root folder are at depth 1
+        :param (str, any) -> bool item_filter: Determines whether the item (file or folder) is yielded
+        :param (str, any) -> bool folder_filter: Determines whether the folder is walked, the excluded folder and
+            its descendants are neither yielded nor listed
+        """
+        self._root = root
+        self.max_workers = max_workers
+        self.batch_size = max(batch_size, 1)
+        self.max_depth = max_depth
+        self._item_filter = item_filter
+        self._folder_filter = folder_filter
+
+    def __iter__(self):
+        if self.max_depth is not None and self.max_depth < 1:
+            return
+        contexts = Queue()
+        for _ in range(self.max_workers):
+            contexts.put(self._create_context())
+
+        def _read(folder_refs):
+            context = contexts.get()
+            try:
+                return self._list_children(context, folder_refs)
+            except Exception:
+                # the failed query might leave event handlers attached to the context, hence it gets replaced
+                context = self._create_context()
+                raise
+            finally:
+                contexts.put(context)
+
+        to_visit = deque([("", self._resolve_reference(self._root), 0)])
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while to_visit or pending:
+                while to_visit and len(pending) < self.max_workers:
+                    folders = [to_visit.popleft() for _ in range(min(self.batch_size, len(to_visit)))]
+                    pending.append((folders, executor.submit(_read, [ref for _, ref, _ in folders])))
+                folders, future = pending.popleft()
+                for (folder_path, _, depth), children in zip(folders, future.result()):
+                    for child in children:
+                        child_path = "/".join([folder_path, self._get_name(child)]) if folder_path \
+                            else self._get_name(child)
+                        is_folder = self._is_folder(child)
+                        if is_folder and callable(self._folder_filter) and not self._folder_filter(child_path, child):
+                            continue
+                        if not callable(self._item_filter) or self._item_filter(child_path, child):
+                            yield child_path, child
+                        if is_folder and (self.max_depth is None or depth + 1 < self.max_depth):
+                            to_visit.append((child_path, self._get_reference(child), depth + 1))
+
+    @abc.abstractmethod
+    def _create_context(self):
+        """
+        Creates a client context for a worker
+
+        :rtype: office365.runtime.client_runtime_context.ClientRuntimeContext
+        """
+        pass
+
+    @abc.abstractmethod
+    def _resolve_reference(self, folder):
+        """
+        Resolves a context independent reference of a folder
+        """
+        pass
+
+    @abc.abstractmethod
+    def _get_reference(self, item):
+        """
+        Returns a context independent reference of a listed folder
+        """
+        pass
+
+    @abc.abstractmethod
+    def _list_children(self, context, folder_refs):
+        """
+        Lists the immediate children of the folders
+
+        :type context: office365.runtime.client_runtime_context.ClientRuntimeContext
+        :type folder_refs: list
+        :return: children per folder, in the order of the folders
+        :rtype: list[list]
+        """
+        pass
+
+    @abc.abstractmethod
+    def _get_name(self, item):
+        """
+        :rtype: str
+        """
+        pass
+
+    @abc.abstractmethod
+    def _is_folder(self, item):
+        """
+        :rtype: bool
+        """
+        pass
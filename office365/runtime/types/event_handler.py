@@ -19,3 +19,10 @@ class EventHandler:
             if self._once:
                 self._listeners.remove(listener)
             listener(*args, **kwargs)
+
+
+class SharedEventHandler(EventHandler):
+    """Event handler which is shared (rather than copied) by a client context and its clones"""
+
+    def __deepcopy__(self, memo):
+        return self
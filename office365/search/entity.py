@@ -3,6 +3,7 @@ from office365.runtime.client_result import ClientResult
 from office365.runtime.client_value_collection import ClientValueCollection
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.search.entity_type import EntityType
+from office365.search.hits_reader import SearchHitsReader
 from office365.search.query import SearchQuery
 from office365.search.request import SearchRequest
 from office365.search.response import SearchResponse
@@ -23,6 +24,14 @@ class SearchEntity(Entity):
             Possible values are: list, site, listItem, message, event, drive, driveItem, externalItem.
         """
         search_request = SearchRequest(query=SearchQuery(query_string), entity_types=entity_types)
+        return self.execute_request(search_request)
+
+    def execute_request(self, search_request):
+        """
+        Runs the specified search request.
+
+        :type search_request: SearchRequest
+        """
         payload = {
             "requests": ClientValueCollection(SearchRequest, [search_request])
         }
@@ -31,6 +40,38 @@ class SearchEntity(Entity):
         self.context.add_query(qry)
         return return_type
 
+    def query_all(self, query_string, entity_types=None, fields=None, page_size=25, max_results=None):
+        """
+        Runs the query and streams the search hits, pages are requested as long as more results are available.
+
+        :param str query_string: Contains the query terms.
+        :param list[str] entity_types: One or more types of resources expected in the response.
+        :param list[str] fields: Contains the fields to be returned for each resource object
+        :param int page_size: Number of hits per page
+        :param int or None max_results: Maximum number of hits to return
+        :rtype: office365.search.hits_reader.SearchHitsReader
+        """
+        search_request = SearchRequest(query=SearchQuery(query_string), entity_types=entity_types, fields=fields)
+        return SearchHitsReader(self, [search_request], page_size, max_results)
+
+    def query_concurrently(self, query_string, entity_types, fields=None, page_size=25, max_results=None):
+        """
+        Runs the query against every entity type (or a group of entity types which could be combined in a single
+        request) and streams the search hits. Search requests are sent as separate items of a batch request.
+
+        :param str query_string: Contains the query terms.
+        :param list[str or list[str]] entity_types: Types of resources expected in the response.
+        :param list[str] fields: Contains the fields to be returned for each resource object
+        :param int page_size: Number of hits per page
+        :param int or None max_results: Maximum number of hits to return per entity type
+        :rtype: office365.search.hits_reader.SearchHitsReader
+        """
+        search_requests = [SearchRequest(query=SearchQuery(query_string),
+                                         entity_types=types if isinstance(types, list) else [types],
+                                         fields=fields)
+                           for types in entity_types]
+        return SearchHitsReader(self, search_requests, page_size, max_results)
+
     def query_messages(self, query_string):
         """Searches Outlook messages.
         Alias to query method
@@ -45,6 +86,3 @@ class SearchEntity(Entity):
         :param str query_string: Contains the query terms.
         """
         return self.query(query_string, entity_types=[EntityType.event])
-
-
-
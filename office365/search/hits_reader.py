@@ -0,0 +1,82 @@
+import copy
+
+
+class SearchHitsReader(object):
+    """
+    Streams search hits of one or more search requests page by page.
+
+    Every request is submitted as a separate item of a single $batch request (hence executed in parallel by
+    the service), the next page of a request (from/size) is requested as long as more results are available.
+    """
+
+    max_batch_size = 20
+
+    def __init__(self, search, requests, page_size=25, max_results=None):
+        """
+        :type search: office365.search.entity.SearchEntity
+        :param list[office365.search.request.SearchRequest] requests: Search requests
+        :param int page_size: Number of hits per page
+        :param int or None max_results: Maximum number of hits returned per request
+        """
+        self._search = search
+        self._requests = requests
+        self.page_size = page_size
+        self.max_results = max_results
+
+    def __iter__(self):
+        for _, hits in self.pages():
+            for hit in hits:
+                yield hit
+
+    def pages(self):
+        """
+        Yields pages of hits along with the request they belong to
+
+        :rtype: collections.Iterable[(office365.search.request.SearchRequest, list[office365.search.hit.SearchHit])]
+        """
+        context = self._search.context
+        offsets = [request.search_from or 0 for request in self._requests]
+        active = list(range(len(self._requests)))
+        while active:
+            results = [(index, self._search.execute_request(self._create_request(index, offsets[index])))
+                       for index in active]
+            if len(results) > 1:
+                context.execute_batch(self.max_batch_size)
+            else:
+                context.execute_query()
+
+            active = []
+            for index, result in results:
+                hits = []
+                more_results_available = False
+                for response in result.value:
+                    for container in response.hitsContainers:
+                        hits.extend(container.hits)
+                        more_results_available = more_results_available or bool(container.moreResultsAvailable)
+                if hits:
+                    yield self._requests[index], hits
+                offsets[index] += len(hits)
+                if more_results_available and hits and not self._is_completed(index, offsets[index]):
+                    active.append(index)
+
+    def _create_request(self, index, offset):
+        """
+        :type index: int
+        :type offset: int
+        """
+        request = copy.copy(self._requests[index])
+        request.search_from = offset
+        request.size = self.page_size
+        if self.max_results is not None:
+            start = self._requests[index].search_from or 0
+            request.size = min(self.page_size, start + self.max_results - offset)
+        return request
+
+    def _is_completed(self, index, offset):
+        """
+        :type index: int
+        :type offset: int
+        """
+        if self.max_results is None:
+            return False
+        return offset - (self._requests[index].search_from or 0) >= self.max_results
@@ -8,7 +8,7 @@ class SearchRequest(ClientValue):
     """A search request formatted in a JSON blob."""
 
     def __init__(self, query, entity_types=None, fields=None, search_from=None, sort_properties=None,
-                 content_sources=None):
+                 content_sources=None, size=None):
         """
         :param office365.search.query.SearchQuery query: Contains the query terms.
         :param list[str] entity_types: One or more types of resources expected in the response.
@@ -25,6 +25,7 @@ class SearchRequest(ClientValue):
         :param list[SortProperty] sort_properties: Contains the ordered collection of fields and direction to
             sort results. There can be at most 5 sort properties in the collection.
         :param list[str] content_sources: Contains the connection to be targeted.
+        :param int size: The size of the page to be retrieved.
         """
         super(SearchRequest, self).__init__()
         self.query = query
@@ -33,4 +34,10 @@ class SearchRequest(ClientValue):
         self.search_from = search_from
         self.sortProperties = ClientValueCollection(SortProperty, sort_properties)
         self.contentSources = StringCollection(content_sources)
+        self.size = size
 
+    def __iter__(self):
+        for n, v in super(SearchRequest, self).__iter__():
+            if n == "search_from":
+                n = "from"
+            yield n, v
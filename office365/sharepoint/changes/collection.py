@@ -25,10 +25,10 @@ class ChangeCollection(BaseEntityCollection):
         from office365.sharepoint.changes.field import ChangeField
         from office365.sharepoint.changes.item import ChangeItem
 
-        if "ListId" in properties and "WebId" in properties:
-            self._item_type = ChangeList
-        elif "ItemId" in properties and "ListId" in properties:
+        if "ItemId" in properties and "ListId" in properties:
             self._item_type = ChangeItem
+        elif "ListId" in properties and "WebId" in properties:
+            self._item_type = ChangeList
         elif "WebId" in properties:
             self._item_type = ChangeWeb
         elif "UserId" in properties:
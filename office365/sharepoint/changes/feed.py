@@ -0,0 +1,187 @@
+import copy
+from collections import OrderedDict
+
+from office365.runtime.state_store import StateStore
+from office365.sharepoint.changes.query import ChangeQuery
+from office365.sharepoint.changes.token import ChangeToken
+from office365.sharepoint.changes.type import ChangeType
+
+
+class ChangeDelta(object):
+    """Net change of an object since the last synchronization"""
+
+    Added = "Added"
+    Updated = "Updated"
+    Deleted = "Deleted"
+
+    def __init__(self, key, action, change):
+        """
+        :param tuple key: Identifies the changed object
+        :param str action: Net action: Added, Updated or Deleted
+        :param office365.sharepoint.changes.change.Change change: The latest change of the object
+        """
+        self.key = key
+        self.action = action
+        self.change = change
+
+    def __repr__(self):
+        return "{0} {1}".format(self.action, self.key)
+
+
+class ChangeFeed(object):
+    """
+    Incremental synchronization against the change log of a site, web, list or folder.
+
+    The change log is read page by page (FetchLimit) starting from the last stored token until it's caught up,
+    changes of the same object are merged into a single net change (e.g. an item that got added and updated
+    is reported as added, an item that got added and then deleted is not reported at all). Deltas are handed to
+    the callback in batches and the token is stored once all of them have been processed, hence a failed callback
+    gets the same changes again on the next run.
+    """
+
+    _change_types = [ChangeType.NoChange, ChangeType.Add, ChangeType.Update, ChangeType.DeleteObject,
+                     ChangeType.Rename, ChangeType.MoveAway, ChangeType.MoveInto, ChangeType.Restore,
+                     ChangeType.RoleAdd, ChangeType.RoleDelete, ChangeType.RoleUpdate, ChangeType.AssignmentAdd,
+                     ChangeType.AssignmentDelete, ChangeType.MemberAdd, ChangeType.MemberDelete,
+                     ChangeType.SystemUpdate, ChangeType.Navigation, ChangeType.ScopeAdd, ChangeType.ScopeDelete,
+                     ChangeType.ListContentTypeAdd, ChangeType.ListContentTypeDelete]
+
+    _actions = {
+        ChangeType.Add: ChangeDelta.Added,
+        ChangeType.MoveInto: ChangeDelta.Added,
+        ChangeType.Restore: ChangeDelta.Added,
+        ChangeType.DeleteObject: ChangeDelta.Deleted,
+        ChangeType.MoveAway: ChangeDelta.Deleted,
+    }
+
+    _key_properties = ["SiteId", "WebId", "ListId", "ItemId", "UniqueId", "FieldId", "ContentTypeId", "UserId",
+                       "GroupId", "AlertId"]
+
+    def __init__(self, source, query=None, token_store=None, scope=None, page_size=1000, batch_size=100,
+                 start_from_current=False):
+        """
+        :param office365.sharepoint.lists.list.List or office365.sharepoint.webs.web.Web or
+            office365.sharepoint.sites.site.Site or office365.sharepoint.folders.folder.Folder source: Object
+            which change log is synchronized
+        :param ChangeQuery or None query: Specifies which changes to return, list items changes by default
+        :param office365.runtime.state_store.StateStore or None token_store: Keeps the last token per scope,
+            in memory if omitted
+        :param str or None scope: Key of the token in the store, the url of the source by default
+        :param int page_size: Maximum number of changes returned per request
+        :param int batch_size: Maximum number of deltas handed to the callback at once
+        :param bool start_from_current: On the first run, start from the current change token of the source
+            (supported by lists and sites) instead of the beginning of the change log
+        """
+        self._source = source
+        self._query = query or ChangeQuery(item=True)
+        self.token_store = token_store or StateStore()
+        self._scope = scope
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.start_from_current = start_from_current
+
+    @property
+    def scope(self):
+        """
+        :rtype: str
+        """
+        return self._scope or self._source.resource_url
+
+    @property
+    def last_token(self):
+        """
+        The last processed change token
+        :rtype: str or None
+        """
+        return self.token_store.get(self.scope)
+
+    def sync(self, callback):
+        """
+        Reads changes since the last run and hands the net changes to the callback
+
+        :param (list[ChangeDelta])->None callback: Invoked per batch of deltas
+        :return: Number of delivered deltas
+        :rtype: int
+        """
+        token = self.last_token
+        if token is None and self.start_from_current:
+            token = self._get_current_token()
+            if token is not None:
+                self.token_store.set(self.scope, token)
+                return 0
+
+        deltas, token = self.read_changes(token)
+        for i in range(0, len(deltas), self.batch_size):
+            callback(deltas[i:i + self.batch_size])
+        if token is not None:
+            self.token_store.set(self.scope, token)
+        return len(deltas)
+
+    def read_changes(self, start_token=None):
+        """
+        Pages through the change log starting after the specified token until it's caught up
+
+        :param str or None start_token: Change token to start from, the beginning of the change log if omitted
+        :return: Net changes ordered by their latest change and the token of the last change
+        :rtype: (list[ChangeDelta], str or None)
+        """
+        merged = OrderedDict()
+        token = start_token
+        while True:
+            query = copy.copy(self._query)
+            query.ChangeTokenStart = ChangeToken(token) if token else None
+            query.FetchLimit = self.page_size
+            changes = self._source.get_changes(query).execute_query()
+            for change in changes:
+                self._merge(merged, change)
+            if len(changes) > 0:
+                token = changes[len(changes) - 1].change_token.StringValue
+            if len(changes) < self.page_size:
+                break
+        return [d for d in merged.values() if d is not None], token
+
+    def _merge(self, merged, change):
+        """
+        Merges the change into the net change of the object, the latest changes are kept at the end
+
+        :type merged: OrderedDict
+        :type change: office365.sharepoint.changes.change.Change
+        """
+        key = self._get_key(change)
+        action = self._get_action(change)
+        if key in merged:
+            previous = merged.pop(key)
+            if previous is None:
+                if action == ChangeDelta.Deleted:
+                    merged[key] = None
+                    return
+            elif previous.action == ChangeDelta.Added:
+                if action == ChangeDelta.Deleted:
+                    merged[key] = None
+                    return
+                action = ChangeDelta.Added
+            elif previous.action == ChangeDelta.Deleted and action == ChangeDelta.Added:
+                action = ChangeDelta.Updated
+        merged[key] = ChangeDelta(key, action, change)
+
+    def _get_action(self, change):
+        """
+        :type change: office365.sharepoint.changes.change.Change
+        """
+        change_type = change.change_type
+        if isinstance(change_type, int) and 0 <= change_type < len(self._change_types):
+            change_type = self._change_types[change_type]
+        return self._actions.get(change_type, ChangeDelta.Updated)
+
+    def _get_key(self, change):
+        """
+        :type change: office365.sharepoint.changes.change.Change
+        """
+        return (change.entity_type_name,) + tuple(change.properties.get(n) for n in self._key_properties
+                                                  if n in change.properties)
+
+    def _get_current_token(self):
+        if not hasattr(self._source, "current_change_token"):
+            return None
+        self._source.get().select(["CurrentChangeToken"]).execute_query()
+        return self._source.current_change_token.StringValue
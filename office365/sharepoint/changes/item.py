@@ -6,6 +6,42 @@ from office365.sharepoint.sharing.shared_with_user import SharedWithUser
 class ChangeItem(Change):
     """A change on an item."""
 
+    @property
+    def item_id(self):
+        """
+        Identifies the list item that has changed
+
+        :rtype: int or None
+        """
+        return self.properties.get("ItemId", None)
+
+    @property
+    def list_id(self):
+        """
+        Identifies the list that contains the changed item
+
+        :rtype: str or None
+        """
+        return self.properties.get("ListId", None)
+
+    @property
+    def unique_id(self):
+        """
+        Unique identifier of the changed item
+
+        :rtype: str or None
+        """
+        return self.properties.get("UniqueId", None)
+
+    @property
+    def web_id(self):
+        """
+        Identifies the site that contains the changed item
+
+        :rtype: str or None
+        """
+        return self.properties.get("WebId", None)
+
     @property
     def shared_with_users(self):
         return self.properties.get("SharedWithUsers", ClientValueCollection(SharedWithUser))
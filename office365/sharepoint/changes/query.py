@@ -10,7 +10,7 @@ class ChangeQuery(ClientValue):
                  view=False, content_type=False,
                  add=True, update=True, system_update=True, delete_object=True,
                  role_assignment_add=True, role_assignment_delete=True,
-                 change_token_start=None, change_token_end=None, fetch_limit=None):
+                 change_token_start=None, change_token_end=None, fetch_limit=None, field=False):
         """
         :param int fetch_limit:
         :param role_assignment_delete: Specifies whether deleting role assignments is included in the query.
@@ -36,6 +36,7 @@ class ChangeQuery(ClientValue):
             are included in the query.
         :param bool web: Gets or sets a value that specifies whether changes to Web sites are included in the query.
         :param bool list_: Gets or sets a value that specifies whether changes to lists are included in the query.
+        :param bool field: Gets or sets a value that specifies whether changes to fields are included in the query.
         """
         super(ChangeQuery, self).__init__()
         self.Item = item
@@ -50,6 +51,7 @@ class ChangeQuery(ClientValue):
         self.User = user
         self.Group = group
         self.View = view
+        self.Field = field
         self.Add = add
         self.Update = update
         self.SystemUpdate = system_update
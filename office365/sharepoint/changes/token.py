@@ -5,9 +5,12 @@ class ChangeToken(ClientValue):
     """Represents the unique sequential location of a change within the change log. Client applications can use the
     change token as a starting point for retrieving changes."""
 
-    def __init__(self):
+    def __init__(self, string_value=None):
+        """
+        :param str or None string_value: Serialized value of the change token
+        """
         super(ChangeToken, self).__init__()
-        self.StringValue = None
+        self.StringValue = string_value
 
     def __repr__(self):
         return self.StringValue
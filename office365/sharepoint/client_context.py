@@ -13,14 +13,9 @@ from office365.runtime.queries.delete_entity import DeleteEntityQuery
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.runtime.queries.update_entity import UpdateEntityQuery
 from office365.runtime.paths.resource_path import ResourcePath
-from office365.sharepoint.portal.site_status import SiteStatus
-from office365.sharepoint.publishing.pages.service import SitePageService
-from office365.sharepoint.request_user_context import RequestUserContext
-from office365.sharepoint.sites.site import Site
-from office365.sharepoint.tenant.administration.hub_site_collection import HubSiteCollection
-from office365.sharepoint.webs.context_web_information import ContextWebInformation
-from office365.sharepoint.webs.web import Web
 from office365.runtime.compat import urlparse, is_absolute_url, get_absolute_url
+from office365.sharepoint.lists.schema_cache import SchemaCache
+from office365.sharepoint.webs.form_digest_cache import FormDigestCache
 
 
 class ClientContext(ClientRuntimeContext):
@@ -41,6 +36,8 @@ class ClientContext(ClientRuntimeContext):
         self._site = None
         self._ctx_web_info = None
         self._pending_request = None
+        self.form_digest_cache = FormDigestCache()
+        self.schema_cache = SchemaCache()
 
     def create_safe_url(self, orig_url, relative=True):
         """
@@ -65,6 +62,7 @@ class ClientContext(ClientRuntimeContext):
         :param str full_url: Full Url to a resource
         :return: ClientContext
         """
+        from office365.sharepoint.webs.web import Web
         root_site_url = get_absolute_url(full_url)
         ctx = ClientContext(root_site_url)
         result = Web.get_web_url_from_page_url(ctx, full_url)
@@ -123,13 +121,15 @@ class ClientContext(ClientRuntimeContext):
         self.authentication_context.with_credentials(credentials)
         return self
 
-    def execute_batch(self, items_per_batch=100):
+    def execute_batch(self, items_per_batch=100, part_failed=None):
         """
         Construct and submit a batch request
 
         :param int items_per_batch: Maximum to be selected for bulk operation
+        :param (ClientQuery, requests.Response)->None part_failed: Invoked for every failed query instead of
+            raising an error, so that the rest of queries are processed
         """
-        batch_request = ODataBatchV3Request(self, items_per_batch)
+        batch_request = ODataBatchV3Request(self, items_per_batch, part_failed)
 
         def _prepare_batch_request(request):
             self.ensure_form_digest(request)
@@ -160,14 +160,18 @@ class ClientContext(ClientRuntimeContext):
 
     def ensure_form_digest(self, request_options):
         """
+        Sets the form digest of the web, the digest is taken from the cache shared by the context clones
+        and renewed ahead of its expiry
+
         :type request_options: RequestOptions
         """
-        if not self.context_info.is_valid:
-            self._ctx_web_info = self.get_context_web_information(request_options=request_options)
+        self._ctx_web_info = self.form_digest_cache.get_or_fetch(
+            self.base_url, lambda: self.get_context_web_information(request_options=request_options))
         request_options.set_header('X-RequestDigest', self._ctx_web_info.FormDigestValue)
 
     def get_context_web_information(self, request_options=None):
         """Returns an ContextWebInformation object that specifies metadata about the site"""
+        from office365.sharepoint.webs.context_web_information import ContextWebInformation
         request = RequestOptions("contextInfo")
         request.method = HttpMethod.Post
         if request_options:
@@ -183,6 +187,7 @@ class ClientContext(ClientRuntimeContext):
 
     def get_context_web_information_ex(self):
         """Returns an ContextWebInformation object that specifies metadata about the site"""
+        from office365.sharepoint.webs.context_web_information import ContextWebInformation
         return_type = ClientResult(self, ContextWebInformation())
 
         def _construct_request(request):
@@ -227,13 +232,32 @@ class ClientContext(ClientRuntimeContext):
         :param str url: Site Url
         :return ClientContext
         """
-        ctx = copy.deepcopy(self)
+        ctx = copy.deepcopy(self, {id(self.session): self.session})
         ctx._auth_context.url = url
-        ctx._ctx_web_info = None
+        ctx._ctx_web_info = ctx.form_digest_cache.get(url)
         if clear_queries:
             ctx.clear()
         return ctx
 
+    def create_context(self, url=None):
+        """
+        Creates a lightweight context which shares the token provider, the session and the caches with the current
+        one, unlike clone the current context is not copied
+
+        :param str or None url: Absolute Web or Site Url, the url of the current context by default
+        :rtype: ClientContext
+        """
+        url = url or self.base_url
+        ctx = ClientContext(url, self.authentication_context.clone(url))
+        ctx.session = self.session
+        ctx.form_digest_cache = self.form_digest_cache
+        ctx.schema_cache = self.schema_cache
+        ctx.queryExecuted = self.queryExecuted
+        ctx.profiler = self.profiler
+        ctx.response_cache = self.response_cache
+        ctx.model_registry = self.model_registry
+        return ctx
+
     def authenticate_request(self, request):
         self.authentication_context.authenticate_request(request)
 
@@ -263,6 +287,8 @@ class ClientContext(ClientRuntimeContext):
         :param str title: Site title
         :param bool is_public:
         """
+        from office365.sharepoint.portal.site_status import SiteStatus
+        from office365.sharepoint.sites.site import Site
         result = self.group_site_manager.create_group_ex(title, alias, is_public)
         return_type = Site(self)
 
@@ -286,6 +312,8 @@ class ClientContext(ClientRuntimeContext):
         :param str alias: Site alias which defines site url, e.g. https://contoso.sharepoint.com/sites/{alias}
         :param str title: Site title
         """
+        from office365.sharepoint.portal.site_status import SiteStatus
+        from office365.sharepoint.sites.site import Site
         return_type = Site(self)
         result = self.site_pages.communication_site.create(alias, title)
 
@@ -307,6 +335,7 @@ class ClientContext(ClientRuntimeContext):
 
         :rtype: ContextWebInformation
         """
+        from office365.sharepoint.webs.context_web_information import ContextWebInformation
         if self._ctx_web_info is None:
             self._ctx_web_info = ContextWebInformation()
         return self._ctx_web_info
@@ -314,6 +343,7 @@ class ClientContext(ClientRuntimeContext):
     @property
     def web(self):
         """Get Web client object"""
+        from office365.sharepoint.webs.web import Web
         if not self._web:
             self._web = Web(self)
         return self._web
@@ -321,6 +351,7 @@ class ClientContext(ClientRuntimeContext):
     @property
     def site(self):
         """Get Site client object"""
+        from office365.sharepoint.sites.site import Site
         if not self._site:
             self._site = Site(self)
         return self._site
@@ -328,6 +359,7 @@ class ClientContext(ClientRuntimeContext):
     @property
     def me(self):
         """Gets the user context for the present request"""
+        from office365.sharepoint.request_user_context import RequestUserContext
         return RequestUserContext(self, ResourcePath("Me"))
 
     @property
@@ -369,11 +401,13 @@ class ClientContext(ClientRuntimeContext):
     @property
     def hub_sites(self):
         """Alias to HubSiteCollection. Gets information about all hub sites that the current user can access."""
+        from office365.sharepoint.tenant.administration.hub_site_collection import HubSiteCollection
         return HubSiteCollection(self, ResourcePath("hubSites"))
 
     @property
     def site_pages(self):
         """Alias to SitePageService. Represents a set of APIs to use for managing site pages."""
+        from office365.sharepoint.publishing.pages.service import SitePageService
         return SitePageService(self, ResourcePath("sitePages"))
 
     @property
@@ -0,0 +1,127 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from office365.runtime.auth.authentication_context import AuthenticationContext
+from office365.runtime.auth.user_credential import UserCredential
+from office365.runtime.compat import get_absolute_url
+from office365.runtime.types.event_handler import SharedEventHandler
+from office365.sharepoint.client_context import ClientContext
+from office365.sharepoint.lists.schema_cache import SchemaCache
+from office365.sharepoint.webs.form_digest_cache import FormDigestCache
+
+
+class ClientContextFactory(object):
+    """
+    Creates lightweight per-site contexts which share a token provider (per host), a HTTP connection pool,
+    form digest and schema caches, an alternative to ClientContext.clone which copies the whole context:
+
+        factory = ClientContextFactory().with_credentials(credentials)
+        for site_url in site_urls:
+            ctx = factory.create(site_url)
+            ctx.web.get().execute_query()
+
+    Contexts are not thread-safe, a context per site (or per worker) is expected to be created.
+    """
+
+    def __init__(self, max_connections=10, session=None):
+        """
+        :param int max_connections: Maximum number of connections kept open per host
+        :param requests.Session or None session: Session used to send the requests
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=max_connections)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.form_digest_cache = FormDigestCache()
+        self.schema_cache = SchemaCache()
+        self.queryExecuted = SharedEventHandler()
+        self.profiler = None
+        self.response_cache = None
+        self.model_registry = None
+        self._configure_auth = None
+        self._auth_contexts = {}
+        self._lock = threading.Lock()
+
+    def with_client_certificate(self, tenant, client_id, thumbprint, cert_path, **kwargs):
+        """
+        :param str tenant: Tenant name
+        :param str cert_path: Path to A PEM encoded certificate private key.
+        :param str thumbprint: Hex encoded thumbprint of the certificate.
+        :param str client_id: The OAuth client id of the calling application.
+        """
+        return self._with_auth(lambda auth_context: auth_context.with_client_certificate(
+            tenant, client_id, thumbprint, cert_path, **kwargs))
+
+    def with_access_token(self, token_func):
+        """
+        :type token_func: () -> office365.runtime.auth.token_response.TokenResponse
+        """
+        return self._with_auth(lambda auth_context: auth_context.with_access_token(token_func))
+
+    def with_user_credentials(self, username, password, allow_ntlm=False, browser_mode=False):
+        """
+        :type username: str
+        :type password: str
+        :type allow_ntlm: bool
+        :type browser_mode: bool
+        """
+        return self._with_auth(lambda auth_context: auth_context.with_credentials(
+            UserCredential(username, password), allow_ntlm=allow_ntlm, browser_mode=browser_mode))
+
+    def with_credentials(self, credentials):
+        """
+        :type credentials: UserCredential or office365.runtime.auth.client_credential.ClientCredential
+        """
+        return self._with_auth(lambda auth_context: auth_context.with_credentials(credentials))
+
+    def create(self, url):
+        """
+        Creates a context for the site
+
+        :param str url: Absolute Web or Site Url
+        :rtype: ClientContext
+        """
+        if self._configure_auth is None:
+            raise ValueError("Credentials are not specified")
+        ctx = ClientContext(url, self._get_auth_context(url).clone(url))
+        ctx.session = self.session
+        ctx.form_digest_cache = self.form_digest_cache
+        ctx.schema_cache = self.schema_cache
+        ctx.queryExecuted = self.queryExecuted
+        ctx.profiler = self.profiler
+        ctx.response_cache = self.response_cache
+        ctx.model_registry = self.model_registry
+        return ctx
+
+    def close(self):
+        """Closes the connections of the session"""
+        self.session.close()
+
+    def _with_auth(self, configure_auth):
+        """
+        :type configure_auth: (AuthenticationContext) -> None
+        """
+        with self._lock:
+            self._configure_auth = configure_auth
+            self._auth_contexts = {}
+        return self
+
+    def _get_auth_context(self, url):
+        """
+        Returns the authentication context of the host, tokens are issued per host
+
+        :type url: str
+        :rtype: AuthenticationContext
+        """
+        root_url = get_absolute_url(url).lower()
+        with self._lock:
+            auth_context = self._auth_contexts.get(root_url, None)
+            if auth_context is None:
+                auth_context = AuthenticationContext(root_url)
+                self._configure_auth(auth_context)
+                self._auth_contexts[root_url] = auth_context
+            return auth_context
@@ -227,6 +227,15 @@ class Field(BaseEntity):
         """
         self.set_property("Hidden", val)
 
+    @property
+    def indexed(self):
+        """
+        Gets a value that specifies whether the field is indexed.
+
+        :rtype: bool or None
+        """
+        return self.properties.get('Indexed', None)
+
     @property
     def default_value(self):
         """
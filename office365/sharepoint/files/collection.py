@@ -27,22 +27,26 @@ class FileCollection(BaseEntityCollection):
         self.context.add_query(qry)
         return qry.return_type
 
-    def create_upload_session(self, source_path, chunk_size, chunk_uploaded=None, **kwargs):
+    def create_upload_session(self, source_path, chunk_size, chunk_uploaded=None, hash_object=None, **kwargs):
         """Upload a file as multiple chunks
 
         :param str source_path: path where file to upload resides
         :param int chunk_size: upload chunk size (in bytes)
         :param (long)->None or None chunk_uploaded: uploaded event
+        :param hash_object: Hash object (e.g. hashlib.sha256()) the content is hashed with in the same pass
+            it is read, the size of the committed file is verified once the upload is finished
         :param kwargs: arguments to pass to chunk_uploaded function
         """
         file_size = os.path.getsize(source_path)
         if file_size > chunk_size:
-            qry = create_upload_session_query(self, source_path, chunk_size, chunk_uploaded, **kwargs)
+            qry = create_upload_session_query(self, source_path, chunk_size, chunk_uploaded, hash_object, **kwargs)
             self.context.add_query(qry)
             return qry.return_type
         else:
             with open(source_path, 'rb') as content_file:
                 file_content = content_file.read()
+            if hash_object is not None:
+                hash_object.update(file_content)
             return self.upload(os.path.basename(source_path), file_content)
 
     def add(self, file_creation_information):
@@ -4,6 +4,7 @@ from office365.runtime.queries.update_entity import UpdateEntityQuery
 from office365.runtime.paths.resource_path import ResourcePath
 from office365.sharepoint.base_entity import BaseEntity
 from office365.sharepoint.changes.collection import ChangeCollection
+from office365.sharepoint.changes.feed import ChangeFeed
 from office365.sharepoint.changes.query import ChangeQuery
 from office365.sharepoint.contenttypes.content_type_id import ContentTypeId
 from office365.sharepoint.listitems.listitem import ListItem
@@ -132,6 +133,30 @@ class Folder(BaseEntity):
         self.context.add_query(qry)
         return changes
 
+    def get_change_feed(self, query=None, token_store=None, **kwargs):
+        """Returns the incremental synchronization of the change log, the last processed change token is kept
+        in the token store.
+
+        :param office365.sharepoint.changes.query.ChangeQuery query: Specifies which changes to return
+        :param office365.runtime.state_store.StateStore token_store: Keeps the last processed token
+        :rtype: office365.sharepoint.changes.feed.ChangeFeed
+        """
+        return ChangeFeed(self, query, token_store, **kwargs)
+
+    def walk(self, max_workers=4, batch_size=1, max_depth=None, item_filter=None, folder_filter=None):
+        """Walks the folder tree breadth-first, sibling folders are listed concurrently.
+        Yields (path, item) pairs where path is relative to the folder and item is either a File or a Folder.
+
+        :param int max_workers: Maximum number of requests submitted in parallel
+        :param int batch_size: Number of folders listed per request, $batch request is submitted if greater than 1
+        :param int or None max_depth: Maximum depth to descend to
+        :param (str, File or Folder) -> bool item_filter: Determines whether the item is yielded
+        :param (str, Folder) -> bool folder_filter: Determines whether the folder is walked
+        :rtype: office365.sharepoint.folders.tree_walker.FolderTreeWalker
+        """
+        from office365.sharepoint.folders.tree_walker import FolderTreeWalker
+        return FolderTreeWalker(self, max_workers, batch_size, max_depth, item_filter, folder_filter)
+
     def get_list_item_changes(self, query):
         """
         Gets the collection of all changes from the change log that have occurred within the scope of the SharePoint
@@ -0,0 +1,76 @@
+import os
+
+from office365.runtime.transfers.manager import TransferManager, TransferItem
+from office365.sharepoint.folders.folder import Folder
+from office365.sharepoint.folders.tree_walker import FolderTreeWalker
+
+
+class FolderTransferManager(TransferManager):
+    """Transfers a directory tree between a local file system and a SharePoint folder"""
+
+    def _create_context(self):
+        return self._context.clone(self._context.base_url)
+
+    def _resolve_reference(self, folder):
+        """
+        :type folder: office365.sharepoint.folders.folder.Folder
+        """
+        if not folder.is_property_available("ServerRelativeUrl"):
+            folder.get().execute_query()
+        return folder.serverRelativeUrl
+
+    def _list_remote(self, folder_ref):
+        files = {}
+        folders = {}
+        root = self._context.web.get_folder_by_server_relative_path(folder_ref)
+        root.set_property("ServerRelativeUrl", folder_ref, False)
+        for path, item in FolderTreeWalker(root, self.max_workers):
+            if isinstance(item, Folder):
+                folders[path] = item.serverRelativeUrl
+            else:
+                files[path] = TransferItem(path, item.length, self._parse_timestamp(item.time_last_modified),
+                                           reference=item.serverRelativeUrl)
+        return files, folders
+
+    def _create_folder(self, parent_ref, name):
+        parent_folder = self._context.web.get_folder_by_server_relative_path(parent_ref)
+        folder = parent_folder.folders.add(name).execute_query()
+        return folder.serverRelativeUrl
+
+    def _upload_file(self, context, folder_ref, local_item, bytes_transferred):
+        """
+        :type context: office365.sharepoint.client_context.ClientContext
+        :type local_item: TransferItem
+        """
+        target_files = context.web.get_folder_by_server_relative_path(folder_ref).files
+        if local_item.size > self.large_file_threshold:
+            state = {"uploaded": 0}
+
+            def _chunk_uploaded(uploaded_bytes):
+                bytes_transferred(uploaded_bytes - state["uploaded"])
+                state["uploaded"] = uploaded_bytes
+
+            target_files.create_upload_session(local_item.reference, self.chunk_size, _chunk_uploaded)
+            context.execute_query()
+        else:
+            with open(local_item.reference, 'rb') as f:
+                content = f.read()
+            target_files.upload(local_item.name, content).execute_query()
+            bytes_transferred(local_item.size)
+
+    def _download_file(self, context, remote_item, file_path, bytes_transferred):
+        """
+        :type context: office365.sharepoint.client_context.ClientContext
+        :type remote_item: TransferItem
+        """
+        state = {"downloaded": 0}
+
+        def _chunk_downloaded(downloaded_bytes):
+            bytes_transferred(downloaded_bytes - state["downloaded"])
+            state["downloaded"] = downloaded_bytes
+
+        source_file = context.web.get_file_by_server_relative_path(remote_item.reference)
+        with open(file_path, 'wb') as f:
+            source_file.download_session(f, _chunk_downloaded, self.chunk_size).execute_query()
+        if remote_item.modified is not None:
+            os.utime(file_path, (remote_item.modified, remote_item.modified))
@@ -0,0 +1,45 @@
+from office365.runtime.tree_walker import TreeWalker
+from office365.sharepoint.folders.folder import Folder
+
+
+class FolderTreeWalker(TreeWalker):
+    """Walks a SharePoint folder tree, files and folders of a folder are retrieved with a single request"""
+
+    def _create_context(self):
+        return self._root.context.clone(self._root.context.base_url)
+
+    def _resolve_reference(self, folder):
+        """
+        :type folder: Folder
+        """
+        if not folder.is_property_available("ServerRelativeUrl"):
+            folder.get().execute_query()
+        return folder.serverRelativeUrl
+
+    def _get_reference(self, item):
+        """
+        :type item: Folder
+        """
+        return item.serverRelativeUrl
+
+    def _list_children(self, context, folder_refs):
+        """
+        :type context: office365.sharepoint.client_context.ClientContext
+        :type folder_refs: list[str]
+        """
+        folders = [context.web.get_folder_by_server_relative_path(url).expand(["Files", "Folders"]).get()
+                   for url in folder_refs]
+        if len(folders) > 1:
+            context.execute_batch(self.batch_size)
+        else:
+            context.execute_query()
+        return [list(folder.folders) + list(folder.files) for folder in folders]
+
+    def _get_name(self, item):
+        """
+        :type item: Folder or office365.sharepoint.files.file.File
+        """
+        return item.name
+
+    def _is_folder(self, item):
+        return isinstance(item, Folder)
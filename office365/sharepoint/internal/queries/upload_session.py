@@ -2,17 +2,19 @@ import os
 import uuid
 
 from office365.runtime.client_result import ClientResult
+from office365.runtime.transfers.mapped_file import open_upload_source
 from office365.sharepoint.internal.queries.create_file import create_file_query
 from office365.sharepoint.files.file import File
 from office365.sharepoint.files.creation_information import FileCreationInformation
 
 
-def create_upload_session_query(binding_type, source_path, chunk_size, chunk_uploaded, **kwargs):
+def create_upload_session_query(binding_type, source_path, chunk_size, chunk_uploaded, hash_object=None, **kwargs):
     """
     :type binding_type: office365.sharepoint.files.collection.FileCollection
     :type source_path: str
     :type chunk_size: int
     :type chunk_uploaded: (int, *)->None
+    :param hash_object: Hash object (hashlib compatible) updated with every chunk as it is being read
     """
     create_info = FileCreationInformation()
     create_info.url = os.path.basename(source_path)
@@ -24,7 +26,10 @@ def create_upload_session_query(binding_type, source_path, chunk_size, chunk_upl
     file_size = os.stat(source_path).st_size
 
     def _read_next(file_object):
-        return file_object.read(chunk_size)
+        content = file_object.read(chunk_size)
+        if hash_object is not None:
+            hash_object.update(content)
+        return content
 
     def _has_pending_read(file_object):
         bytes_read = file_object.tell()
@@ -34,7 +39,7 @@ def create_upload_session_query(binding_type, source_path, chunk_size, chunk_upl
         return True
 
     def _start_upload(resp):
-        file_object = open(source_path, 'rb')
+        file_object = open_upload_source(source_path)
         _upload_next(resp, file_object=file_object, return_type=qry.return_type)
 
     def _upload_next(response, file_object, return_type):
@@ -53,6 +58,9 @@ def create_upload_session_query(binding_type, source_path, chunk_size, chunk_upl
             chunk_uploaded(uploaded_bytes, **kwargs)
 
         if not _has_pending_read(file_object):
+            if isinstance(return_type, File) and uploaded_bytes != file_size:
+                raise ValueError("Upload size mismatch: {0} bytes sent, {1} bytes committed by the server".format(
+                    file_size, uploaded_bytes))
             return
 
         content = _read_next(file_object)
@@ -0,0 +1,215 @@
+import datetime
+from xml.sax.saxutils import escape, quoteattr
+
+from office365.runtime.compat import is_string_type
+
+
+class CamlExpression(object):
+    """Base class for CAML query expressions"""
+
+    def to_xml(self):
+        """
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    @property
+    def field_names(self):
+        """
+        Internal names of fields the expression refers to
+
+        :rtype: list[str]
+        """
+        return []
+
+    def is_indexed(self, indexed_fields):
+        """
+        Determines whether the expression could be resolved using column indexes only
+
+        :param set[str] indexed_fields: Internal names of indexed fields
+        """
+        return all(name in indexed_fields for name in self.field_names)
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __str__(self):
+        return self.to_xml()
+
+
+def _field_ref(name):
+    return "<FieldRef Name={0} />".format(quoteattr(name))
+
+
+def _value(value, value_type=None):
+    """
+    :type value: any
+    :param str or None value_type: CAML value type, resolved from the Python type if omitted
+    """
+    attrs = ""
+    if isinstance(value, bool):
+        value_type = value_type or "Boolean"
+        value = 1 if value else 0
+    elif isinstance(value, datetime.datetime):
+        value_type = value_type or "DateTime"
+        attrs = " IncludeTimeValue=\"TRUE\""
+        value = value.strftime("%Y-%m-%dT%H:%M:%SZ")
+    elif isinstance(value, datetime.date):
+        value_type = value_type or "DateTime"
+        value = value.strftime("%Y-%m-%d")
+    elif isinstance(value, int):
+        value_type = value_type or "Integer"
+    elif isinstance(value, float):
+        value_type = value_type or "Number"
+    else:
+        value_type = value_type or "Text"
+    value = value if is_string_type(value) else str(value)
+    return "<Value Type={0}{1}>{2}</Value>".format(quoteattr(value_type), attrs, escape(value))
+
+
+class FieldExpression(CamlExpression):
+    """Comparison of a field with a value"""
+
+    operator = None
+
+    def __init__(self, field_name, value, value_type=None):
+        """
+        :param str field_name: Field internal name
+        :param any value: Value to compare with
+        :param str or None value_type: CAML value type (e.g. Text, Integer, Counter, DateTime, Lookup)
+        """
+        self.field_name = field_name
+        self.value = value
+        self.value_type = value_type
+
+    def to_xml(self):
+        return "<{0}>{1}{2}</{0}>".format(self.operator, _field_ref(self.field_name),
+                                          _value(self.value, self.value_type))
+
+    @property
+    def field_names(self):
+        return [self.field_name]
+
+
+class Eq(FieldExpression):
+    operator = "Eq"
+
+
+class Neq(FieldExpression):
+    operator = "Neq"
+
+
+class Gt(FieldExpression):
+    operator = "Gt"
+
+
+class Geq(FieldExpression):
+    operator = "Geq"
+
+
+class Lt(FieldExpression):
+    operator = "Lt"
+
+
+class Leq(FieldExpression):
+    operator = "Leq"
+
+
+class BeginsWith(FieldExpression):
+    operator = "BeginsWith"
+
+
+class Contains(FieldExpression):
+    operator = "Contains"
+
+
+class IsNull(CamlExpression):
+
+    operator = "IsNull"
+
+    def __init__(self, field_name):
+        """
+        :param str field_name: Field internal name
+        """
+        self.field_name = field_name
+
+    def to_xml(self):
+        return "<{0}>{1}</{0}>".format(self.operator, _field_ref(self.field_name))
+
+    @property
+    def field_names(self):
+        return [self.field_name]
+
+
+class IsNotNull(IsNull):
+    operator = "IsNotNull"
+
+
+class In(CamlExpression):
+    """Matches a field against a set of values"""
+
+    def __init__(self, field_name, values, value_type=None):
+        """
+        :param str field_name: Field internal name
+        :param list values: Values to match
+        :param str or None value_type: CAML value type
+        """
+        self.field_name = field_name
+        self.values = list(values)
+        self.value_type = value_type
+
+    def to_xml(self):
+        values = "".join(_value(v, self.value_type) for v in self.values)
+        return "<In>{0}<Values>{1}</Values></In>".format(_field_ref(self.field_name), values)
+
+    @property
+    def field_names(self):
+        return [self.field_name]
+
+
+class LogicalExpression(CamlExpression):
+    """
+    Logical join of expressions, CAML logical operators are binary hence more than two operands
+    are compiled into nested elements
+    """
+
+    operator = None
+
+    def __init__(self, *expressions):
+        """
+        :type expressions: CamlExpression
+        """
+        self.expressions = []
+        for expr in expressions:
+            if isinstance(expr, self.__class__):
+                self.expressions.extend(expr.expressions)
+            else:
+                self.expressions.append(expr)
+
+    def to_xml(self):
+        result = self.expressions[-1].to_xml()
+        for expr in reversed(self.expressions[:-1]):
+            result = "<{0}>{1}{2}</{0}>".format(self.operator, expr.to_xml(), result)
+        return result
+
+    @property
+    def field_names(self):
+        return [name for expr in self.expressions for name in expr.field_names]
+
+
+class And(LogicalExpression):
+    operator = "And"
+
+    def is_indexed(self, indexed_fields):
+        """An index on any of the operands is sufficient to narrow the result"""
+        return any(expr.is_indexed(indexed_fields) for expr in self.expressions)
+
+
+class Or(LogicalExpression):
+    operator = "Or"
+
+    def is_indexed(self, indexed_fields):
+        return all(expr.is_indexed(indexed_fields) for expr in self.expressions)
@@ -0,0 +1,160 @@
+from xml.sax.saxutils import quoteattr
+
+from office365.logger import LoggerContext
+from office365.sharepoint.listitems.caml.expressions import And
+from office365.sharepoint.listitems.caml.query import CamlQuery
+
+
+class CamlQueryBuilder(LoggerContext):
+    """
+    Builds a CAML query from expressions, for example:
+
+        builder = CamlQueryBuilder().where(Eq("Status", "Active") & Geq("Modified", since))
+        query = builder.view_fields("Title", "Status").order_by("ID").row_limit(1000).build()
+
+    The compiled ViewXml is cached until the builder gets modified.
+    """
+
+    always_indexed_fields = {"ID", "Id"}
+
+    def __init__(self, scope=None):
+        """
+        :param str or None scope: View scope (see ViewScope)
+        """
+        self._scope = scope
+        self._where = None
+        self._view_fields = []
+        self._order_by = []
+        self._row_limit = None
+        self._paged = True
+        self._view_xml = None
+
+    def where(self, expression):
+        """
+        :type expression: office365.sharepoint.listitems.caml.expressions.CamlExpression
+        """
+        self._where = expression
+        self._view_xml = None
+        return self
+
+    def view_fields(self, *names):
+        """
+        Restricts returned fields
+
+        :param str names: Field internal names
+        """
+        self._view_fields = list(names)
+        self._view_xml = None
+        return self
+
+    def order_by(self, name, ascending=True):
+        """
+        :param str name: Field internal name
+        :param bool ascending: Sort order
+        """
+        self._order_by.append((name, ascending))
+        self._view_xml = None
+        return self
+
+    def row_limit(self, value, paged=True):
+        """
+        :param int value: Maximum number of items returned per request
+        :param bool paged: Whether the result could be requested page by page
+        """
+        self._row_limit = value
+        self._paged = paged
+        self._view_xml = None
+        return self
+
+    @property
+    def view_xml(self):
+        """
+        :rtype: str
+        """
+        if self._view_xml is None:
+            self._view_xml = self._compile()
+        return self._view_xml
+
+    def build(self, folder_server_relative_url=None):
+        """
+        :param str or None folder_server_relative_url: Folder to return the items from
+        :rtype: CamlQuery
+        """
+        return CamlQuery(view_xml=self.view_xml, folder_server_relative_url=folder_server_relative_url)
+
+    def check_indexes(self, target_list=None, reorder=True, indexed_fields=None):
+        """
+        Checks whether the filter and the sort order could be resolved using indexed columns of the list.
+        Operands of And expressions on indexed columns are moved to the front, since the first indexed
+        condition determines whether a query is subject to the list view threshold.
+        A warning is logged for the conditions which require a full scan.
+
+        Unless indexed_fields are specified, fields of the list are requested (a blocking round trip) via a
+        separate context, so that the pending queries of the list context are not submitted.
+
+        :type target_list: office365.sharepoint.lists.list.List or None
+        :param bool reorder: Whether to reorder operands of And expressions
+        :param collections.Iterable[str] or None indexed_fields: Internal names of indexed fields of the list
+        :return: Internal names of non-indexed fields used in the query
+        :rtype: list[str]
+        """
+        if indexed_fields is None:
+            if target_list is None:
+                raise ValueError("Either target list or indexed fields have to be specified")
+            indexed_fields = self._get_indexed_fields(target_list)
+        indexed_fields = set(self.always_indexed_fields) | set(indexed_fields)
+
+        if reorder and self._where is not None:
+            self._where = self._reorder(self._where, indexed_fields)
+            self._view_xml = None
+
+        logger = self.logger(self.check_indexes.__name__)
+        field_names = [] if self._where is None else self._where.field_names
+        field_names += [name for name, _ in self._order_by]
+        not_indexed = sorted(set(name for name in field_names if name not in indexed_fields))
+        if self._where is not None and not self._where.is_indexed(indexed_fields):
+            logger.warning("The filter could not be resolved using indexed columns, non-indexed columns: %s",
+                           ", ".join(not_indexed))
+        for name, _ in self._order_by:
+            if name not in indexed_fields:
+                logger.warning("Sorting by non-indexed column '%s' requires a full scan", name)
+        return not_indexed
+
+    @staticmethod
+    def _get_indexed_fields(target_list):
+        """
+        :type target_list: office365.sharepoint.lists.list.List
+        """
+        context = target_list.context.create_context()
+        fields = target_list.__class__(context, target_list.resource_path).fields
+        fields.select(["InternalName", "Indexed"]).get().execute_query()
+        return [f.internal_name for f in fields if f.indexed]
+
+    def _reorder(self, expression, indexed_fields):
+        """
+        :type expression: office365.sharepoint.listitems.caml.expressions.CamlExpression
+        :type indexed_fields: set[str]
+        """
+        if isinstance(expression, And):
+            operands = [self._reorder(expr, indexed_fields) for expr in expression.expressions]
+            operands.sort(key=lambda expr: not expr.is_indexed(indexed_fields))
+            return And(*operands)
+        return expression
+
+    def _compile(self):
+        query = ""
+        if self._where is not None:
+            query += "<Where>{0}</Where>".format(self._where.to_xml())
+        if self._order_by:
+            query += "<OrderBy>{0}</OrderBy>".format("".join(
+                "<FieldRef Name={0} Ascending=\"{1}\" />".format(quoteattr(name), "TRUE" if asc else "FALSE")
+                for name, asc in self._order_by))
+        result = "<View{0}><Query>{1}</Query>".format(
+            " Scope={0}".format(quoteattr(self._scope)) if self._scope else "", query)
+        if self._view_fields:
+            result += "<ViewFields>{0}</ViewFields>".format(
+                "".join("<FieldRef Name={0} />".format(quoteattr(name)) for name in self._view_fields))
+        if self._row_limit is not None:
+            paged = "TRUE" if self._paged else "FALSE"
+            result += "<RowLimit Paged=\"{0}\">{1}</RowLimit>".format(paged, self._row_limit)
+        return result + "</View>"
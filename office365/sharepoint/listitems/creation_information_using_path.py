@@ -17,3 +17,7 @@ class ListItemCreationInformationUsingPath(ClientValue):
         self.LeafName = leaf_name
         self.UnderlyingObjectType = object_type
         self.FolderPath = folder_path if isinstance(folder_path, SPResPath) else SPResPath(folder_path)
+
+    @property
+    def entity_type_name(self):
+        return "SP.ListItemCreationInformationUsingPath"
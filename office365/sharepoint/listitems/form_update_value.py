@@ -7,18 +7,23 @@ from office365.sharepoint.fields.lookup_value import FieldLookupValue
 class ListItemFormUpdateValue(ClientValue):
     """Specifies the properties of a list item field and its value."""
 
-    def __init__(self, name=None, value=None, has_exception=None, error_code=None):
+    def __init__(self, name=None, value=None, has_exception=None, error_code=None, error_message=None,
+                 item_id=None):
         """
         :param str name: Specifies the field internal name for a field.
         :param str value: Specifies a value for a field.
         :param bool has_exception: Specifies whether there was an error result after validating the value for the field
-        param int ErrorCode: Specifies the error code after validating the value for the field
+        :param int error_code: Specifies the error code after validating the value for the field
+        :param str error_message: Specifies the error message after validating the value for the field
+        :param int item_id: Specifies the identifier of the item the value belongs to (returned by bulk updates)
         """
         super(ListItemFormUpdateValue, self).__init__()
         self.FieldName = name
         self.FieldValue = value
         self.HasException = has_exception
         self.ErrorCode = error_code
+        self.ErrorMessage = error_message
+        self.ItemId = item_id
 
     def to_json(self, json_format=None):
         json = super(ListItemFormUpdateValue, self).to_json(json_format)
@@ -0,0 +1,211 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from requests import HTTPError
+
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.compat import is_py2
+
+if is_py2:
+    from Queue import Queue
+else:
+    from queue import Queue
+
+
+class BulkWriteResult(object):
+    """Outcome of a bulk write"""
+
+    def __init__(self):
+        self.total_rows = 0
+        self.succeeded_rows = 0
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def mark_succeeded(self, count=1):
+        with self._lock:
+            self.total_rows += count
+            self.succeeded_rows += count
+
+    def mark_failed(self, index, error):
+        """
+        :param int index: Row index within the input
+        :param str or Exception error: Error
+        """
+        with self._lock:
+            self.total_rows += 1
+            self.errors[index] = error
+
+    @property
+    def failed_rows(self):
+        return len(self.errors)
+
+    def __repr__(self):
+        return "{0}/{1} rows written, {2} failed".format(self.succeeded_rows, self.total_rows, self.failed_rows)
+
+
+class ListItemBulkWriter(object):
+    """
+    Writes list items in bulk.
+
+    Rows (dicts of field internal names and values) are consumed as a stream in chunks of batch_size,
+    every chunk is submitted as a single $batch request:
+        - a row without Id is inserted via AddValidateUpdateItemUsingPath
+        - rows with Id sharing the same values are updated at once via BulkValidateUpdateListItems
+        - any other row with Id is updated via ValidateUpdateListItem
+
+    Up to max_workers chunks are submitted in parallel, each worker uses a dedicated client context.
+    Validation errors (as well as failed requests) are reported per row and do not stop the load.
+
+    With resolve_field_names enabled, rows could be keyed by field titles as well, names are resolved using
+    the list schema which is kept in the schema cache of the context (so that repeated writes skip loading it).
+    """
+
+    def __init__(self, target_list, batch_size=100, max_workers=2, folder_url=None, row_failed=None,
+                 resolve_field_names=False):
+        """
+        :type target_list: office365.sharepoint.lists.list.List
+        :param int batch_size: Maximum number of operations per $batch request
+        :param int max_workers: Maximum number of batches in flight
+        :param str or None folder_url: Decoded server-relative url of the folder new items are created in
+        :param (int, dict, str or Exception)->None row_failed: Invoked for every row that failed
+        :param bool resolve_field_names: Map field titles to internal names using the list schema
+        """
+        self._list = target_list
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.folder_url = folder_url
+        self._row_failed = row_failed
+        self.resolve_field_names = resolve_field_names
+        self._schema = None
+        self._notify_lock = threading.Lock()
+
+    def write(self, rows):
+        """
+        :param collections.Iterable[dict] rows: Field values, a row with Id (or ID) key updates an existing item
+        :rtype: BulkWriteResult
+        """
+        result = BulkWriteResult()
+        if self.resolve_field_names:
+            self._schema = self._list.context.schema_cache.get(self._list)
+        contexts = Queue()
+        for _ in range(self.max_workers):
+            contexts.put(self._create_context())
+
+        def _write(chunk):
+            context = contexts.get()
+            try:
+                self._write_chunk(context, chunk, result)
+            finally:
+                contexts.put(context)
+
+        numbered_rows = enumerate(rows)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                chunk = list(islice(numbered_rows, self.batch_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_write, chunk))
+                if len(pending) >= self.max_workers:
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+        return result
+
+    def _write_chunk(self, context, chunk, result):
+        """
+        :type context: office365.sharepoint.client_context.ClientContext
+        :type chunk: list[(int, dict)]
+        :type result: BulkWriteResult
+        """
+        target_list = self._list.__class__(context, self._list.resource_path)
+        operations = []
+        updates = {}
+        for index, row in chunk:
+            values = dict(row)
+            item_id = values.pop("Id", None) or values.pop("ID", None)
+            if self._schema is not None:
+                try:
+                    values = self._schema.resolve_values(values)
+                except ValueError as e:
+                    self._mark_failed(result, [(index, row)], e)
+                    continue
+            if item_id is None:
+                return_type = target_list.add_validate_update_item_using_path(values, self.folder_url)
+                operations.append(([(index, row)], return_type))
+            else:
+                key = tuple(sorted((k, repr(v)) for k, v in values.items()))
+                updates.setdefault(key, []).append((index, row, item_id, values))
+
+        for group in updates.values():
+            values = group[0][3]
+            if len(group) > 1:
+                return_type = target_list.bulk_validate_update_list_items([entry[2] for entry in group], values)
+            else:
+                return_type = target_list.get_item_by_id(group[0][2]).validate_update_list_item(values)
+            operations.append(([(entry[0], entry[1], entry[2]) for entry in group], return_type))
+
+        failed_parts = {}
+
+        def _part_failed(query, response):
+            try:
+                response.raise_for_status()
+            except HTTPError as e:
+                failed_parts[id(query.return_type)] = ClientRequestException(*e.args, response=e.response)
+
+        error = None
+        try:
+            context.execute_batch(self.batch_size, _part_failed)
+        except Exception as e:
+            error = e
+            context.clear()
+
+        for chunk_rows, return_type in operations:
+            part_error = failed_parts.get(id(return_type), None)
+            values = return_type.value if hasattr(return_type, "value") else return_type
+            if part_error is None and error is not None and len(values) == 0:
+                part_error = error
+            if part_error is not None:
+                self._mark_failed(result, chunk_rows, part_error)
+                continue
+            for rows, messages in self._get_errors(chunk_rows, values):
+                if messages:
+                    self._mark_failed(result, rows, "; ".join(messages))
+                else:
+                    result.mark_succeeded(len(rows))
+
+    @staticmethod
+    def _get_errors(rows, values):
+        """
+        Groups validation errors by rows, values returned by a bulk update are matched to the rows by item ids
+
+        :param list[tuple] rows: Rows of the operation (index, row and optionally item id)
+        :param list[office365.sharepoint.listitems.form_update_value.ListItemFormUpdateValue] values: Returned values
+        :rtype: collections.Iterable[(list[tuple], list[str])]
+        """
+        def _messages(items):
+            return ["{0}: {1}".format(v.FieldName, getattr(v, "ErrorMessage", None) or v.ErrorCode)
+                    for v in items if v.HasException]
+
+        if len(rows) > 1 and all(getattr(v, "ItemId", None) is not None for v in values):
+            values_by_item = {}
+            for v in values:
+                values_by_item.setdefault(str(v.ItemId), []).append(v)
+            for row in rows:
+                yield [row], _messages(values_by_item.get(str(row[2]), []))
+        else:
+            yield rows, _messages(values)
+
+    def _mark_failed(self, result, rows, error):
+        for entry in rows:
+            index, row = entry[0], entry[1]
+            result.mark_failed(index, error)
+            if callable(self._row_failed):
+                with self._notify_lock:
+                    self._row_failed(index, row, error)
+
+    def _create_context(self):
+        context = self._list.context
+        return context.clone(context.base_url)
@@ -0,0 +1,118 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from office365.runtime.compat import is_py2
+from office365.runtime.paths.resource_path import ResourcePath
+from office365.sharepoint.listitems.caml.expressions import Geq, Lt
+from office365.sharepoint.listitems.caml.query_builder import CamlQueryBuilder
+from office365.sharepoint.listitems.collection import ListItemCollection
+from office365.sharepoint.lists.paged_list_reader import PagedListReader
+from office365.sharepoint.views.view_scope import ViewScope
+
+if is_py2:
+    from Queue import Queue
+else:
+    from queue import Queue
+
+
+class LargeListReader(object):
+    """
+    Enumerates list items regardless of the list view threshold.
+
+    The range of item identifiers is resolved first and then split into windows filtered by the indexed ID field,
+    so that none of the queries exceeds the threshold. Windows are fetched concurrently (with RowLimit paging
+    within a window), each worker uses a dedicated client context since a context is not safe to be shared
+    across threads. Items are yielded in the order of their identifiers.
+    """
+
+    def __init__(self, source_list, window_size=5000, page_size=5000, max_workers=4, view_fields=None):
+        """
+        :type source_list: office365.sharepoint.lists.list.List
+        :param int window_size: Number of identifiers covered by a single window
+        :param int page_size: Maximum number of items returned per request, should not exceed the view threshold
+        :param int max_workers: Maximum number of windows fetched in parallel
+        :param list[str] or None view_fields: Internal names of fields to return, all fields are returned if omitted
+        """
+        self._list = source_list
+        self.window_size = window_size
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.view_fields = view_fields
+
+    def __iter__(self):
+        id_range = self.get_id_range()
+        if id_range is None:
+            return
+        min_id, max_id = id_range
+        list_id = self._list.id
+        contexts = Queue()
+        for _ in range(self.max_workers):
+            contexts.put(self._list.context.clone(self._list.context.base_url))
+
+        def _read(window):
+            context = contexts.get()
+            try:
+                return self._read_window(context, list_id, window[0], window[1])
+            except Exception:
+                # the failed query might leave event handlers attached to the context, hence it gets replaced
+                context = self._list.context.clone(self._list.context.base_url)
+                raise
+            finally:
+                contexts.put(context)
+
+        windows = ((start, start + self.window_size) for start in range(min_id, max_id + 1, self.window_size))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for window in windows:
+                pending.append(executor.submit(_read, window))
+                if len(pending) > self.max_workers:
+                    for item in pending.popleft().result():
+                        yield item
+            while pending:
+                for item in pending.popleft().result():
+                    yield item
+
+    def get_id_range(self):
+        """
+        Resolves the lowest and the highest item identifiers, ordering by ID is not subject to the view threshold
+
+        :rtype: (int, int) or None
+        """
+        context = self._list.context
+        if not self._list.is_property_available("Id"):
+            self._list.get().select(["Id"])
+        first_items = ListItemCollection(context, ResourcePath("items", self._list.resource_path))
+        context.load(first_items.select(["Id"]).order_by("Id asc").top(1))
+        last_items = ListItemCollection(context, ResourcePath("items", self._list.resource_path))
+        context.load(last_items.select(["Id"]).order_by("Id desc").top(1))
+        context.execute_query()
+        if len(first_items) == 0:
+            return None
+        return first_items[0].id, last_items[0].id
+
+    def _read_window(self, context, list_id, start_id, end_id):
+        """
+        Reads items with identifiers within [start_id, end_id) range page by page
+
+        :type context: office365.sharepoint.client_context.ClientContext
+        :type list_id: str
+        :type start_id: int
+        :type end_id: int
+        :rtype: list[office365.sharepoint.listitems.listitem.ListItem]
+        """
+        target_list = context.web.lists.get_by_id(list_id)
+        query = self._create_window_query(start_id, end_id)
+        return [item for item in PagedListReader(target_list, query, prefetch=False)]
+
+    def _create_window_query(self, start_id, end_id):
+        """
+        :type start_id: int
+        :type end_id: int
+        """
+        builder = CamlQueryBuilder(ViewScope.RecursiveAll) \
+            .where(Geq("ID", start_id, "Counter") & Lt("ID", end_id, "Counter")) \
+            .order_by("ID") \
+            .row_limit(self.page_size)
+        if self.view_fields:
+            builder.view_fields(*self.view_fields)
+        return builder.build()
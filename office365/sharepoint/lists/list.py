@@ -4,6 +4,7 @@ from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.runtime.paths.resource_path import ResourcePath
 from office365.runtime.paths.service_operation import ServiceOperationPath
 from office365.sharepoint.changes.collection import ChangeCollection
+from office365.sharepoint.changes.feed import ChangeFeed
 from office365.sharepoint.changes.query import ChangeQuery
 from office365.sharepoint.changes.token import ChangeToken
 from office365.sharepoint.contenttypes.collection import ContentTypeCollection
@@ -13,6 +14,7 @@ from office365.sharepoint.fields.collection import FieldCollection
 from office365.sharepoint.fields.related_field_collection import RelatedFieldCollection
 from office365.sharepoint.files.checked_out_file_collection import CheckedOutFileCollection
 from office365.sharepoint.files.file import File
+from office365.sharepoint.files.system_object_type import FileSystemObjectType
 from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
 from office365.sharepoint.folders.folder import Folder
 from office365.sharepoint.forms.collection import FormCollection
@@ -21,8 +23,14 @@ from office365.sharepoint.listitems.creation_information_using_path import ListI
 from office365.sharepoint.listitems.form_update_value import ListItemFormUpdateValue
 from office365.sharepoint.listitems.listitem import ListItem
 from office365.sharepoint.listitems.collection import ListItemCollection
+from office365.sharepoint.lists.bulk_writer import ListItemBulkWriter
 from office365.sharepoint.lists.creatables_info import CreatablesInfo
 from office365.sharepoint.lists.data_source import ListDataSource
+from office365.sharepoint.lists.large_list_reader import LargeListReader
+from office365.sharepoint.lists.list_data_stream_reader import ListDataStreamReader
+from office365.sharepoint.lists.paged_list_reader import PagedListReader
+from office365.sharepoint.lists.render_list_data_options import RenderListDataOptions
+from office365.sharepoint.lists.render_list_data_parameters import RenderListDataParameters
 from office365.sharepoint.lists.rule import SPListRule
 from office365.sharepoint.pages.wiki_page_creation_information import WikiPageCreationInformation
 from office365.sharepoint.permissions.securable_object import SecurableObject
@@ -150,6 +158,34 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return result
 
+    def render_list_data_as_stream(self, parameters=None):
+        """
+        Returns the data of the list rendered as a JSON object for the specified parameters.
+
+        :param RenderListDataParameters parameters: The parameters to be used.
+        """
+        if parameters is None:
+            parameters = RenderListDataParameters(render_options=RenderListDataOptions.ListData)
+        return_type = ClientResult(self.context, {})
+        qry = ServiceOperationQuery(self, "RenderListDataAsStream", None, parameters, "parameters", return_type)
+        self.context.add_query(qry)
+        return return_type
+
+    def stream_list_data(self, view_fields=None, caml_query=None, page_size=5000, dates_in_utc=True,
+                         folder_server_relative_url=None):
+        """Returns the list data as a stream of rows (dicts of field internal names and values) via
+        RenderListDataAsStream, pages are requested one after another following NextHref.
+
+        :param list[str] or None view_fields: Internal names of fields to return
+        :param office365.sharepoint.listitems.caml.query.CamlQuery or None caml_query: Query
+        :param int page_size: Maximum number of rows returned per request
+        :param bool dates_in_utc: Specifies whether date values are returned in UTC
+        :param str or None folder_server_relative_url: Folder to return the items from
+        :rtype: office365.sharepoint.lists.list_data_stream_reader.ListDataStreamReader
+        """
+        return ListDataStreamReader(self, view_fields, caml_query, page_size, dates_in_utc,
+                                    folder_server_relative_url)
+
     @staticmethod
     def get_list_data_as_stream(context, list_full_url, parameters=None):
         """
@@ -159,7 +195,7 @@ class List(SecurableObject):
         :param str list_full_url: The absolute URL of the list.
         :param RenderListDataParameters parameters: The parameters to be used.
         """
-        result = ClientResult(context)
+        result = ClientResult(context, {})
         payload = {
             "listFullUrl": list_full_url,
             "parameters": parameters,
@@ -186,7 +222,7 @@ class List(SecurableObject):
         result = ClientValueCollection(ListItemFormUpdateValue)
         params = {
             "itemIds": item_ids,
-            "formValues": ClientValueCollection(ListItemFormUpdateValue, form_values),
+            "formValues": [ListItemFormUpdateValue(k, v) for k, v in form_values.items()],
             "bNewDocumentUpdate": new_document_update,
             "checkInComment": checkin_comment,
             "folderPath": folder_path
@@ -279,6 +315,46 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return items
 
+    def write_items(self, rows, batch_size=100, max_workers=2, folder_url=None, row_failed=None,
+                    resolve_field_names=False):
+        """Creates or updates list items in bulk. Rows are submitted as $batch requests, rows with Id update
+        existing items (rows sharing the same values are updated at once), the others are inserted.
+
+        :param collections.Iterable[dict] rows: Field internal names and values
+        :param int batch_size: Maximum number of operations per $batch request
+        :param int max_workers: Maximum number of batches in flight
+        :param str or None folder_url: Decoded server-relative url of the folder new items are created in
+        :param (int, dict, str or Exception)->None row_failed: Invoked for every row that failed
+        :param bool resolve_field_names: Rows could be keyed by field titles as well, the names are resolved
+            using the list schema kept in the schema cache of the context
+        :rtype: office365.sharepoint.lists.bulk_writer.BulkWriteResult
+        """
+        writer = ListItemBulkWriter(self, batch_size, max_workers, folder_url, row_failed, resolve_field_names)
+        return writer.write(rows)
+
+    def get_items_paged(self, caml_query=None, page_size=None, prefetch=True):
+        """Returns items from the list based on the specified query as a stream, pages are requested one after another
+        following ListItemCollectionPosition. Unlike get_items, the requests are submitted while iterating.
+
+        :type caml_query: CamlQuery
+        :param int or None page_size: Number of items per page (RowLimit)
+        :param bool prefetch: Request the next page while the current one is being processed
+        :rtype: office365.sharepoint.lists.paged_list_reader.PagedListReader
+        """
+        return PagedListReader(self, caml_query, page_size, prefetch)
+
+    def read_all_items(self, window_size=5000, page_size=5000, max_workers=4, view_fields=None):
+        """Enumerates all the items of the list regardless of the list view threshold. Items are requested
+        concurrently in windows of the item identifiers and returned as a stream.
+
+        :param int window_size: Number of item identifiers covered by a single query
+        :param int page_size: Maximum number of items returned per request
+        :param int max_workers: Maximum number of windows fetched in parallel
+        :param list[str] or None view_fields: Internal names of fields to return
+        :rtype: office365.sharepoint.lists.large_list_reader.LargeListReader
+        """
+        return LargeListReader(self, window_size, page_size, max_workers, view_fields)
+
     def add_item(self, list_item_creation_information):
         """The recommended way to add a list item is to send a POST request to the ListItemCollection resource endpoint,
          as shown in ListItemCollection request examples.
@@ -362,6 +438,34 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return return_type
 
+    def add_validate_update_item_using_path(self, form_values, folder_url=None, leaf_name=None,
+                                            object_type=FileSystemObjectType.File, new_document_update=False,
+                                            checkin_comment=None, dates_in_utc=None):
+        """
+        Adds an item to an existing list and validate the list item update values. If all fields validated
+        successfully, commit all changes. Unlike add_item, the results of validation are returned per field
+        instead of an error.
+
+        :param dict form_values: A collection of field internal names and values for the given field.
+        :param str or None folder_url: Decoded server-relative url of the folder of the new list item
+        :param str or None leaf_name: Specifies the name of the list item that will be created.
+        :param int object_type: Specifies the file system object type for the item that will be created.
+        :param bool new_document_update: Indicates whether the list item is a document being updated after upload.
+        :param str or None checkin_comment: Check-in comment, if any.
+        :param bool or None dates_in_utc: Whether the date values are in UTC
+        """
+        payload = {
+            "listItemCreateInfo": ListItemCreationInformationUsingPath(leaf_name, object_type, folder_url),
+            "formValues": [ListItemFormUpdateValue(k, v) for k, v in form_values.items()],
+            "bNewDocumentUpdate": new_document_update,
+            "checkInComment": checkin_comment,
+            "datesInUTC": dates_in_utc
+        }
+        return_type = ClientResult(self.context, ClientValueCollection(ListItemFormUpdateValue))
+        qry = ServiceOperationQuery(self, "AddValidateUpdateItemUsingPath", None, payload, None, return_type)
+        self.context.add_query(qry)
+        return return_type
+
     def get_item_by_id(self, item_id):
         """Returns the list item with the specified list item identifier.
 
@@ -389,6 +493,16 @@ class List(SecurableObject):
         self.context.add_query(qry)
         return changes
 
+    def get_change_feed(self, query=None, token_store=None, **kwargs):
+        """Returns the incremental synchronization of the change log, the last processed change token is kept
+        in the token store.
+
+        :param office365.sharepoint.changes.query.ChangeQuery query: Specifies which changes to return
+        :param office365.runtime.state_store.StateStore token_store: Keeps the last processed token
+        :rtype: office365.sharepoint.changes.feed.ChangeFeed
+        """
+        return ChangeFeed(self, query, token_store, **kwargs)
+
     def get_checked_out_files(self):
         """Returns a collection of checked-out files as specified in section 3.2.5.381."""
         return_type = CheckedOutFileCollection(self.context)
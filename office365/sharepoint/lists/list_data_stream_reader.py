@@ -0,0 +1,100 @@
+import xml.etree.ElementTree as ET
+
+from office365.sharepoint.listitems.caml.query_builder import CamlQueryBuilder
+from office365.sharepoint.lists.render_list_data_options import RenderListDataOptions
+from office365.sharepoint.lists.render_list_data_parameters import RenderListDataParameters
+from office365.sharepoint.views.view_scope import ViewScope
+
+
+class ListDataStreamReader(object):
+    """
+    Reads list data via RenderListDataAsStream endpoint.
+
+    Only the list data is requested (no schema or context information), pages are requested one after another
+    following NextHref. Rows are returned as dicts of field internal names and values (as rendered by the server),
+    restricted to the requested fields, no ListItem objects are created.
+    """
+
+    def __init__(self, source_list, view_fields=None, caml_query=None, page_size=5000, dates_in_utc=True,
+                 folder_server_relative_url=None):
+        """
+        :type source_list: office365.sharepoint.lists.list.List
+        :param list[str] or None view_fields: Internal names of fields to return, the fields of the query
+            (or all the fields) are returned if omitted
+        :param office365.sharepoint.listitems.caml.query.CamlQuery or None caml_query: Query, all the items
+            of the list (including the ones in folders) are returned if omitted
+        :param int page_size: Overrides RowLimit of the query
+        :param bool dates_in_utc: Specifies whether date values are returned in UTC
+        :param str or None folder_server_relative_url: Folder to return the items from
+        """
+        self._list = source_list
+        self.view_fields = view_fields
+        self.page_size = page_size
+        self._view_xml = self._build_view_xml(caml_query)
+        self.dates_in_utc = dates_in_utc
+        self.folder_server_relative_url = folder_server_relative_url
+
+    @property
+    def view_xml(self):
+        """
+        :rtype: str
+        """
+        return self._view_xml
+
+    def __iter__(self):
+        for page in self.pages():
+            for row in page:
+                yield row
+
+    def pages(self):
+        """
+        Yields pages of rows
+
+        :rtype: collections.Iterable[list[dict]]
+        """
+        paging = None
+        while True:
+            params = RenderListDataParameters(view_xml=self._view_xml,
+                                              render_options=RenderListDataOptions.ListData,
+                                              paging=paging,
+                                              folder_server_relative_url=self.folder_server_relative_url,
+                                              dates_in_utc=self.dates_in_utc)
+            result = self._list.render_list_data_as_stream(params).execute_query()
+            rows = result.value.get("Row", [])
+            if rows:
+                yield [self._project(row) for row in rows]
+            next_href = result.value.get("NextHref", None)
+            if not next_href:
+                return
+            paging = next_href.lstrip("?")
+
+    def _project(self, row):
+        """
+        :type row: dict
+        """
+        if not self.view_fields:
+            return row
+        return {name: row.get(name, None) for name in self.view_fields}
+
+    def _build_view_xml(self, caml_query):
+        """
+        :type caml_query: office365.sharepoint.listitems.caml.query.CamlQuery or None
+        """
+        if caml_query is None or not caml_query.ViewXml:
+            builder = CamlQueryBuilder(ViewScope.RecursiveAll).row_limit(self.page_size)
+            if self.view_fields:
+                builder.view_fields(*self.view_fields)
+            return builder.view_xml
+
+        root = ET.fromstring(caml_query.ViewXml)
+        if self.view_fields:
+            for view_fields in root.findall("ViewFields"):
+                root.remove(view_fields)
+            view_fields = ET.SubElement(root, "ViewFields")
+            for name in self.view_fields:
+                ET.SubElement(view_fields, "FieldRef", {"Name": name})
+        for row_limit in root.findall("RowLimit"):
+            root.remove(row_limit)
+        row_limit = ET.SubElement(root, "RowLimit", {"Paged": "TRUE"})
+        row_limit.text = str(self.page_size)
+        return ET.tostring(root).decode("utf-8")
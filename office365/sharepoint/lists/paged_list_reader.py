@@ -0,0 +1,107 @@
+import re
+import xml.etree.ElementTree as ET
+
+from office365.runtime.compat import quote
+from office365.runtime.prefetch import prefetch
+from office365.sharepoint.listitems.caml.query import CamlQuery
+from office365.sharepoint.listitems.collection_position import ListItemCollectionPosition
+
+
+class PagedListReader(object):
+    """
+    Iterates list items returned by a CAML query page by page.
+
+    The position of the next page (ListItemCollectionPosition.PagingInfo) is derived from the last item of
+    the current page. With prefetching enabled, the next page is requested by a background worker
+    (using a dedicated client context) while the current one is being processed.
+    """
+
+    default_page_size = 5000
+
+    def __init__(self, source_list, caml_query=None, page_size=None, prefetch=True):
+        """
+        :type source_list: office365.sharepoint.lists.list.List
+        :type caml_query: CamlQuery or None
+        :param int or None page_size: Overrides RowLimit of the query, defaults to 5000 unless the query specifies it
+        :param bool prefetch: Request the next page while the current one is being processed
+        """
+        if caml_query is None:
+            caml_query = CamlQuery.create_all_items_query()
+        self._list = source_list
+        self._view_xml = self._ensure_row_limit(caml_query.ViewXml, page_size)
+        self._caml_query = caml_query
+        self.page_size = int(re.search(r"<RowLimit[^>]*>\s*(\d+)\s*</RowLimit>", self._view_xml).group(1))
+        self.prefetch = prefetch
+
+    def __iter__(self):
+        for page in self.pages():
+            for item in page:
+                yield item
+
+    def pages(self):
+        """
+        Yields pages of items
+
+        :rtype: collections.Iterable[office365.sharepoint.listitems.collection.ListItemCollection]
+        """
+        if self.prefetch:
+            return self._prefetch_pages()
+        return self._read_pages(self._list)
+
+    def _read_pages(self, source_list, stopped=None):
+        """
+        :type source_list: office365.sharepoint.lists.list.List
+        :type stopped: threading.Event or None
+        """
+        position = self._caml_query.ListItemCollectionPosition
+        while stopped is None or not stopped.is_set():
+            query = CamlQuery(dates_in_utc=self._caml_query.DatesInUtc,
+                              view_xml=self._view_xml,
+                              listitem_collection_position=position,
+                              folder_server_relative_url=self._caml_query.FolderServerRelativeUrl,
+                              allow_incremental_results=self._caml_query.AllowIncrementalResults)
+            items = source_list.get_items(query).execute_query()
+            if len(items) > 0:
+                yield items
+            if len(items) < self.page_size:
+                return
+            position = ListItemCollectionPosition(self._get_paging_info(items[len(items) - 1]))
+
+    def _prefetch_pages(self):
+        context = self._list.context.clone(self._list.context.base_url)
+        source_list = self._list.__class__(context, self._list.resource_path)
+        return prefetch(lambda stopped: self._read_pages(source_list, stopped))
+
+    def _get_paging_info(self, last_item):
+        """
+        Builds the position of the next page: the identifier along with values of sort fields of the last item
+
+        :type last_item: office365.sharepoint.listitems.listitem.ListItem
+        """
+        paging_info = "Paged=TRUE&p_ID={0}".format(last_item.id)
+        for name in self._get_order_fields():
+            if name.upper() == "ID":
+                continue
+            value = last_item.properties.get(name, None)
+            paging_info += "&p_{0}={1}".format(name, quote(str(value) if value is not None else ""))
+        return paging_info
+
+    def _get_order_fields(self):
+        root = ET.fromstring(self._view_xml)
+        return [field_ref.get("Name") for order_by in root.iter("OrderBy") for field_ref in order_by.iter("FieldRef")]
+
+    def _ensure_row_limit(self, view_xml, page_size):
+        """
+        :type view_xml: str or None
+        :type page_size: int or None
+        """
+        if not view_xml:
+            view_xml = CamlQuery.create_all_items_query().ViewXml
+        view_xml = re.sub(r"<View([^>]*?)\s*/>\s*$", r"<View\1></View>", view_xml)
+        row_limit = "<RowLimit Paged=\"TRUE\">{0}</RowLimit>"
+        if re.search(r"<RowLimit[^>]*>", view_xml):
+            if page_size is not None:
+                view_xml = re.sub(r"<RowLimit[^>]*>\s*\d+\s*</RowLimit>", row_limit.format(page_size), view_xml)
+            return view_xml
+        index = view_xml.rindex("</View>")
+        return view_xml[:index] + row_limit.format(page_size or self.default_page_size) + view_xml[index:]
@@ -0,0 +1,53 @@
+class RenderListDataOptions:
+    """Specifies the type of output that is returned when rendering list data (flags)."""
+
+    def __init__(self):
+        pass
+
+    ContextInfo = 1
+    """Returns the list context information."""
+
+    ListData = 2
+    """Returns the list data."""
+
+    ListSchema = 4
+    """Returns the list schema."""
+
+    MenuView = 8
+    """Returns the HTML for the list menu."""
+
+    ListContentType = 16
+    """Returns information about list content types."""
+
+    FileSystemItemId = 32
+    """The returned list will have a FileSystemItemId field on each item if possible."""
+
+    ClientFormSchema = 64
+    """Returns the client form schema to add and edit items."""
+
+    QuickLaunch = 128
+    """Returns QuickLaunch navigation nodes."""
+
+    Spotlight = 256
+    """Returns Spotlight rendering information."""
+
+    Visualization = 512
+    """Returns Visualization rendering information."""
+
+    ViewMetadata = 1024
+    """Returns view XML and other information about the current view."""
+
+    DisableAutoHyperlink = 2048
+    """Prevents AutoHyperlink from being run on text fields in this query."""
+
+    EnableMediaTAUrls = 4096
+    """Enables URLs pointing to Media TA service, such as .thumbnailUrl, .videoManifestUrl, .pdfConversionUrls."""
+
+    ParentInfo = 8192
+    """Returns parent folder information."""
+
+    PageContextInfo = 16384
+    """Returns page context info for the current list being rendered."""
+
+    ClientSideComponentManifest = 32768
+    """Returns client-side component manifest information associated with the list."""
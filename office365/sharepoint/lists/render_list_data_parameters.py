@@ -2,4 +2,39 @@ from office365.runtime.client_value import ClientValue
 
 
 class RenderListDataParameters(ClientValue):
-    pass
+    """Specifies the parameters to be used to render list data as a JSON string"""
+
+    def __init__(self, view_xml=None, render_options=None, paging=None, folder_server_relative_url=None,
+                 dates_in_utc=None, add_required_fields=None, allow_multiple_value_filter_for_taxonomy_fields=None,
+                 expand_groups=None, first_group_only=None, override_view_xml=None, replace_group=None):
+        """
+        :param str view_xml: Specifies the CAML view XML.
+        :param int render_options: Specifies the type of output to return (see RenderListDataOptions flags).
+        :param str paging: Specifies the paging information (e.g. the NextHref of the previous page without
+            the leading question mark).
+        :param str folder_server_relative_url: Specifies the URL of the folder from which to return items.
+        :param bool dates_in_utc: Specifies whether date values are returned in UTC.
+        :param bool add_required_fields: Specifies whether to add required fields to the return set.
+        :param bool allow_multiple_value_filter_for_taxonomy_fields: Specifies whether to allow multiple value
+            filters for taxonomy fields.
+        :param bool expand_groups: Specifies whether to expand the grouping or not.
+        :param bool first_group_only: Specifies whether to return only the first group (if grouping).
+        :param str override_view_xml: Specifies the override XML to be combined with the View CAML.
+        :param bool replace_group: Specifies whether to replace the grouping or not.
+        """
+        super(RenderListDataParameters, self).__init__()
+        self.ViewXml = view_xml
+        self.RenderOptions = render_options
+        self.Paging = paging
+        self.FolderServerRelativeUrl = folder_server_relative_url
+        self.DatesInUtc = dates_in_utc
+        self.AddRequiredFields = add_required_fields
+        self.AllowMultipleValueFilterForTaxonomyFields = allow_multiple_value_filter_for_taxonomy_fields
+        self.ExpandGroups = expand_groups
+        self.FirstGroupOnly = first_group_only
+        self.OverrideViewXml = override_view_xml
+        self.ReplaceGroup = replace_group
+
+    @property
+    def entity_type_name(self):
+        return "SP.RenderListDataParameters"
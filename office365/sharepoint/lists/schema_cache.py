@@ -0,0 +1,215 @@
+import threading
+import time
+from collections import OrderedDict
+
+from office365.sharepoint.changes.query import ChangeQuery
+from office365.sharepoint.changes.token import ChangeToken
+
+
+class FieldSchema(object):
+    """Definition of a field kept in the schema cache"""
+
+    def __init__(self, field_id, internal_name, title, type_as_string, field_type_kind=None, read_only=False,
+                 required=False, hidden=False):
+        """
+        :param str field_id: Field identifier
+        :param str internal_name: Internal name
+        :param str title: Display name
+        :param str type_as_string: Type of the field, e.g. Text, Number or Lookup
+        :param int or None field_type_kind: Type of the field as FieldType value
+        :param bool read_only: Specifies whether the value of the field can be modified
+        :param bool required: Specifies whether the field requires a value
+        :param bool hidden: Specifies whether the field is displayed in the list
+        """
+        self.id = field_id
+        self.internal_name = internal_name
+        self.title = title
+        self.type_as_string = type_as_string
+        self.field_type_kind = field_type_kind
+        self.read_only = read_only
+        self.required = required
+        self.hidden = hidden
+
+    def __repr__(self):
+        return "{0} ({1})".format(self.internal_name, self.type_as_string)
+
+
+class Schema(object):
+    """Fields and content types of a list or a web"""
+
+    def __init__(self, url, list_id=None, change_token=None):
+        """
+        :param str url: Resource url of the list or web
+        :param str or None list_id: List identifier
+        :param str or None change_token: Change token of the list the schema was loaded at
+        """
+        self.url = url
+        self.list_id = list_id
+        self.change_token = change_token
+        self.loaded = time.time()
+        self.fields = OrderedDict()
+        self.content_types = OrderedDict()
+        self._titles = {}
+
+    def add_field(self, field):
+        """
+        :type field: FieldSchema
+        """
+        self.fields[field.internal_name] = field
+        self._titles.setdefault(field.title, field)
+
+    def get_field(self, name):
+        """
+        Resolves the field by its internal name or title
+
+        :param str name: Internal name or title of the field
+        :rtype: FieldSchema or None
+        """
+        return self.fields.get(name, None) or self._titles.get(name, None)
+
+    def get_content_type_id(self, name):
+        """
+        :param str name: Content type name
+        :rtype: str or None
+        """
+        return self.content_types.get(name, None)
+
+    def resolve_values(self, values):
+        """
+        Maps field values keyed by titles or internal names to values keyed by internal names
+
+        :param dict values: Field values
+        :rtype: dict
+        """
+        result = {}
+        for name, value in values.items():
+            field = self.get_field(name)
+            if field is None:
+                raise ValueError("Field '{0}' does not exist".format(name))
+            result[field.internal_name] = value
+        return result
+
+
+class SchemaCache(object):
+    """
+    Keeps schemas (field definitions and content type identifiers) of lists and webs per context, a schema is
+    loaded with a single request and shared by the context clones:
+
+        schema = ctx.schema_cache.get(ctx.web.lists.get_by_title("Tasks"))
+        item_values = schema.resolve_values({"Title": "Task", "Due Date": "2023-01-01"})
+
+    Once a schema becomes older than max_age_secs the change log of the list is checked for field, content type
+    and list changes since the change token the schema was loaded at (schemas of webs are reloaded instead).
+    Schemas could also be invalidated explicitly or by webhook notifications.
+    """
+
+    _field_properties = ["Id", "InternalName", "Title", "TypeAsString", "FieldTypeKind", "ReadOnlyField",
+                         "Required", "Hidden"]
+
+    def __init__(self, max_age_secs=300):
+        """
+        :param int or None max_age_secs: Number of seconds a schema is used for without checking for changes,
+            never checked if None
+        """
+        self.max_age_secs = max_age_secs
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, source, refresh=False):
+        """
+        Returns the schema of the list or web, the schema is loaded unless it is cached
+
+        :param office365.sharepoint.lists.list.List or office365.sharepoint.webs.web.Web source: List or web
+        :param bool refresh: Checks the list for changes even though the schema is not older than max_age_secs
+        :rtype: Schema
+        """
+        key = source.resource_url
+        with self._lock:
+            schema = self._items.get(key, None)
+        if schema is not None and (refresh or self._is_stale(schema)):
+            if schema.change_token is None or self._has_changed(source, schema):
+                schema = None
+            else:
+                schema.loaded = time.time()
+        if schema is None:
+            schema = self._load(source)
+            with self._lock:
+                self._items[key] = schema
+        return schema
+
+    def invalidate(self, url=None, list_id=None):
+        """
+        Removes the schema of the list (or web) or all the schemas if neither url nor list id is specified
+
+        :param str or None url: Resource url of the list or web
+        :param str or None list_id: List identifier
+        """
+        with self._lock:
+            if url is None and list_id is None:
+                self._items = {}
+                return
+            for key, schema in list(self._items.items()):
+                if key == url or (list_id is not None and (schema.list_id or "").lower() == list_id.lower()):
+                    del self._items[key]
+
+    def process_notification(self, notification):
+        """
+        Invalidates the schema of the list a webhook notification has been received for
+
+        :param dict notification: Webhook notification, the resource is the list identifier
+        """
+        self.invalidate(list_id=notification.get("resource"))
+
+    def _is_stale(self, schema):
+        """
+        :type schema: Schema
+        """
+        return self.max_age_secs is not None and time.time() - schema.loaded > self.max_age_secs
+
+    def _has_changed(self, source, schema):
+        """
+        Checks the change log of the list for schema changes since the schema was loaded
+
+        :type source: office365.sharepoint.lists.list.List
+        :type schema: Schema
+        """
+        context = source.context.create_context()
+        target = source.__class__(context, source.resource_path)
+        query = ChangeQuery(list_=True, field=True, content_type=True,
+                            change_token_start=ChangeToken(schema.change_token), fetch_limit=1)
+        changes = target.get_changes(query).execute_query()
+        return len(changes) > 0
+
+    def _load(self, source):
+        """
+        Loads fields and content types of the list or web with a single request
+
+        :type source: office365.sharepoint.lists.list.List or office365.sharepoint.webs.web.Web
+        :rtype: Schema
+        """
+        from office365.sharepoint.lists.list import List
+        is_list = isinstance(source, List)
+        context = source.context.create_context()
+        target = source.__class__(context, source.resource_path)
+        properties = ["Id"] + ["Fields/" + name for name in self._field_properties] + \
+                     ["ContentTypes/StringId", "ContentTypes/Name"]
+        if is_list:
+            properties.append("CurrentChangeToken")
+        target.get().select(properties).expand(["Fields", "ContentTypes"]).execute_query()
+
+        schema = Schema(source.resource_url)
+        if is_list:
+            schema.list_id = target.id
+            schema.change_token = target.current_change_token.StringValue
+        for field in target.fields:
+            schema.add_field(FieldSchema(field.id, field.internal_name, field.title, field.type_as_string,
+                                         field.properties.get("FieldTypeKind", None),
+                                         field.properties.get("ReadOnlyField", False),
+                                         field.properties.get("Required", False),
+                                         field.properties.get("Hidden", False)))
+        for content_type in target.content_types:
+            schema.content_types[content_type.name] = content_type.string_id
+        return schema
+
+    def __deepcopy__(self, memo):
+        return self
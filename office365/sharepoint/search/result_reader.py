@@ -0,0 +1,157 @@
+import copy
+
+from office365.runtime.client_value_collection import ClientValueCollection
+from office365.runtime.compat import is_string_type
+from office365.runtime.prefetch import prefetch
+from office365.runtime.types.collections import StringCollection
+from office365.sharepoint.search.query.sort import Sort
+
+
+class SearchResultReader(object):
+    """
+    Streams search results (hits) page by page.
+
+    By default, pages are requested by advancing StartRow, which is limited by the service (50000 results).
+    With deep paging enabled, results are sorted by [DocId] and every subsequent page is requested with
+    IndexDocId>{last DocId} condition appended to the query text, which has no such limit.
+    Hits are returned as dicts of property names and values (cells of the result table), restricted to
+    the selected properties of the request. DocId is requested along with the selected properties in deep
+    paging mode.
+    """
+
+    max_start_row = 50000
+    max_row_limit = 500
+
+    _value_types = {
+        "Edm.Int32": int,
+        "Edm.Int64": int,
+        "Edm.Double": float,
+        "Edm.Boolean": lambda v: v.lower() == "true",
+    }
+
+    def __init__(self, service, request, page_size=500, prefetch=True, deep_paging=False):
+        """
+        :type service: office365.sharepoint.search.service.SearchService
+        :type request: office365.sharepoint.search.request.SearchRequest
+        :param int page_size: Number of results per request (RowLimit), up to 500
+        :param bool prefetch: Request the next page while the current one is being processed
+        :param bool deep_paging: Page by IndexDocId instead of StartRow
+        """
+        self._service = service
+        self._request = request
+        self.page_size = min(page_size, self.max_row_limit)
+        self.prefetch = prefetch
+        self.deep_paging = deep_paging
+        self.total_rows = None
+
+    @property
+    def select_properties(self):
+        """
+        :rtype: list[str]
+        """
+        return list(self._request.SelectProperties or [])
+
+    def __iter__(self):
+        for page in self.pages():
+            for hit in page:
+                yield hit
+
+    def pages(self):
+        """
+        Yields pages of hits
+
+        :rtype: collections.Iterable[list[dict]]
+        """
+        if self.prefetch:
+            context = self._service.context.clone(self._service.context.base_url)
+            service = self._service.__class__(context)
+            return prefetch(lambda stopped: self._read_pages(service, stopped))
+        return self._read_pages(self._service)
+
+    def _read_pages(self, service, stopped=None):
+        """
+        :type service: office365.sharepoint.search.service.SearchService
+        :type stopped: threading.Event or None
+        """
+        start_row = self._request.StartRow or 0
+        last_doc_id = None
+        while stopped is None or not stopped.is_set():
+            request = self._create_request(start_row, last_doc_id)
+            result = service.post_query(request).execute_query()
+            relevant_results = getattr(result.value.PrimaryQueryResult, "RelevantResults", None) or {}
+            self.total_rows = relevant_results.get("TotalRows", None)
+            rows = [self._get_cells(row) for row in self._to_list(relevant_results.get("Table", {}).get("Rows"))]
+            if rows:
+                yield [self._project(cells) for cells in rows]
+            if len(rows) < self.page_size:
+                return
+            if self.deep_paging:
+                last_doc_id = rows[-1].get("DocId", None)
+                if last_doc_id is None:
+                    raise ValueError("DocId is not returned, deep paging is not possible")
+            else:
+                start_row += len(rows)
+                if self.total_rows is not None and start_row >= self.total_rows:
+                    return
+                if start_row > self.max_start_row:
+                    raise ValueError("StartRow exceeds {0}, use deep paging instead".format(self.max_start_row))
+
+    def _create_request(self, start_row, last_doc_id):
+        """
+        :type start_row: int
+        :type last_doc_id: int or None
+        """
+        request = copy.copy(self._request)
+        request.RowLimit = self.page_size
+        if self.deep_paging:
+            request.StartRow = 0
+            request.EnableSorting = True
+            request.SortList = ClientValueCollection(Sort, [Sort("[DocId]", 0)])
+            if self.select_properties and "DocId" not in self.select_properties:
+                request.SelectProperties = StringCollection(self.select_properties + ["DocId"])
+            if last_doc_id is not None:
+                request.Querytext = "({0}) IndexDocId>{1}".format(self._request.Querytext, last_doc_id)
+        else:
+            request.StartRow = start_row
+        return request
+
+    def _get_cells(self, row):
+        """
+        Flattens cells of the row into a dict
+
+        :type row: dict
+        """
+        cells = {}
+        for cell in self._to_list(row.get("Cells")):
+            value = cell.get("Value")
+            convert = self._value_types.get(cell.get("ValueType"), None)
+            if is_string_type(value) and convert is not None:
+                value = convert(value)
+            cells[cell.get("Key")] = value
+        return cells
+
+    def _project(self, cells):
+        """
+        Restricts the cells to the properties selected by the caller (DocId requested for deep paging is omitted)
+
+        :type cells: dict
+        """
+        names = self.select_properties
+        if not names:
+            return cells
+        return {name: cells.get(name, None) for name in names}
+
+    @staticmethod
+    def _to_list(values):
+        """
+        Collections of the result table are returned either as lists or as dicts indexed by position
+
+        :type values: list or dict or None
+        """
+        if values is None:
+            return []
+        if isinstance(values, dict):
+            values = values.get("results", values)
+        if isinstance(values, dict):
+            return [values[k] for k in sorted(values)]
+        return list(values)
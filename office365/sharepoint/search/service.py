@@ -10,6 +10,7 @@ from office365.sharepoint.search.query.popular_tenant_query import PopularTenant
 from office365.sharepoint.search.query.suggestion_results import QuerySuggestionResults
 from office365.sharepoint.search.request import SearchRequest
 from office365.sharepoint.search.result import SearchResult
+from office365.sharepoint.search.result_reader import SearchResultReader
 
 
 class SearchService(BaseEntity):
@@ -81,6 +82,20 @@ class SearchService(BaseEntity):
         self.context.add_query(qry)
         return result
 
+    def stream_results(self, request, page_size=500, prefetch=True, deep_paging=False):
+        """Streams search results (hits) page by page, hits are returned as dicts of the selected properties.
+
+        :type request: office365.sharepoint.search.request.SearchRequest or str
+        :param int page_size: Number of results per request
+        :param bool prefetch: Request the next page while the current one is being processed
+        :param bool deep_paging: Page by IndexDocId (sorting by DocId) instead of StartRow to go beyond
+            50000 results
+        :rtype: office365.sharepoint.search.result_reader.SearchResultReader
+        """
+        if is_string_type(request):
+            request = SearchRequest(query_text=request)
+        return SearchResultReader(self, request, page_size, prefetch, deep_paging)
+
     def record_page_click(self):
         """The operation is used to record page clicks"""
         pass
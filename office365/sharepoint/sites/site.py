@@ -5,6 +5,7 @@ from office365.runtime.paths.service_operation import ServiceOperationPath
 from office365.sharepoint.audit.audit import Audit
 from office365.sharepoint.base_entity import BaseEntity
 from office365.sharepoint.changes.collection import ChangeCollection
+from office365.sharepoint.changes.feed import ChangeFeed
 from office365.sharepoint.changes.token import ChangeToken
 from office365.sharepoint.eventreceivers.definition_collection import EventReceiverDefinitionCollection
 from office365.sharepoint.features.collection import FeatureCollection
@@ -101,6 +102,16 @@ class Site(BaseEntity):
         self.context.add_query(qry)
         return changes
 
+    def get_change_feed(self, query=None, token_store=None, **kwargs):
+        """Returns the incremental synchronization of the change log, the last processed change token is kept
+        in the token store.
+
+        :param office365.sharepoint.changes.query.ChangeQuery query: Specifies which changes to return
+        :param office365.runtime.state_store.StateStore token_store: Keeps the last processed token
+        :rtype: office365.sharepoint.changes.feed.ChangeFeed
+        """
+        return ChangeFeed(self, query, token_store, **kwargs)
+
     def get_recycle_bin_items(self, row_limit=100, is_ascending=True):
         """
         Returns a collection of recycle bin items based on the specified query.
@@ -24,6 +24,17 @@ class ContextWebInformation(ClientValue):
     def reset(self):
         pass
 
+    @property
+    def expires_in(self):
+        """
+        Number of seconds before FormDigest expires
+
+        :rtype: float
+        """
+        if self.FormDigestTimeoutSeconds is None:
+            return 0
+        return self.FormDigestTimeoutSeconds - (time.time() - self._valid_from)
+
     @property
     def is_valid(self):
         """
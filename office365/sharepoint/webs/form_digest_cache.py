@@ -0,0 +1,83 @@
+import threading
+
+
+class FormDigestCache(object):
+    """
+    Caches form digests (ContextWebInformation) per web url, the cache is shared by the context clones
+    and $batch requests so that a digest is requested once per web and renewed ahead of its expiry:
+
+        cache = FormDigestCache(renew_before_secs=120)
+        ctx.form_digest_cache = cache
+    """
+
+    def __init__(self, renew_before_secs=60):
+        """
+        :param int renew_before_secs: Number of seconds before the expiry a digest is considered stale and renewed
+        """
+        self.renew_before_secs = renew_before_secs
+        self._items = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, web_url):
+        """
+        Returns a cached digest of the web unless it is about to expire
+
+        :param str web_url: Absolute web url
+        :rtype: office365.sharepoint.webs.context_web_information.ContextWebInformation or None
+        """
+        with self._lock:
+            info = self._items.get(self._normalize(web_url), None)
+        if info is None or info.FormDigestTimeoutSeconds is None:
+            return None
+        renew_before_secs = min(self.renew_before_secs, info.FormDigestTimeoutSeconds / 2.0)
+        return info if info.expires_in > renew_before_secs else None
+
+    def get_or_fetch(self, web_url, fetch):
+        """
+        Returns a cached digest of the web or requests a new one, concurrent requests for the same web
+        are waiting for a single round trip
+
+        :param str web_url: Absolute web url
+        :param () -> office365.sharepoint.webs.context_web_information.ContextWebInformation fetch: Requests a digest
+        :rtype: office365.sharepoint.webs.context_web_information.ContextWebInformation
+        """
+        info = self.get(web_url)
+        if info is not None:
+            return info
+        key = self._normalize(web_url)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            info = self.get(web_url)
+            if info is None:
+                info = fetch()
+                self.set(web_url, info)
+        return info
+
+    def set(self, web_url, info):
+        """
+        :param str web_url: Absolute web url
+        :type info: office365.sharepoint.webs.context_web_information.ContextWebInformation
+        """
+        with self._lock:
+            self._items[self._normalize(web_url)] = info
+
+    def invalidate(self, web_url=None):
+        """
+        Removes the digest of the web or all the digests if the web url is not specified
+
+        :param str or None web_url: Absolute web url
+        """
+        with self._lock:
+            if web_url is None:
+                self._items = {}
+            else:
+                self._items.pop(self._normalize(web_url), None)
+
+    @staticmethod
+    def _normalize(web_url):
+        return web_url.rstrip("/").lower()
+
+    def __deepcopy__(self, memo):
+        return self
@@ -4,57 +4,10 @@ from office365.runtime.client_value_collection import ClientValueCollection
 from office365.runtime.queries.service_operation import ServiceOperationQuery
 from office365.runtime.paths.resource_path import ResourcePath
 from office365.runtime.paths.service_operation import ServiceOperationPath
-from office365.sharepoint.activities.entity import SPActivityEntity
-from office365.sharepoint.alerts.collection import AlertCollection
-from office365.sharepoint.base_entity_collection import BaseEntityCollection
-from office365.sharepoint.changes.collection import ChangeCollection
-from office365.sharepoint.clientsidecomponent.storage_entity import StorageEntity
-from office365.sharepoint.clientsidecomponent.query_result import SPClientSideComponentQueryResult
-from office365.sharepoint.clientsidecomponent.identifier import SPClientSideComponentIdentifier
-from office365.sharepoint.contenttypes.collection import ContentTypeCollection
-from office365.sharepoint.eventreceivers.definition_collection import EventReceiverDefinitionCollection
-from office365.sharepoint.fields.collection import FieldCollection
-from office365.sharepoint.files.file import File
-from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
-from office365.sharepoint.folders.folder import Folder
-from office365.sharepoint.folders.collection import FolderCollection
-from office365.sharepoint.listitems.listitem import ListItem
-from office365.sharepoint.lists.document_library_information import DocumentLibraryInformation
-from office365.sharepoint.lists.list import List
-from office365.sharepoint.lists.collection import ListCollection
-from office365.sharepoint.lists.template_collection import ListTemplateCollection
-from office365.sharepoint.navigation.navigation import Navigation
-from office365.sharepoint.permissions.base_permissions import BasePermissions
-from office365.sharepoint.permissions.roles.definitions.collection import RoleDefinitionCollection
 from office365.sharepoint.permissions.securable_object import SecurableObject
-from office365.sharepoint.principal.group import Group
-from office365.sharepoint.principal.group_collection import GroupCollection
-from office365.sharepoint.principal.user import User
-from office365.sharepoint.principal.user_collection import UserCollection
-from office365.sharepoint.pushnotifications.subscriber import PushNotificationSubscriber
-from office365.sharepoint.recyclebin.item_collection import RecycleBinItemCollection
 from office365.sharepoint.sharing.external_sharing_site_option import ExternalSharingSiteOption
-from office365.sharepoint.sharing.object_sharing_settings import ObjectSharingSettings
-from office365.sharepoint.sharing.sharing_link_data import SharingLinkData
-from office365.sharepoint.sharing.sharing_result import SharingResult
-from office365.sharepoint.sitescripts.utility import SiteScriptUtility
-from office365.sharepoint.marketplace.sitecollection.appcatalog.accessor import SiteCollectionCorporateCatalogAccessor
-from office365.sharepoint.marketplace.tenant.appcatalog.accessor import TenantCorporateCatalogAccessor
-from office365.sharepoint.ui.applicationpages.peoplepicker.web_service_interface import (
-    ClientPeoplePickerWebServiceInterface
-)
-from office365.sharepoint.usercustomactions.collection import UserCustomActionCollection
-from office365.sharepoint.views.view import View
-from office365.sharepoint.webparts.client.collection import ClientWebPartCollection
 from office365.sharepoint.webs.calendar_type import CalendarType
-from office365.sharepoint.webs.context_web_information import ContextWebInformation
 from office365.sharepoint.fields.datetime_field_format_type import DateTimeFieldFormatType
-from office365.sharepoint.webs.multilingual_settings import MultilingualSettings
-from office365.sharepoint.webs.regional_settings import RegionalSettings
-from office365.sharepoint.sitescripts.types import SiteScriptSerializationResult, SiteScriptSerializationInfo
-from office365.sharepoint.webs.information_collection import WebInformationCollection
-from office365.sharepoint.webs.template_collection import WebTemplateCollection
-from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
 
 
 class Web(SecurableObject):
@@ -84,6 +37,8 @@ class Web(SecurableObject):
             pointing to lists, the list needs to be included in the request as well.
         :param bool include_regional_settings: Extracts the site's regional settings.
         """
+        from office365.sharepoint.sitescripts.types import SiteScriptSerializationInfo, SiteScriptSerializationResult
+        from office365.sharepoint.sitescripts.utility import SiteScriptUtility
         result = ClientResult(self.context, SiteScriptSerializationResult())
         info = SiteScriptSerializationInfo(include_branding, included_lists, include_links_to_exported_items,
                                            include_regional_settings)
@@ -95,6 +50,7 @@ class Web(SecurableObject):
         return result
 
     def consent_to_power_platform(self):
+        from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
         return_type = FlowSynchronizationResult(self.context)
         qry = ServiceOperationQuery(self, "ConsentToPowerPlatform", None, None, None, return_type)
         self.context.add_query(qry)
@@ -106,6 +62,7 @@ class Web(SecurableObject):
 
         :param str device_app_instance_id: Device application instance identifier.
         """
+        from office365.sharepoint.pushnotifications.subscriber import PushNotificationSubscriber
         return_type = PushNotificationSubscriber(self.context)
         qry = ServiceOperationQuery(self, "GetPushNotificationSubscriber", [device_app_instance_id], None,
                                     None, return_type)
@@ -119,6 +76,7 @@ class Web(SecurableObject):
 
         :param list components: array of requested components, defined by id and version.
         """
+        from office365.sharepoint.clientsidecomponent.identifier import SPClientSideComponentIdentifier
         return_type = ClientResult(self.context, ClientValueCollection(SPClientSideComponentIdentifier))
         payload = {
             "components": components
@@ -134,6 +92,9 @@ class Web(SecurableObject):
 
         :param str or User user_or_username:
         """
+        from office365.sharepoint.base_entity_collection import BaseEntityCollection
+        from office365.sharepoint.principal.user import User
+        from office365.sharepoint.pushnotifications.subscriber import PushNotificationSubscriber
         return_type = BaseEntityCollection(self.context, PushNotificationSubscriber)
 
         if isinstance(user_or_username, User):
@@ -194,6 +155,7 @@ class Web(SecurableObject):
 
         :type context: office365.sharepoint.client_context.ClientContext
         """
+        from office365.sharepoint.webs.context_web_information import ContextWebInformation
         result = ClientResult(context, ContextWebInformation())
         qry = ServiceOperationQuery(context.web, "GetContextWebInformation", None, None, None, result)
         qry.static = True
@@ -238,12 +200,14 @@ class Web(SecurableObject):
         return self
 
     def create_group_based_environment(self):
+        from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
         return_type = FlowSynchronizationResult(self.context)
         qry = ServiceOperationQuery(self, "CreateGroupBasedEnvironment", None, None, None, return_type)
         self.context.add_query(qry)
         return return_type
 
     def get_group_based_environment(self):
+        from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
         return_type = FlowSynchronizationResult(self.context)
         qry = ServiceOperationQuery(self, "GetGroupBasedEnvironment", None, None, None, return_type)
         self.context.add_query(qry)
@@ -253,6 +217,7 @@ class Web(SecurableObject):
         """
         :param str target_web_url:
         """
+        from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
         return_type = FlowSynchronizationResult(self.context)
         payload = {"targetWebUrl": target_web_url}
         qry = ServiceOperationQuery(self, "SyncFlowInstances", None, payload, None, return_type)
@@ -263,6 +228,7 @@ class Web(SecurableObject):
         """
         :param str category:
         """
+        from office365.sharepoint.flows.synchronization_result import FlowSynchronizationResult
         return_type = FlowSynchronizationResult(self.context)
         payload = {"category": category}
         qry = ServiceOperationQuery(self, "SyncFlowTemplates", None, payload, None, return_type)
@@ -281,6 +247,7 @@ class Web(SecurableObject):
         :param bool include_errors: If true, webparts with errors MUST be included in the results of the request.
            If false, webparts with errors MUST be excluded in the results of the request.
         """
+        from office365.sharepoint.clientsidecomponent.query_result import SPClientSideComponentQueryResult
         return_type = ClientResult(self.context, ClientValueCollection(SPClientSideComponentQueryResult))
         params = {
             "includeErrors": include_errors,
@@ -306,6 +273,7 @@ class Web(SecurableObject):
 
         :type query: office365.sharepoint.webs.subweb_query.SubwebQuery
         """
+        from office365.sharepoint.webs.information_collection import WebInformationCollection
         users = WebInformationCollection(self.context)
         qry = ServiceOperationQuery(self, "getSubWebsFilteredForCurrentUser", {
             "nWebTemplateFilter": query.WebTemplateFilter,
@@ -324,6 +292,7 @@ class Web(SecurableObject):
         :param int order_by: the column by which to order the Recycle Bin query.
         :param int item_state: Recycle Bin stage of items to return in the query.
         """
+        from office365.sharepoint.recyclebin.item_collection import RecycleBinItemCollection
         result = RecycleBinItemCollection(self.context)
         payload = {
             "rowLimit": row_limit,
@@ -367,6 +336,8 @@ class Web(SecurableObject):
 
         :param str decoded_url: Contains the site-relative path for a list, for example, /Lists/Announcements.
         """
+        from office365.sharepoint.lists.list import List
+        from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
         safe_decoded_url = self.context.create_safe_url(decoded_url)
         return_type = List(self.context)
         self.lists.add_child(return_type)
@@ -382,6 +353,7 @@ class Web(SecurableObject):
         :param bool allow_create: Indicates whether to create the list if it does not exist on this web.
             "true" means yes.
         """
+        from office365.sharepoint.lists.list import List
         return_type = List(self.context)
         self.lists.add_child(return_type)
         payload = {"allowCreate": allow_create}
@@ -394,6 +366,7 @@ class Web(SecurableObject):
 
         :param str list_url: Contains either an absolute URL or a site-relative URL of a view.
         """
+        from office365.sharepoint.views.view import View
         return View(self.context, ServiceOperationPath("GetViewFromUrl", [list_url], self.resource_path))
 
     def get_view_from_path(self, decoded_url):
@@ -401,6 +374,7 @@ class Web(SecurableObject):
 
         :param str decoded_url: Contains either an absolute path or a site-relative path of a view.
         """
+        from office365.sharepoint.views.view import View
         return View(self.context, ServiceOperationPath("GetViewFromPath", [decoded_url], self.resource_path))
 
     def get_regional_datetime_schema(self):
@@ -417,6 +391,7 @@ class Web(SecurableObject):
 
         :param str link_url: A URL that is either a tokenized sharing link or a canonical URL for a document
         """
+        from office365.sharepoint.sharing.sharing_link_data import SharingLinkData
         return_type = ClientResult(self.context, SharingLinkData())
         payload = {"linkUrl": link_url}
         qry = ServiceOperationQuery(self, "GetSharingLinkData", None, payload, None, return_type)
@@ -473,6 +448,7 @@ class Web(SecurableObject):
         :param bool use_simplified_roles: A Boolean value indicating whether to use the SharePoint
         simplified roles (Edit, View) or not.
         """
+        from office365.sharepoint.sharing.object_sharing_settings import ObjectSharingSettings
         return_type = ObjectSharingSettings(context)
         payload = {
             "objectUrl": object_url,
@@ -488,6 +464,7 @@ class Web(SecurableObject):
         """Returns the file object located at the specified server-relative URL.
         :type url: str
         """
+        from office365.sharepoint.files.file import File
         return File(self.context, ServiceOperationPath("getFileByServerRelativeUrl", [url], self.resource_path))
 
     def get_file_by_server_relative_path(self, url_or_path):
@@ -496,6 +473,8 @@ class Web(SecurableObject):
 
         :type url_or_path: str or SPResPath
         """
+        from office365.sharepoint.files.file import File
+        from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
         path = url_or_path if isinstance(url_or_path, SPResPath) else SPResPath(url_or_path)
         return File(self.context,
                     ServiceOperationPath("getFileByServerRelativePath", path.to_json(), self.resource_path))
@@ -505,6 +484,7 @@ class Web(SecurableObject):
 
         :type url: str
         """
+        from office365.sharepoint.folders.folder import Folder
         return Folder(self.context, ServiceOperationPath("getFolderByServerRelativeUrl", [url], self.resource_path))
 
     def get_folder_by_server_relative_path(self, decoded_url):
@@ -513,6 +493,8 @@ class Web(SecurableObject):
 
         :type decoded_url: str
         """
+        from office365.sharepoint.folders.folder import Folder
+        from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
         path = SPResPath(decoded_url)
         return Folder(self.context,
                       ServiceOperationPath("getFolderByServerRelativePath", path.to_json(), self.resource_path))
@@ -531,6 +513,7 @@ class Web(SecurableObject):
 
         :param str login_name: Specifies a string that contains the login name.
         """
+        from office365.sharepoint.principal.user import User
         return_type = User(self.context)
         self.site_users.add_child(return_type)
         qry = ServiceOperationQuery(self, "EnsureUser", [login_name], None, None, return_type)
@@ -542,6 +525,7 @@ class Web(SecurableObject):
 
         :param str user_name: Specifies the user login name.
         """
+        from office365.sharepoint.permissions.base_permissions import BasePermissions
         result = ClientResult(self.context, BasePermissions())
         qry = ServiceOperationQuery(self, "GetUserEffectivePermissions", [user_name], None, None, result)
         self.context.add_query(qry)
@@ -576,6 +560,7 @@ class Web(SecurableObject):
 
         :param str unique_id: A GUID that identifies the folder.
         """
+        from office365.sharepoint.folders.folder import Folder
         return Folder(self.context, ServiceOperationPath("GetFolderById", [unique_id], self.resource_path))
 
     def get_user_by_id(self, user_id):
@@ -583,10 +568,12 @@ class Web(SecurableObject):
 
         :param int user_id: Specifies the member identifier.
         """
+        from office365.sharepoint.principal.user import User
         return User(self.context, ServiceOperationPath("getUserById", [user_id], self.resource_path))
 
     def default_document_library(self):
         """Retrieves the default document library."""
+        from office365.sharepoint.lists.list import List
         return List(self.context, ServiceOperationPath("defaultDocumentLibrary", None, self.resource_path))
 
     def get_list(self, path):
@@ -594,6 +581,7 @@ class Web(SecurableObject):
 
         :type path: str
         """
+        from office365.sharepoint.lists.list import List
         safe_path = self.context.create_safe_url(path)
         return List(self.context, ServiceOperationPath("getList", [safe_path], self.resource_path))
 
@@ -603,11 +591,23 @@ class Web(SecurableObject):
 
         :param office365.sharepoint.changes.query.ChangeQuery query: Specifies which changes to return
         """
+        from office365.sharepoint.changes.collection import ChangeCollection
         changes = ChangeCollection(self.context)
         qry = ServiceOperationQuery(self, "getChanges", None, query, "query", changes)
         self.context.add_query(qry)
         return changes
 
+    def get_change_feed(self, query=None, token_store=None, **kwargs):
+        """Returns the incremental synchronization of the change log, the last processed change token is kept
+        in the token store.
+
+        :param office365.sharepoint.changes.query.ChangeQuery query: Specifies which changes to return
+        :param office365.runtime.state_store.StateStore token_store: Keeps the last processed token
+        :rtype: office365.sharepoint.changes.feed.ChangeFeed
+        """
+        from office365.sharepoint.changes.feed import ChangeFeed
+        return ChangeFeed(self, query, token_store, **kwargs)
+
     def get_available_web_templates(self, lcid=1033, do_include_cross_language=False):
         """
         Returns a collection of site templates available for the site.
@@ -616,6 +616,7 @@ class Web(SecurableObject):
         :param bool do_include_cross_language: Specifies whether to include language-neutral site templates.
         :return:
         """
+        from office365.sharepoint.webs.template_collection import WebTemplateCollection
         params = {
             "lcid": lcid,
             "doIncludeCrossLanguage": do_include_cross_language
@@ -665,6 +666,7 @@ class Web(SecurableObject):
         Specifies the collection of custom list templates for a given site.
 
         """
+        from office365.sharepoint.lists.template_collection import ListTemplateCollection
         return_type = ListTemplateCollection(self.context)
         qry = ServiceOperationQuery(self, "GetCustomListTemplates", None, None, None, return_type)
         self.context.add_query(qry)
@@ -676,6 +678,7 @@ class Web(SecurableObject):
 
         :param str guest_url: The guest access URL to get the file with.
         """
+        from office365.sharepoint.files.file import File
         return_type = File(self.context)
         payload = {"guestUrl": guest_url}
         qry = ServiceOperationQuery(self, "GetFileByGuestUrl", None, payload, None, return_type)
@@ -689,6 +692,7 @@ class Web(SecurableObject):
         :param str linking_url: The linking URL to return the file object for.
             A linking URL can be obtained from LinkingUrl.
         """
+        from office365.sharepoint.files.file import File
         return_type = File(self.context)
         payload = {"linkingUrl": linking_url}
         qry = ServiceOperationQuery(self, "GetFileByLinkingUrl", None, payload, None, return_type)
@@ -701,6 +705,7 @@ class Web(SecurableObject):
 
         :param str wopi_frame_url:  The WOPI frame URL used to get the file object.
         """
+        from office365.sharepoint.files.file import File
         return_type = File(self.context)
         qry = ServiceOperationQuery(self, "GetFileByWOPIFrameUrl", [wopi_frame_url], None, None, return_type)
         self.context.add_query(qry)
@@ -712,6 +717,7 @@ class Web(SecurableObject):
 
         :param str guest_url: The tokenized sharing link URL for the folder.
         """
+        from office365.sharepoint.files.file import File
         return_type = File(self.context)
         qry = ServiceOperationQuery(self, "GetFolderByGuestUrl", [guest_url], None, None, return_type)
         self.context.add_query(qry)
@@ -750,6 +756,9 @@ class Web(SecurableObject):
         :param str email_body: The email subject.
         :rtype: SharingResult
         """
+        from office365.sharepoint.sharing.sharing_result import SharingResult
+        from office365.sharepoint.ui.applicationpages.peoplepicker.web_service_interface import (
+            ClientPeoplePickerWebServiceInterface)
         return_type = SharingResult(self.context)
 
         def _picker_value_resolved(resp, picker_result, group):
@@ -781,6 +790,7 @@ class Web(SecurableObject):
 
         :rtype: SharingResult
         """
+        from office365.sharepoint.sharing.sharing_result import SharingResult
         return_type = SharingResult(self.context)
 
         def _web_initialized():
@@ -800,6 +810,7 @@ class Web(SecurableObject):
         :param office365.sharepoint.client_context.ClientContext context: SharePoint context
         :param str web_full_url: The URL of the web.
         """
+        from office365.sharepoint.lists.document_library_information import DocumentLibraryInformation
         result = ClientResult(context, ClientValueCollection(DocumentLibraryInformation))
         payload = {
             "webFullUrl": web_full_url
@@ -817,6 +828,7 @@ class Web(SecurableObject):
         :param office365.sharepoint.client_context.ClientContext context: SharePoint context
         :param str web_url:  URL of the web.
         """
+        from office365.sharepoint.lists.document_library_information import DocumentLibraryInformation
         result = ClientResult(context, DocumentLibraryInformation())
         payload = {
             "webUrl": web_url,
@@ -854,6 +866,7 @@ class Web(SecurableObject):
         :param str web_full_url:  URL of the web.
         :param bool include_page_libraries: Indicates whether to include page libraries. A value of "true" means yes.
         """
+        from office365.sharepoint.lists.document_library_information import DocumentLibraryInformation
         result = ClientResult(context, ClientValueCollection(DocumentLibraryInformation))
         payload = {
             "webFullUrl": web_full_url,
@@ -895,6 +908,7 @@ class Web(SecurableObject):
         :param str email_subject: The email subject.
         :param str email_body: The email subject.
         """
+        from office365.sharepoint.sharing.sharing_result import SharingResult
         result = SharingResult(context)
         payload = {
             "url": url,
@@ -933,6 +947,7 @@ class Web(SecurableObject):
         (Edit, View) or not.
         :param SharingResult or None return_type: Return type
         """
+        from office365.sharepoint.sharing.sharing_result import SharingResult
         if return_type is None:
             return_type = SharingResult(context)
         payload = {
@@ -961,6 +976,7 @@ class Web(SecurableObject):
         :param str url: A SharingResult object which contains status codes pertaining to the completion of the operation
         :param SharingResult return_type: Return type
         """
+        from office365.sharepoint.sharing.sharing_result import SharingResult
         if return_type is None:
             return_type = SharingResult(context)
         payload = {
@@ -976,6 +992,7 @@ class Web(SecurableObject):
 
         :param str unique_id: A GUID that identifies the file object.
         """
+        from office365.sharepoint.files.file import File
         return File(self.context, ServiceOperationPath("GetFileById", [unique_id], self.resource_path))
 
     def get_list_item(self, str_url):
@@ -986,6 +1003,7 @@ class Web(SecurableObject):
         for example, "/sites/MySite/Shared Documents/MyDocument.docx".
         :return: ListItem
         """
+        from office365.sharepoint.listitems.listitem import ListItem
         return ListItem(self.context, ServiceOperationPath("GetListItem", [str_url], self.resource_path))
 
     def get_list_item_using_path(self, decoded_url):
@@ -996,6 +1014,8 @@ class Web(SecurableObject):
         for example, "/sites/MySite/Shared Documents/MyDocument.docx".
         :return: ListItem
         """
+        from office365.sharepoint.listitems.listitem import ListItem
+        from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
         path = SPResPath(self.context.create_safe_url(decoded_url))
         return ListItem(self.context,
                         ServiceOperationPath("GetListItemUsingPath", path, self.resource_path))
@@ -1005,6 +1025,7 @@ class Web(SecurableObject):
 
         :param int type_catalog: The type of the gallery.
         """
+        from office365.sharepoint.lists.list import List
         return List(self.context, ServiceOperationPath("getCatalog", [type_catalog], self.resource_path))
 
     def page_context_info(self, include_odb_settings, emit_navigation_info):
@@ -1029,6 +1050,7 @@ class Web(SecurableObject):
 
         :param str key: ID of storage entity to be returned.
         """
+        from office365.sharepoint.clientsidecomponent.storage_entity import StorageEntity
         return_type = StorageEntity(self.context)
         params = {
             "key": key,
@@ -1071,6 +1093,8 @@ class Web(SecurableObject):
 
     @property
     def activities(self):
+        from office365.sharepoint.activities.entity import SPActivityEntity
+        from office365.sharepoint.base_entity_collection import BaseEntityCollection
         return self.properties.get("Activities",
                                    BaseEntityCollection(self.context, SPActivityEntity,
                                                         ResourcePath("Activities", self.resource_path)))
@@ -1096,6 +1120,7 @@ class Web(SecurableObject):
         """
         Gets a user object that represents the user who created the Web site.
         """
+        from office365.sharepoint.principal.user import User
         return self.properties.get("Author", User(self.context, ResourcePath("Author", self.resource_path)))
 
     @property
@@ -1125,6 +1150,7 @@ class Web(SecurableObject):
 
     @property
     def access_requests_list(self):
+        from office365.sharepoint.lists.list import List
         return self.properties.get('AccessRequestsList',
                                    List(self.context, ResourcePath("AccessRequestsList", self.resource_path)))
 
@@ -1145,12 +1171,14 @@ class Web(SecurableObject):
     @property
     def folders(self):
         """Get folder resources"""
+        from office365.sharepoint.folders.collection import FolderCollection
         return self.properties.get('Folders',
                                    FolderCollection(self.context, ResourcePath("folders", self.resource_path), self))
 
     @property
     def lists(self):
         """Get web list collection"""
+        from office365.sharepoint.lists.collection import ListCollection
         return self.properties.get('Lists',
                                    ListCollection(self.context, ResourcePath("lists", self.resource_path)))
 
@@ -1159,18 +1187,21 @@ class Web(SecurableObject):
         """
         Specifies the collection of users in the site collection that contains the site
         """
+        from office365.sharepoint.principal.user_collection import UserCollection
         return self.properties.get('SiteUsers',
                                    UserCollection(self.context, ResourcePath("siteUsers", self.resource_path)))
 
     @property
     def site_groups(self):
         """Gets the collection of groups for the site collection."""
+        from office365.sharepoint.principal.group_collection import GroupCollection
         return self.properties.get('SiteGroups',
                                    GroupCollection(self.context, ResourcePath("siteGroups", self.resource_path)))
 
     @property
     def current_user(self):
         """Gets the current user."""
+        from office365.sharepoint.principal.user import User
         return self.properties.get('CurrentUser',
                                    User(self.context, ResourcePath("CurrentUser", self.resource_path)))
 
@@ -1183,30 +1214,35 @@ class Web(SecurableObject):
     @property
     def associated_visitor_group(self):
         """Gets or sets the associated visitor group of the Web site."""
+        from office365.sharepoint.principal.group import Group
         return self.properties.get('AssociatedVisitorGroup',
                                    Group(self.context, ResourcePath("AssociatedVisitorGroup", self.resource_path)))
 
     @property
     def associated_owner_group(self):
         """Gets or sets the associated owner group of the Web site."""
+        from office365.sharepoint.principal.group import Group
         return self.properties.get('AssociatedOwnerGroup',
                                    Group(self.context, ResourcePath("AssociatedOwnerGroup", self.resource_path)))
 
     @property
     def associated_member_group(self):
         """Gets or sets the group of users who have been given contribute permissions to the Web site."""
+        from office365.sharepoint.principal.group import Group
         return self.properties.get('AssociatedMemberGroup',
                                    Group(self.context, ResourcePath("AssociatedMemberGroup", self.resource_path)))
 
     @property
     def fields(self):
         """Specifies the collection of all the fields (2) in the site (2)."""
+        from office365.sharepoint.fields.collection import FieldCollection
         return self.properties.get('Fields',
                                    FieldCollection(self.context, ResourcePath("Fields", self.resource_path)))
 
     @property
     def content_types(self):
         """Gets the collection of content types for the Web site."""
+        from office365.sharepoint.contenttypes.collection import ContentTypeCollection
         return self.properties.get('ContentTypes',
                                    ContentTypeCollection(self.context,
                                                          ResourcePath("ContentTypes", self.resource_path), self))
@@ -1214,6 +1250,7 @@ class Web(SecurableObject):
     @property
     def role_definitions(self):
         """Gets the collection of role definitions for the Web site."""
+        from office365.sharepoint.permissions.roles.definitions.collection import RoleDefinitionCollection
         return self.properties.get("RoleDefinitions",
                                    RoleDefinitionCollection(self.context,
                                                             ResourcePath("RoleDefinitions", self.resource_path)))
@@ -1221,6 +1258,7 @@ class Web(SecurableObject):
     @property
     def event_receivers(self):
         """Specifies the collection of event receiver definitions that are currently available on the Web site"""
+        from office365.sharepoint.eventreceivers.definition_collection import EventReceiverDefinitionCollection
         return self.properties.get('EventReceivers',
                                    EventReceiverDefinitionCollection(self.context,
                                                                      ResourcePath("eventReceivers", self.resource_path),
@@ -1232,6 +1270,7 @@ class Web(SecurableObject):
         Gets a collection of the ClientWebParts installed in this SP.Web. It can be used to get metadata of the
         ClientWebParts or render them. It is a read-only collection as ClientWebParts need to be installed in
         an app package."""
+        from office365.sharepoint.webparts.client.collection import ClientWebPartCollection
         return self.properties.get('ClientWebParts',
                                    ClientWebPartCollection(self.context,
                                                            ResourcePath("ClientWebParts", self.resource_path)))
@@ -1239,6 +1278,7 @@ class Web(SecurableObject):
     @property
     def tenant_app_catalog(self):
         """Returns the tenant app catalog for the given tenant if it exists."""
+        from office365.sharepoint.marketplace.tenant.appcatalog.accessor import TenantCorporateCatalogAccessor
         return self.properties.get('TenantAppCatalog',
                                    TenantCorporateCatalogAccessor(self.context,
                                                                   ResourcePath("TenantAppCatalog", self.resource_path)))
@@ -1246,6 +1286,8 @@ class Web(SecurableObject):
     @property
     def site_collection_app_catalog(self):
         """Returns the site collection app catalog for the given web if it exists."""
+        from office365.sharepoint.marketplace.sitecollection.appcatalog.accessor import (
+            SiteCollectionCorporateCatalogAccessor)
         return self.properties.get('SiteCollectionAppCatalog',
                                    SiteCollectionCorporateCatalogAccessor(self.context,
                                                                           ResourcePath("SiteCollectionAppCatalog",
@@ -1254,6 +1296,7 @@ class Web(SecurableObject):
     @property
     def web_infos(self):
         """Specifies the collection of all child sites for the site"""
+        from office365.sharepoint.webs.information_collection import WebInformationCollection
         return self.properties.get('WebInfos',
                                    WebInformationCollection(self.context, ResourcePath("WebInfos", self.resource_path)))
 
@@ -1293,6 +1336,7 @@ class Web(SecurableObject):
     def list_templates(self):
         """Gets a value that specifies the collection of list definitions and list templates available for creating
             lists on the site."""
+        from office365.sharepoint.lists.template_collection import ListTemplateCollection
         return self.properties.get('ListTemplates',
                                    ListTemplateCollection(self.context,
                                                           ResourcePath("ListTemplates", self.resource_path)))
@@ -1318,6 +1362,7 @@ class Web(SecurableObject):
     def multilingual_settings(self):
         """Gets a value that specifies the collection of list definitions and list templates available for creating
             lists on the site."""
+        from office365.sharepoint.webs.multilingual_settings import MultilingualSettings
         return self.properties.get('MultilingualSettings',
                                    MultilingualSettings(self.context,
                                                         ResourcePath("MultilingualSettings", self.resource_path)))
@@ -1333,12 +1378,14 @@ class Web(SecurableObject):
     @property
     def regional_settings(self):
         """Gets the regional settings that are currently implemented on the website."""
+        from office365.sharepoint.webs.regional_settings import RegionalSettings
         return self.properties.get('RegionalSettings',
                                    RegionalSettings(self.context, ResourcePath("RegionalSettings", self.resource_path)))
 
     @property
     def recycle_bin(self):
         """Specifies the collection of Recycle Bin items of the Recycle Bin of the site"""
+        from office365.sharepoint.recyclebin.item_collection import RecycleBinItemCollection
         return self.properties.get('RecycleBin',
                                    RecycleBinItemCollection(self.context,
                                                             ResourcePath("RecycleBin", self.resource_path)))
@@ -1346,6 +1393,7 @@ class Web(SecurableObject):
     @property
     def navigation(self):
         """Specifies the navigation structure on the site (2), including the Quick Launch area and the link bar."""
+        from office365.sharepoint.navigation.navigation import Navigation
         return self.properties.get('Navigation',
                                    Navigation(self.context,
                                               ResourcePath("Navigation", self.resource_path)))
@@ -1353,6 +1401,8 @@ class Web(SecurableObject):
     @property
     def push_notification_subscribers(self):
         """Specifies the collection of push notification subscribers for the site"""
+        from office365.sharepoint.base_entity_collection import BaseEntityCollection
+        from office365.sharepoint.pushnotifications.subscriber import PushNotificationSubscriber
         return self.properties.get('PushNotificationSubscribers',
                                    BaseEntityCollection(self.context, PushNotificationSubscriber,
                                                         ResourcePath("PushNotificationSubscribers",
@@ -1361,11 +1411,13 @@ class Web(SecurableObject):
     @property
     def root_folder(self):
         """Get a root folder"""
+        from office365.sharepoint.folders.folder import Folder
         return self.properties.get("RootFolder", Folder(self.context, ResourcePath("RootFolder", self.resource_path)))
 
     @property
     def alerts(self):
         """Gets the collection of alerts for the site or subsite."""
+        from office365.sharepoint.alerts.collection import AlertCollection
         return self.properties.get('Alerts',
                                    AlertCollection(self.context,
                                                    ResourcePath("Alerts", self.resource_path)))
@@ -1376,6 +1428,7 @@ class Web(SecurableObject):
         Specifies the collection of all fields available for the current scope, including those of the
         current site, as well as any parent sites.
         """
+        from office365.sharepoint.fields.collection import FieldCollection
         return self.properties.get('AvailableFields',
                                    FieldCollection(self.context, ResourcePath("AvailableFields", self.resource_path)))
 
@@ -1385,6 +1438,7 @@ class Web(SecurableObject):
         Specifies the collection of all site content types that apply to the current scope,
         including those of the current site (2), as well as any parent sites.
         """
+        from office365.sharepoint.contenttypes.collection import ContentTypeCollection
         return self.properties.get('AvailableContentTypes',
                                    ContentTypeCollection(self.context, ResourcePath("AvailableContentTypes",
                                                                                     self.resource_path)))
@@ -1394,6 +1448,7 @@ class Web(SecurableObject):
         """
         Specifies the user information list for the site collection that contains the site
         """
+        from office365.sharepoint.lists.list import List
         return self.properties.get('SiteUserInfoList',
                                    List(self.context, ResourcePath("SiteUserInfoList", self.resource_path)))
 
@@ -1431,6 +1486,7 @@ class Web(SecurableObject):
     @property
     def user_custom_actions(self):
         """Specifies the collection of user custom actions for the site"""
+        from office365.sharepoint.usercustomactions.collection import UserCustomActionCollection
         return self.properties.get('UserCustomActions',
                                    UserCustomActionCollection(self.context,
                                                               ResourcePath("UserCustomActions", self.resource_path)))
@@ -1440,6 +1496,7 @@ class Web(SecurableObject):
         """
         Gets the server-relative Path of the Web.
         """
+        from office365.sharepoint.types.resource_path import ResourcePath as SPResPath
         return self.properties.get("ServerRelativePath", SPResPath())
 
     def get_property(self, name, default_value=None):
@@ -21,7 +21,8 @@ setup(
     url="https://github.com/vgrem/Office365-REST-Python-Client",
     install_requires=['requests', 'msal', 'pytz'],
     extras_require={
-        'NtlmProvider': ["requests_ntlm"]
+        'NtlmProvider': ["requests_ntlm"],
+        'OpenTelemetry': ["opentelemetry-api"]
     },
     tests_require=['pytest', 'adal'],
     test_suite='tests',
@@ -46,6 +47,7 @@ setup(
     ],
     packages=setuptools.find_packages(exclude=['tests', 'tests.*',
                                                'generator', 'generator.*',
+                                               'benchmarks', 'benchmarks.*',
                                                'examples', 'examples.*']),
     package_data={
         'office365': ["runtime/auth/providers/templates/SAML.xml", "runtime/auth/providers/templates/RST2.xml",
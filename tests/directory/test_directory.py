@@ -19,3 +19,9 @@ class TestDirectory(GraphTestCase):
     def test4_get_member_objects(self):
         result = self.client.me.get_member_objects().execute_query()
         self.assertIsInstance(result.value, ClientValueCollection)
+
+    def test5_resolve_directory_object_types(self):
+        client = self.client.clone()
+        client.enable_type_resolution()
+        result = client.directory_objects.top(10).get().execute_query()
+        self.assertIn("User", [type(o).__name__ for o in result])
@@ -53,3 +53,8 @@ class TestGraphUser(GraphTestCase):
         changed_users = self.client.users.delta.get().execute_query()
         self.assertGreater(len(changed_users), 0)
 
+    def test9_track_user_changes(self):
+        sync = self.client.users.track_changes()
+        changed_users = list(sync)
+        self.assertGreater(len(changed_users), 0)
+        self.assertIsNotNone(sync.delta_link)
@@ -25,3 +25,11 @@ class TestAttachments(GraphTestCase):
         attachment_item = AttachmentItem(attachment_type=AttachmentType.file, name="flower", size=3483322)
         result = self.client.me.messages[message_id].attachments.create_upload_session(attachment_item).execute_query()
         self.assertIsNotNone(result.value)
+
+    def test2_add_binary_file_attachment(self):
+        content = bytes(bytearray(range(256)))
+        message = self.client.me.messages.add(subject="Binary attachment")
+        message.add_file_attachment("data.bin", content, "application/octet-stream").execute_query()
+        attachments = message.attachments.get().execute_query()
+        self.assertEqual(len(attachments), 1)
+        message.delete_object().execute_query()
@@ -6,6 +6,8 @@ from tests.graph_case import GraphTestCase
 
 from office365.onedrive.drives.drive import Drive
 from office365.onedrive.driveitems.driveItem import DriveItem
+from office365.onedrive.driveitems.drive_item_uploadable_properties import DriveItemUploadableProperties
+from office365.onedrive.internal.quick_xor_hash import QuickXorHash
 
 
 def create_list_drive(client):
@@ -117,3 +119,21 @@ class TestDriveItem(GraphTestCase):
     def test_15_delete_file(self):
         items = self.target_drive.root.children.top(2).get().execute_query()
         items[1].delete_object().execute_query()
+
+    def test_16_resume_upload_file_session(self):
+        file_name = "SharePoint User Guide.docx"
+        local_path = "{0}/../data/{1}".format(os.path.dirname(__file__), file_name)
+        item = DriveItemUploadableProperties()
+        item.name = file_name
+        session = self.target_drive.root.get_by_path(file_name).create_upload_session(item).execute_query()
+        target_file = self.target_drive.root.resume_upload(local_path, session.value.uploadUrl,
+                                                           chunk_size=1024 * 1024).get().execute_query()
+        self.assertIsNotNone(target_file.web_url)
+
+    def test_17_upload_file_with_hash_verification(self):
+        file_name = "SharePoint User Guide.docx"
+        local_path = "{0}/../data/{1}".format(os.path.dirname(__file__), file_name)
+        hash_object = QuickXorHash()
+        target_file = self.target_drive.root.resumable_upload(local_path, chunk_size=1024 * 1024,
+                                                              hash_object=hash_object).get().execute_query()
+        self.assertEqual(target_file.file.hashes.get("quickXorHash"), hash_object.base64digest())
@@ -24,3 +24,13 @@ class TestSearchOneDrive(GraphTestCase):
     #    result = self.client.search.query_events("Jon Doe").execute_query()
     #    self.assertIsNotNone(result.value)
 
+    def test4_search_files_all_pages(self):
+        hits = list(self.client.search.query_all("Guide", entity_types=[EntityType.driveItem], page_size=5,
+                                                 max_results=12))
+        self.assertLessEqual(len(hits), 12)
+
+    def test5_search_concurrently(self):
+        reader = self.client.search.query_concurrently("Jon Doe", [EntityType.message, EntityType.driveItem],
+                                                       max_results=10)
+        hits = list(reader)
+        self.assertLessEqual(len(hits), 20)
@@ -21,3 +21,12 @@ class TestChange(SPTestCase):
         query = ChangeLogItemQuery(row_limit=100)
         result = target_list.get_list_item_changes_since_token(query).execute_query()
         self.assertIsNotNone(result.value)
+
+    def test_4_sync_list_changes(self):
+        target_list = self.client.site.root_web.default_document_library()
+        feed = target_list.get_change_feed(start_from_current=True)
+        self.assertEqual(feed.sync(lambda deltas: None), 0)
+        self.assertIsNotNone(feed.last_token)
+        deltas = []
+        feed.sync(deltas.extend)
+        self.assertIsNotNone(feed.last_token)
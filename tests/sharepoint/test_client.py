@@ -2,6 +2,8 @@ from unittest import TestCase
 
 from office365.runtime.auth.authentication_context import AuthenticationContext
 from office365.runtime.client_value_collection import ClientValueCollection
+from office365.runtime.instrumentation.aggregator import MetricsAggregator
+from office365.runtime.instrumentation.query_metrics import get_url_template
 from office365.runtime.odata.type import ODataType
 from office365.runtime.odata.query_options import QueryOptions
 from office365.runtime.types.collections import StringCollection, GuidCollection
@@ -14,6 +16,7 @@ from office365.runtime.auth.providers.acs_token_provider import ACSTokenProvider
 from office365.runtime.auth.providers.saml_token_provider import SamlTokenProvider
 from office365.runtime.http.request_options import RequestOptions
 from office365.sharepoint.client_context import ClientContext
+from office365.sharepoint.client_context_factory import ClientContextFactory
 
 
 class TestSharePointClient(TestCase):
@@ -147,3 +150,59 @@ class TestSharePointClient(TestCase):
         client.execute_query()
         self.assertIsNotNone(me.login_name)
         self.assertIsNotNone(lib.title)
+
+    def test_17_collect_query_metrics(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        aggregator = MetricsAggregator()
+        client.queryExecuted += aggregator.add
+        client.web.get()
+        client.web.lists.get()
+        client.execute_batch()
+        stats = aggregator.stats
+        self.assertEqual(sum(s.count for s in stats), 3)
+        self.assertEqual(sum(s.failed for s in stats), 0)
+
+    def test_18_get_url_template(self):
+        url = "https://contoso.sharepoint.com/_api/web/lists/GetByTitle('Documents')/items(5)?$select=Title"
+        self.assertEqual(get_url_template(url, "https://contoso.sharepoint.com/_api"),
+                         "/web/lists/GetByTitle(?)/items(?)")
+
+    def test_19_profile_queries(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        profiler = client.enable_profiling()
+        client.web.lists.get().execute_query()
+        self.assertIn("Collection(SP.List)", profiler.stats)
+        self.assertGreater(profiler.stats["Collection(SP.List)"]["network"], 0)
+        self.assertIsNotNone(profiler.report())
+
+    def test_20_share_form_digest(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        client.ensure_form_digest(RequestOptions(client.service_root_url()))
+        cloned_client = client.clone(test_site_url)
+        self.assertIs(cloned_client.form_digest_cache, client.form_digest_cache)
+        self.assertEqual(cloned_client.context_info.FormDigestValue, client.context_info.FormDigestValue)
+
+    def test_21_create_site_contexts(self):
+        factory = ClientContextFactory().with_credentials(test_user_credentials)
+        site_ctx = factory.create(test_site_url)
+        team_site_ctx = factory.create(test_team_site_url)
+        self.assertIs(site_ctx.session, team_site_ctx.session)
+        site_ctx.web.get().execute_query()
+        team_site_ctx.web.get().execute_query()
+        self.assertNotEqual(site_ctx.web.url, team_site_ctx.web.url)
+        factory.close()
+
+    def test_22_read_entity_from_response_cache(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        client.enable_response_cache()
+        web = client.web.get().execute_query()
+        cached_web = client.clone(test_site_url).web.get().execute_query()
+        self.assertEqual(web.title, cached_web.title)
+
+    def test_23_invalidate_response_cache_on_update(self):
+        client = ClientContext(test_site_url).with_credentials(test_user_credentials)
+        cache = client.enable_response_cache()
+        lib = client.web.default_document_library().get().execute_query()
+        self.assertEqual(len(cache._items), 1)
+        lib.set_property("Description", lib.properties.get("Description")).update().execute_query()
+        self.assertEqual(len(cache._items), 0)
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from random import randint
 
 from tests import create_unique_name
@@ -5,6 +7,7 @@ from tests.sharepoint.sharepoint_case import SPTestCase
 
 from office365.sharepoint.changes.collection import ChangeCollection
 from office365.sharepoint.folders.folder import Folder
+from office365.sharepoint.folders.transfer_manager import FolderTransferManager
 from office365.sharepoint.lists.list import List
 from office365.sharepoint.lists.creation_information import ListCreationInformation
 from office365.sharepoint.lists.template_type import ListTemplateType
@@ -141,3 +144,29 @@ class TestSharePointFolder(SPTestCase):
             .get().execute_query()
         self.assertIsNotNone(folder.resource_path)
         self.assertIsNotNone(folder.unique_id)
+
+    def test_18_upload_and_download_folder(self):
+        local_path = os.path.join(os.path.dirname(__file__), "..", "data")
+        manager = FolderTransferManager(self.client, max_workers=2)
+        target_folder = self.__class__.target_list.root_folder
+        result = manager.upload(local_path, target_folder)
+        self.assertEqual(result.failed_files, 0)
+        self.assertGreater(result.transferred_files, 0)
+
+        result = manager.upload(local_path, target_folder)
+        self.assertEqual(result.skipped_files, result.total_files)
+
+        download_path = tempfile.mkdtemp()
+        result = manager.download(target_folder, download_path)
+        self.assertEqual(result.failed_files, 0)
+        self.assertEqual(result.transferred_files, result.total_files)
+
+    def test_19_walk_folder_tree(self):
+        target_folder = self.__class__.target_list.root_folder
+        items = list(target_folder.walk(max_workers=2, batch_size=2))
+        self.assertGreater(len(items), 0)
+        depths = [path.count("/") for path, _ in items]
+        self.assertEqual(depths, sorted(depths))
+
+        top_items = list(target_folder.walk(max_depth=1))
+        self.assertTrue(all("/" not in path for path, _ in top_items))
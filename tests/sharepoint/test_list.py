@@ -108,25 +108,33 @@ class TestSPList(SPTestCase):
         changes = self.__class__.target_list.get_changes().execute_query()
         self.assertGreater(len(changes), 0)
 
+    def test_15_get_list_schema(self):
+        schema = self.client.schema_cache.get(self.__class__.target_list)
+        self.assertEqual(schema.get_field("Title").internal_name, "Title")
+        self.assertIs(self.client.schema_cache.get(self.__class__.target_list, refresh=True), schema)
+
+        result = self.__class__.target_list.write_items([{"Title": "Task"}], resolve_field_names=True)
+        self.assertEqual(result.succeeded_rows, 1)
+
     # def test_15_get_checked_out_files(self):
     #    result = self.__class__.target_list.get_checked_out_files().execute_query()
     #    self.assertIsNotNone(result.resource_path)
 
-    def test_15_delete_list(self):
+    def test_16_delete_list(self):
         list_title = self.target_list_title + "_updated"
         self.client.web.lists.get_by_title(list_title).delete_object().execute_query()
 
         result = self.client.web.lists.filter("Title eq '{0}'".format(list_title)).get().execute_query()
         self.assertEqual(len(result), 0)
 
-    def test_16_get_list_using_path(self):
+    def test_17_get_list_using_path(self):
         pages_list = self.client.web.get_list_using_path("SitePages").execute_query()
         self.assertIsNotNone(pages_list.resource_path)
 
-    def test_17_ensure_events_list(self):
+    def test_18_ensure_events_list(self):
         events_list = self.client.web.lists.ensure_events_list().execute_query()
         self.assertIsNotNone(events_list.resource_path)
 
-    def test_18_get_list_by_server_relative_url(self):
+    def test_19_get_list_by_server_relative_url(self):
         pages_list = self.client.web.get_list("SitePages").get().execute_query()
         self.assertIsNotNone(pages_list.resource_path)
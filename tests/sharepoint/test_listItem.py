@@ -4,7 +4,9 @@ from time import sleep
 from office365.sharepoint.types.wopi_action import SPWOPIAction
 from tests import create_unique_name
 from tests.sharepoint.sharepoint_case import SPTestCase
+from office365.sharepoint.listitems.caml.expressions import Eq
 from office365.sharepoint.listitems.caml.query import CamlQuery
+from office365.sharepoint.listitems.caml.query_builder import CamlQueryBuilder
 from office365.sharepoint.listitems.listitem import ListItem
 from office365.sharepoint.lists.list import List
 from office365.sharepoint.lists.creation_information import ListCreationInformation
@@ -93,6 +95,13 @@ class TestSharePointListItem(SPTestCase):
         item_to_update = self.__class__.target_item
         item_to_update.update_overwrite_version().execute_query()
 
+    def test_10_get_list_item_via_caml_builder(self):
+        item_id = self.__class__.target_item.id
+        builder = CamlQueryBuilder().where(Eq("ID", item_id, "Counter")).view_fields("ID", "Title")
+        self.assertEqual(builder.check_indexes(self.target_list), [])
+        result = self.target_list.get_items(builder.build()).execute_query()
+        self.assertEqual(len(result), 1)
+
     def test_11_get_versions(self):
         versions = self.__class__.target_item.versions.get().execute_query()
         self.assertIsNotNone(versions.resource_path)
@@ -141,7 +150,33 @@ class TestSharePointListItem(SPTestCase):
         self.client.execute_query()
         self.assertLessEqual(len(items), 2)
 
-    def test_19_delete_multiple_items(self):
+    def test_19_get_items_paged(self):
+        items = list(self.target_list.get_items_paged(page_size=1))
+        self.assertEqual(len(items), self.batch_items_count)
+
+    def test_20_read_all_items(self):
+        items = list(self.target_list.read_all_items(window_size=2, page_size=1, max_workers=2))
+        self.assertEqual(len(items), self.batch_items_count)
+        self.assertEqual([item.id for item in items], sorted(item.id for item in items))
+
+    def test_21_stream_list_data(self):
+        rows = list(self.target_list.stream_list_data(view_fields=["ID", "Title"], page_size=1))
+        self.assertEqual(len(rows), self.batch_items_count)
+        self.assertEqual(set(rows[0].keys()), {"ID", "Title"})
+
+    def test_22_write_items(self):
+        items = self.target_list.items.select(["Id"]).get().execute_query()
+        rows = [{"Id": item.id, "Title": "Task (updated)"} for item in items]
+        result = self.target_list.write_items(rows, batch_size=2)
+        self.assertEqual(result.failed_rows, 0)
+        self.assertEqual(result.succeeded_rows, len(rows))
+
+        rows = [{"Title": "Task A"}, {"Id": 1000000, "Title": "Missing"}, {"Title": "Task B"}]
+        result = self.target_list.write_items(rows)
+        self.assertEqual(list(result.errors.keys()), [1])
+        self.assertEqual(result.succeeded_rows, 2)
+
+    def test_23_delete_multiple_items(self):
         items = self.target_list.items.get().execute_query()  # get existing items
         self.assertGreater(len(items), 0)
         for item in items:
@@ -58,6 +58,13 @@ class TestSearch(TestCase):
         result = settings.get_query_configuration().execute_query()
         self.assertIsNotNone(result.value)
 
+    def test9_stream_search_results(self):
+        request = SearchRequest("IsDocument:1", select_properties=["Title", "Path"])
+        hits = [hit for hit, _ in zip(self.search.stream_results(request, page_size=10), range(25))]
+        self.assertLessEqual(len(hits), 25)
+        for hit in hits:
+            self.assertEqual(set(hit.keys()), {"Title", "Path"})
+
     #def test7_get_crawled_urls(self):
     #    doc_crawl_log = DocumentCrawlLog(self.client)
     #    result = doc_crawl_log.get_crawled_urls().execute_query()
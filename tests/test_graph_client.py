@@ -1,6 +1,7 @@
 import uuid
 
 from office365.onedrive.internal.paths.url import UrlPath
+from office365.runtime.odata.model_registry import ODataModelRegistry
 from office365.runtime.paths.resource_path import ResourcePath
 from tests import test_team_site_url
 from tests.graph_case import GraphTestCase
@@ -85,3 +86,7 @@ class TestGraphClient(GraphTestCase):
         name = self.client.me.joined_teams.entity_type_name
         self.assertEqual("Collection(microsoft.graph.team)", name)
 
+    def test_16_resolve_client_type(self):
+        registry = ODataModelRegistry()
+        client_type = registry.get_client_type("microsoft.graph.fileAttachment")
+        self.assertEqual("microsoft.graph.fileAttachment", client_type(self.client).entity_type_name)